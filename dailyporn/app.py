@@ -11,18 +11,29 @@ from .bus import EventBus
 from .config import DailyPornConfig
 from .repositories.subscriptions import SubscriptionRepository
 from .repositories.recommendation_history import RecommendationHistoryRepository
-from .services.http import HttpService
+from .services.candidate_pools import CandidatePoolCache
+from .services.delivery import DeliveryService
+from .services.detail_stats import DetailStatsCache
+from .services.disk_cache import DiskCacheManager
+from .services.http import ConnectorPolicy, HttpService
+from .services.http_cache import HttpResponseCache
 from .services.images import ImageService
+from .services.parse_executor import ParseExecutor
 from .services.render import RenderService
 from .services.recommendation import RecommendationService
 from .services.report import ReportService
 from .services.scheduler import SchedulerService
+from .services.source_health import SourceHealthTracker
 from .sources.registry import SourceRegistry
 
 HtmlRenderFn = Callable[..., Awaitable[Any]]
 
 
 class DailyPornApp:
+    # How often the cover and render directories are checked against their
+    # size and age budgets.
+    _CACHE_SWEEP_INTERVAL_SEC = 600
+
     def __init__(
         self,
         *,
@@ -33,25 +44,113 @@ class DailyPornApp:
     ):
         self.cfg = DailyPornConfig.from_mapping(raw_config)
         self.bus = EventBus()
-        self.http = HttpService(timeout_sec=30)
+        cache_dir = Path(get_astrbot_data_path()) / "plugin_data" / plugin_name / "cache"
+        self.http_cache = (
+            DiskCacheManager(
+                cache_dir / "http",
+                name="http",
+                max_bytes=self.cfg.http_cache_max_mb * 1024 * 1024,
+                max_age_sec=self.cfg.http_cache_max_age_days * 86400,
+            )
+            if self.cfg.http_cache_enabled
+            else None
+        )
+        self.http = HttpService(
+            timeout_sec=30,
+            policy=ConnectorPolicy(
+                limit=self.cfg.http_max_connections,
+                limit_per_host=self.cfg.http_max_connections_per_host,
+                keepalive_timeout_sec=self.cfg.http_keepalive_sec,
+                dns_cache_ttl_sec=self.cfg.http_dns_cache_ttl_sec,
+            ),
+            max_body_bytes=self.cfg.http_max_body_kb * 1024,
+            cache=(
+                HttpResponseCache(self.http_cache.root, manager=self.http_cache)
+                if self.http_cache is not None
+                else None
+            ),
+        )
 
         self.subscriptions = SubscriptionRepository(plugin_name=plugin_name)
-        self.sources = SourceRegistry(self.http, self.cfg)
+        self.parser = ParseExecutor(
+            mode=self.cfg.parse_executor, max_workers=self.cfg.parse_workers
+        )
+        self.health = SourceHealthTracker(
+            failure_threshold=self.cfg.source_failure_threshold,
+            cooldown_sec=self.cfg.source_cooldown_min * 60,
+        )
+        self.detail_stats = (
+            DetailStatsCache(
+                cache_dir if self.cfg.detail_stats_persist else None,
+                max_entries=self.cfg.detail_stats_cache_size,
+            )
+            if self.cfg.detail_stats_cache_size
+            else None
+        )
+        self.sources = SourceRegistry(
+            self.http,
+            self.cfg,
+            parser=self.parser,
+            health=self.health,
+            pools=(
+                CandidatePoolCache(
+                    cache_dir / "pools",
+                    ttl_sec=self.cfg.candidate_pool_ttl_hours * 3600,
+                )
+                if self.cfg.candidate_pool_ttl_hours
+                else None
+            ),
+            stats=self.detail_stats,
+        )
         self.recommendation_history = RecommendationHistoryRepository(
             plugin_name=plugin_name
         )
-        self.recommendations = RecommendationService(
-            self.cfg, self.sources, history=self.recommendation_history
+        self.image_executor = ParseExecutor(
+            mode=self.cfg.image_executor,
+            max_workers=self.cfg.image_workers,
+            name="image",
+        )
+        self.cover_cache = DiskCacheManager(
+            cache_dir / "covers",
+            name="cover",
+            max_bytes=self.cfg.cover_cache_max_mb * 1024 * 1024,
+            max_age_sec=self.cfg.cover_cache_max_age_days * 86400,
+        )
+        self.cover_raw_cache = DiskCacheManager(
+            cache_dir / "covers" / "raw",
+            name="cover-raw",
+            max_bytes=self.cfg.cover_cache_max_mb * 1024 * 1024,
+            max_age_sec=self.cfg.cover_cache_max_age_days * 86400,
         )
         self.images = ImageService(
-            plugin_name=plugin_name, cfg=self.cfg, http=self.http
+            plugin_name=plugin_name,
+            cfg=self.cfg,
+            http=self.http,
+            executor=self.image_executor,
+            cache=self.cover_cache,
+            raw_cache=self.cover_raw_cache,
+            # Only the local renderer crops covers into a known box; the remote
+            # renderer and plain delivery get the full-resolution image.
+            cover_size=(
+                RenderService.cover_size()
+                if self.cfg.render_backend == "local"
+                and self.cfg.delivery_mode == "html_image"
+                else None
+            ),
+        )
+        self.recommendations = RecommendationService(
+            self.cfg,
+            self.sources,
+            history=self.recommendation_history,
+            prefetch_covers=self.images.prefetch,
+            health=self.health,
         )
-        render_dir = (
-            Path(get_astrbot_data_path())
-            / "plugin_data"
-            / plugin_name
-            / "cache"
-            / "renders"
+        render_dir = cache_dir / "renders"
+        self.render_cache = DiskCacheManager(
+            render_dir,
+            name="render",
+            max_bytes=self.cfg.render_cache_max_mb * 1024 * 1024,
+            max_age_sec=self.cfg.render_cache_max_age_hours * 3600,
         )
         self.renderer = RenderService(
             cfg=self.cfg,
@@ -59,6 +158,13 @@ class DailyPornApp:
             html_render=html_render,
             templates_dir=Path(__file__).resolve().parents[1] / "templates",
             render_dir=render_dir,
+            render_cache=self.render_cache,
+        )
+        self.delivery = DeliveryService(
+            context=context,
+            concurrency=self.cfg.delivery_concurrency,
+            rate_per_min=self.cfg.delivery_rate_per_min,
+            max_retries=self.cfg.delivery_max_retries,
         )
         self.report = ReportService(
             context=context,
@@ -68,6 +174,7 @@ class DailyPornApp:
             recommendations=self.recommendations,
             images=self.images,
             renderer=self.renderer,
+            delivery=self.delivery,
         )
         self.scheduler = SchedulerService(cfg=self.cfg, bus=self.bus)
 
@@ -82,7 +189,21 @@ class DailyPornApp:
         await self.http.start()
         self.report.register()
         self.scheduler.start()
+        for cache in self._disk_caches():
+            cache.start(self._CACHE_SWEEP_INTERVAL_SEC)
+
+    def _disk_caches(self) -> tuple[DiskCacheManager, ...]:
+        caches = (self.cover_cache, self.cover_raw_cache, self.render_cache)
+        if self.http_cache is not None:
+            caches += (self.http_cache,)
+        return caches
 
     async def stop(self) -> None:
         await self.scheduler.stop()
+        await self.report.stop()
+        for cache in self._disk_caches():
+            await cache.stop()
+        await self.recommendations.close()
         await self.http.close()
+        self.parser.close()
+        self.image_executor.close()
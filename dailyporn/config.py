@@ -7,6 +7,7 @@ from typing import Any, Mapping
 @dataclass(frozen=True)
 class DailyPornConfig:
     trigger_time: str
+    prewarm_lead_min: int
     mosaic_level: int
     proxy: str
     delivery_mode: str
@@ -20,11 +21,50 @@ class DailyPornConfig:
     render_timeout_ms: int
     recommendation_cooldown_days: int
     recommendation_initial_penalty_pct: int
+    delivery_concurrency: int
+    delivery_rate_per_min: int
+    delivery_max_retries: int
+    section_cache_soft_ttl_sec: int
+    section_cache_hard_ttl_sec: int
+    section_cache_max_entries: int
+    section_deadline_sec: int
+    section_deadline_refill: bool
+    source_fetch_concurrency: int
+    source_failure_threshold: int
+    source_cooldown_min: int
+    candidate_pool_ttl_hours: int
+    detail_stats_cache_size: int
+    detail_stats_persist: bool
+    cover_prefetch_workers: int
+    cover_cache_max_mb: int
+    cover_cache_max_age_days: int
+    render_cache_max_mb: int
+    render_cache_max_age_hours: int
+    http_max_connections: int
+    http_max_connections_per_host: int
+    http_keepalive_sec: int
+    http_dns_cache_ttl_sec: int
+    http_max_body_kb: int
+    http_cache_enabled: bool
+    http_cache_max_mb: int
+    http_cache_max_age_days: int
+    fetch_hedge_delay_ms: int
+    parse_executor: str
+    parse_workers: int
+    image_executor: str
+    image_workers: int
+    html_parser_backend: str
     sources: Mapping[str, Any]
 
     @classmethod
     def from_mapping(cls, raw: Mapping[str, Any]) -> "DailyPornConfig":
         trigger_time = str(raw.get("trigger_time", "09:00")).strip() or "09:00"
+        try:
+            prewarm_lead_min = int(raw.get("prewarm_lead_min", 10))
+        except Exception:
+            prewarm_lead_min = 10
+        prewarm_lead_min = max(0, min(180, prewarm_lead_min))
+
         try:
             mosaic_level = int(raw.get("mosaic_level", 60))
         except Exception:
@@ -85,6 +125,195 @@ class DailyPornConfig:
             penalty_pct = 70
         recommendation_initial_penalty_pct = max(0, min(100, penalty_pct))
 
+        try:
+            delivery_concurrency = int(raw.get("delivery_concurrency", 4))
+        except Exception:
+            delivery_concurrency = 4
+        delivery_concurrency = max(1, min(64, delivery_concurrency))
+
+        try:
+            delivery_rate_per_min = int(raw.get("delivery_rate_per_min", 0))
+        except Exception:
+            delivery_rate_per_min = 0
+        delivery_rate_per_min = max(0, min(600, delivery_rate_per_min))
+
+        try:
+            delivery_max_retries = int(raw.get("delivery_max_retries", 2))
+        except Exception:
+            delivery_max_retries = 2
+        delivery_max_retries = max(0, min(5, delivery_max_retries))
+
+        try:
+            soft_ttl = int(raw.get("section_cache_soft_ttl_sec", 600))
+        except Exception:
+            soft_ttl = 600
+        section_cache_soft_ttl_sec = max(0, min(86400, soft_ttl))
+
+        try:
+            hard_ttl = int(raw.get("section_cache_hard_ttl_sec", 3600))
+        except Exception:
+            hard_ttl = 3600
+        section_cache_hard_ttl_sec = max(
+            section_cache_soft_ttl_sec, min(7 * 86400, hard_ttl)
+        )
+
+        try:
+            max_entries = int(raw.get("section_cache_max_entries", 32))
+        except Exception:
+            max_entries = 32
+        section_cache_max_entries = max(1, min(1024, max_entries))
+
+        try:
+            section_deadline_sec = int(raw.get("section_deadline_sec", 20))
+        except Exception:
+            section_deadline_sec = 20
+        section_deadline_sec = max(0, min(300, section_deadline_sec))
+
+        section_deadline_refill = bool(raw.get("section_deadline_refill", True))
+
+        try:
+            source_fetch_concurrency = int(raw.get("source_fetch_concurrency", 32))
+        except Exception:
+            source_fetch_concurrency = 32
+        source_fetch_concurrency = max(1, min(64, source_fetch_concurrency))
+
+        try:
+            source_failure_threshold = int(raw.get("source_failure_threshold", 3))
+        except Exception:
+            source_failure_threshold = 3
+        source_failure_threshold = max(0, min(20, source_failure_threshold))
+
+        try:
+            source_cooldown_min = int(raw.get("source_cooldown_min", 30))
+        except Exception:
+            source_cooldown_min = 30
+        source_cooldown_min = max(1, min(1440, source_cooldown_min))
+
+        try:
+            candidate_pool_ttl_hours = int(raw.get("candidate_pool_ttl_hours", 24))
+        except Exception:
+            candidate_pool_ttl_hours = 24
+        candidate_pool_ttl_hours = max(0, min(168, candidate_pool_ttl_hours))
+
+        try:
+            detail_stats_cache_size = int(raw.get("detail_stats_cache_size", 5000))
+        except Exception:
+            detail_stats_cache_size = 5000
+        detail_stats_cache_size = max(0, min(100000, detail_stats_cache_size))
+        detail_stats_persist = bool(raw.get("detail_stats_persist", True))
+
+        try:
+            cover_prefetch_workers = int(raw.get("cover_prefetch_workers", 4))
+        except Exception:
+            cover_prefetch_workers = 4
+        cover_prefetch_workers = max(1, min(16, cover_prefetch_workers))
+
+        try:
+            cover_cache_max_mb = int(raw.get("cover_cache_max_mb", 512))
+        except Exception:
+            cover_cache_max_mb = 512
+        cover_cache_max_mb = max(0, min(102400, cover_cache_max_mb))
+
+        try:
+            cover_cache_max_age_days = int(raw.get("cover_cache_max_age_days", 30))
+        except Exception:
+            cover_cache_max_age_days = 30
+        cover_cache_max_age_days = max(0, min(3650, cover_cache_max_age_days))
+
+        try:
+            render_cache_max_mb = int(raw.get("render_cache_max_mb", 128))
+        except Exception:
+            render_cache_max_mb = 128
+        render_cache_max_mb = max(0, min(102400, render_cache_max_mb))
+
+        try:
+            render_cache_max_age_hours = int(raw.get("render_cache_max_age_hours", 24))
+        except Exception:
+            render_cache_max_age_hours = 24
+        render_cache_max_age_hours = max(0, min(8760, render_cache_max_age_hours))
+
+        try:
+            http_max_connections = int(raw.get("http_max_connections", 100))
+        except Exception:
+            http_max_connections = 100
+        http_max_connections = max(1, min(1000, http_max_connections))
+
+        try:
+            http_max_connections_per_host = int(
+                raw.get("http_max_connections_per_host", 8)
+            )
+        except Exception:
+            http_max_connections_per_host = 8
+        http_max_connections_per_host = max(
+            1, min(http_max_connections, http_max_connections_per_host)
+        )
+
+        try:
+            http_keepalive_sec = int(raw.get("http_keepalive_sec", 30))
+        except Exception:
+            http_keepalive_sec = 30
+        http_keepalive_sec = max(0, min(600, http_keepalive_sec))
+
+        try:
+            http_dns_cache_ttl_sec = int(raw.get("http_dns_cache_ttl_sec", 300))
+        except Exception:
+            http_dns_cache_ttl_sec = 300
+        http_dns_cache_ttl_sec = max(0, min(86400, http_dns_cache_ttl_sec))
+
+        try:
+            http_max_body_kb = int(raw.get("http_max_body_kb", 16384))
+        except Exception:
+            http_max_body_kb = 16384
+        http_max_body_kb = max(0, min(1024 * 1024, http_max_body_kb))
+
+        http_cache_enabled = bool(raw.get("http_cache_enabled", False))
+
+        try:
+            http_cache_max_mb = int(raw.get("http_cache_max_mb", 256))
+        except Exception:
+            http_cache_max_mb = 256
+        http_cache_max_mb = max(0, min(102400, http_cache_max_mb))
+
+        try:
+            http_cache_max_age_days = int(raw.get("http_cache_max_age_days", 7))
+        except Exception:
+            http_cache_max_age_days = 7
+        http_cache_max_age_days = max(0, min(3650, http_cache_max_age_days))
+
+        try:
+            fetch_hedge_delay_ms = int(raw.get("fetch_hedge_delay_ms", 3000))
+        except Exception:
+            fetch_hedge_delay_ms = 3000
+        fetch_hedge_delay_ms = max(0, min(30000, fetch_hedge_delay_ms))
+
+        parse_executor = (
+            str(raw.get("parse_executor", "thread") or "thread").strip().lower()
+        )
+        if parse_executor not in {"thread", "process"}:
+            parse_executor = "thread"
+        try:
+            parse_workers = int(raw.get("parse_workers", 2))
+        except Exception:
+            parse_workers = 2
+        parse_workers = max(1, min(16, parse_workers))
+
+        image_executor = (
+            str(raw.get("image_executor", "thread") or "thread").strip().lower()
+        )
+        if image_executor not in {"thread", "process"}:
+            image_executor = "thread"
+        try:
+            image_workers = int(raw.get("image_workers", 2))
+        except Exception:
+            image_workers = 2
+        image_workers = max(1, min(16, image_workers))
+
+        html_parser_backend = (
+            str(raw.get("html_parser_backend", "auto") or "auto").strip().lower()
+        )
+        if html_parser_backend not in {"auto", "lxml", "html.parser"}:
+            html_parser_backend = "auto"
+
         sources = (
             raw.get("sources", {})
             if isinstance(raw.get("sources", {}), Mapping)
@@ -93,6 +322,7 @@ class DailyPornConfig:
 
         return cls(
             trigger_time=trigger_time,
+            prewarm_lead_min=prewarm_lead_min,
             mosaic_level=mosaic_level,
             proxy=proxy,
             delivery_mode=delivery_mode,
@@ -106,6 +336,39 @@ class DailyPornConfig:
             render_backend=render_backend,
             recommendation_cooldown_days=recommendation_cooldown_days,
             recommendation_initial_penalty_pct=recommendation_initial_penalty_pct,
+            delivery_concurrency=delivery_concurrency,
+            delivery_rate_per_min=delivery_rate_per_min,
+            delivery_max_retries=delivery_max_retries,
+            section_cache_soft_ttl_sec=section_cache_soft_ttl_sec,
+            section_cache_hard_ttl_sec=section_cache_hard_ttl_sec,
+            section_cache_max_entries=section_cache_max_entries,
+            section_deadline_sec=section_deadline_sec,
+            section_deadline_refill=section_deadline_refill,
+            source_fetch_concurrency=source_fetch_concurrency,
+            source_failure_threshold=source_failure_threshold,
+            source_cooldown_min=source_cooldown_min,
+            candidate_pool_ttl_hours=candidate_pool_ttl_hours,
+            detail_stats_cache_size=detail_stats_cache_size,
+            detail_stats_persist=detail_stats_persist,
+            cover_prefetch_workers=cover_prefetch_workers,
+            cover_cache_max_mb=cover_cache_max_mb,
+            cover_cache_max_age_days=cover_cache_max_age_days,
+            render_cache_max_mb=render_cache_max_mb,
+            render_cache_max_age_hours=render_cache_max_age_hours,
+            http_max_connections=http_max_connections,
+            http_max_connections_per_host=http_max_connections_per_host,
+            http_keepalive_sec=http_keepalive_sec,
+            http_dns_cache_ttl_sec=http_dns_cache_ttl_sec,
+            http_max_body_kb=http_max_body_kb,
+            http_cache_enabled=http_cache_enabled,
+            http_cache_max_mb=http_cache_max_mb,
+            http_cache_max_age_days=http_cache_max_age_days,
+            fetch_hedge_delay_ms=fetch_hedge_delay_ms,
+            parse_executor=parse_executor,
+            parse_workers=parse_workers,
+            image_executor=image_executor,
+            image_workers=image_workers,
+            html_parser_backend=html_parser_backend,
             sources=sources,
         )
 
@@ -10,3 +10,8 @@ class DailyReportRequested:
     reason: str
     target_sessions: Optional[list[str]] = None
     requested_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class DailyReportPrewarmRequested:
+    scheduled_for: datetime
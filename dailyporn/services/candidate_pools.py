@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from astrbot.api import logger
+
+from ..models import HotItem
+
+
+@dataclass(frozen=True)
+class CandidatePool:
+    period: str
+    stored_at: float
+    items: tuple[HotItem, ...]
+
+
+class CandidatePoolCache:
+    """Per-source candidate pools for sources that sample from a ranking.
+
+    A pool is keyed by the ranking period it was built from (e.g.
+    `best/2026-10`), so it is rebuilt as soon as the period rolls over, and in
+    any case once it is older than `ttl_sec`. Sources fold anything else that
+    shapes the pool (such as the scrape limit) into that key. Each source
+    keeps its `max_pools` most recent pools, in memory and in
+    `<cache_dir>/<source_id>.json`, which is read once so pools survive
+    restarts.
+    """
+
+    def __init__(
+        self, cache_dir: Path, *, ttl_sec: float = 24 * 3600, max_pools: int = 4
+    ):
+        self._cache_dir = Path(cache_dir)
+        self._ttl_sec = float(ttl_sec)
+        self._max_pools = max(1, int(max_pools))
+        # source_id -> period -> pool, oldest first.
+        self._pools: dict[str, dict[str, CandidatePool]] = {}
+        # Writes of one source's file share its tmp name.
+        self._write_lock = asyncio.Lock()
+
+    async def get(self, source_id: str, period: str) -> Optional[list[HotItem]]:
+        pools = await self._source_pools(source_id)
+        pool = pools.get(period)
+        if pool is None or time.time() - pool.stored_at >= self._ttl_sec:
+            return None
+        return list(pool.items)
+
+    async def put(self, source_id: str, period: str, items: list[HotItem]) -> None:
+        pools = await self._source_pools(source_id)
+        now = time.time()
+        for key in [k for k, v in pools.items() if now - v.stored_at >= self._ttl_sec]:
+            del pools[key]
+        pools.pop(period, None)
+        pools[period] = CandidatePool(period=period, stored_at=now, items=tuple(items))
+        while len(pools) > self._max_pools:
+            del pools[next(iter(pools))]
+        async with self._write_lock:
+            await self._write(source_id, list(pools.values()))
+
+    async def _source_pools(self, source_id: str) -> dict[str, CandidatePool]:
+        pools = self._pools.get(source_id)
+        if pools is None:
+            # A missing or unreadable file still counts as loaded.
+            loaded = await self._read(source_id)
+            pools = self._pools.setdefault(
+                source_id, {pool.period: pool for pool in loaded}
+            )
+        return pools
+
+    def _path(self, source_id: str) -> Path:
+        return self._cache_dir / f"{source_id}.json"
+
+    async def _read(self, source_id: str) -> list[CandidatePool]:
+        path = self._path(source_id)
+
+        def _sync() -> list[CandidatePool]:
+            try:
+                if not path.exists():
+                    return []
+                with path.open("r", encoding="utf-8") as f:
+                    obj = json.load(f)
+                pools = [
+                    CandidatePool(
+                        period=str(p["period"]),
+                        stored_at=float(p["stored_at"]),
+                        items=tuple(HotItem(**it) for it in p["items"]),
+                    )
+                    for p in obj["pools"]
+                ]
+                return sorted(pools, key=lambda p: p.stored_at)
+            except Exception:
+                logger.warning(f"[dailyporn] candidate pool read failed: {path}")
+                return []
+
+        return await asyncio.to_thread(_sync)
+
+    async def _write(self, source_id: str, pools: list[CandidatePool]) -> None:
+        path = self._path(source_id)
+        data = {
+            "pools": [
+                {
+                    "period": pool.period,
+                    "stored_at": pool.stored_at,
+                    "items": [asdict(it) for it in pool.items],
+                }
+                for pool in pools
+            ]
+        }
+
+        def _sync() -> None:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                with tmp.open("w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                tmp.replace(path)
+            except Exception:
+                logger.warning(f"[dailyporn] candidate pool write failed: {path}")
+
+        await asyncio.to_thread(_sync)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable
+
+from astrbot.api import logger
+from astrbot.api.event import MessageChain
+from astrbot.api.star import Context
+
+from ..utils.token_bucket import TokenBucket
+
+
+@dataclass
+class SessionDeliveryStats:
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    last_latency_ms: float = 0.0
+    last_error: str = ""
+
+
+class DeliveryService:
+    """Rate-limited, retrying wrapper around `Context.send_message`.
+
+    `fan_out` delivers to many sessions with at most `concurrency` sessions in
+    flight; messages for one session stay in order. When `rate_per_min` is set,
+    each platform (the first segment of the session id) gets its own token
+    bucket. Failed sends are retried with exponential backoff, except for
+    malformed session ids which can never succeed.
+    """
+
+    def __init__(
+        self,
+        *,
+        context: Context,
+        concurrency: int = 4,
+        rate_per_min: int = 0,
+        max_retries: int = 2,
+        backoff_sec: float = 1.0,
+    ):
+        self._context = context
+        self._concurrency = max(1, int(concurrency))
+        self._rate_per_min = max(0, int(rate_per_min))
+        self._max_retries = max(0, int(max_retries))
+        self._backoff_sec = max(0.0, float(backoff_sec))
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, SessionDeliveryStats] = {}
+
+    def stats(self) -> dict[str, SessionDeliveryStats]:
+        return dict(self._stats)
+
+    async def send(self, session: str, chain: MessageChain) -> bool:
+        """Send one message; raises the last error once retries are exhausted."""
+
+        stats = self._stats.setdefault(session, SessionDeliveryStats())
+        attempt = 0
+        while True:
+            await self._throttle(session)
+            started = time.monotonic()
+            try:
+                ok = await self._context.send_message(session, chain)
+            except ValueError as e:
+                stats.failed += 1
+                stats.last_error = str(e)
+                raise
+            except Exception as e:
+                if attempt >= self._max_retries:
+                    stats.failed += 1
+                    stats.last_error = str(e)
+                    raise
+                delay = self._backoff_sec * (2**attempt)
+                attempt += 1
+                stats.retries += 1
+                logger.warning(
+                    f"[dailyporn] send to {session} failed ({e}), "
+                    f"retry {attempt}/{self._max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            stats.last_latency_ms = (time.monotonic() - started) * 1000
+            if ok is False:
+                stats.failed += 1
+                stats.last_error = "platform not found"
+            else:
+                stats.sent += 1
+                stats.last_error = ""
+            return ok
+
+    async def fan_out(
+        self, sessions: Iterable[str], deliver: Callable[[str], Awaitable[None]]
+    ) -> None:
+        sessions = list(dict.fromkeys(sessions))
+        if not sessions:
+            return
+
+        sem = asyncio.Semaphore(self._concurrency)
+        failed_before = sum(s.failed for s in self._stats.values())
+        started = time.monotonic()
+
+        async def _one(session: str) -> None:
+            async with sem:
+                try:
+                    await deliver(session)
+                except Exception:
+                    logger.exception(f"[dailyporn] delivery to {session} failed")
+
+        await asyncio.gather(*(_one(s) for s in sessions))
+
+        failed = sum(s.failed for s in self._stats.values()) - failed_before
+        logger.info(
+            f"[dailyporn] delivered to {len(sessions)} sessions in "
+            f"{time.monotonic() - started:.1f}s (failed sends={failed})"
+        )
+
+    async def _throttle(self, session: str) -> None:
+        if self._rate_per_min <= 0:
+            return
+        platform = session.split(":", 1)[0]
+        bucket = self._buckets.get(platform)
+        if bucket is None:
+            bucket = TokenBucket(self._rate_per_min / 60.0)
+            self._buckets[platform] = bucket
+        await bucket.acquire()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from astrbot.api import logger
+
+# Query parameters that never select a different video.
+_TRACKING_PARAMS = ("utm_", "ref", "from", "pkey", "src")
+
+
+def canonical_video_url(url: str) -> str:
+    """Normalize a video URL so list and detail links of one video compare equal.
+
+    Scheme and host are lowercased, a leading `www.` is dropped, the fragment,
+    tracking parameters and a trailing slash are removed, and the remaining
+    query parameters are sorted (PornHub keeps its `viewkey` there).
+    """
+
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port:
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(query), ""))
+
+
+@dataclass(frozen=True)
+class DetailStatsEntry:
+    """What a detail page added on top of the list item it enriched."""
+
+    stored_at: float
+    title: str = ""
+    stars: Optional[int] = None
+    views: Optional[int] = None
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    def is_fresh(self, ttl_sec: float, *, now: float | None = None) -> bool:
+        return ((now or time.time()) - self.stored_at) < ttl_sec
+
+
+class DetailStatsCache:
+    """Bounded LRU of detail-page stats keyed by canonical video URL.
+
+    Freshness is decided by the caller-supplied TTL, so each source can choose
+    how long its counters stay valid. With a `cache_dir` the entries are
+    loaded from `<cache_dir>/detail_stats.json` on first use and written back
+    by `save()` after each enrichment batch, so they survive restarts.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, *, max_entries: int = 5000):
+        self._path = Path(cache_dir) / "detail_stats.json" if cache_dir else None
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, DetailStatsEntry] = OrderedDict()
+        self._loaded = self._path is None
+        self._load_lock = asyncio.Lock()
+        # Enrichment batches finish concurrently; writes share one tmp file.
+        self._save_lock = asyncio.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, url: str, ttl_sec: float) -> Optional[DetailStatsEntry]:
+        await self._ensure_loaded()
+        key = canonical_video_url(url)
+        entry = self._entries.get(key)
+        if entry is None or ttl_sec <= 0 or not entry.is_fresh(ttl_sec):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    async def put(self, url: str, entry: DetailStatsEntry) -> None:
+        await self._ensure_loaded()
+        key = canonical_video_url(url)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    async def save(self) -> None:
+        if self._path is None:
+            return
+        async with self._save_lock:
+            # A save that waited for the lock may find its changes written.
+            if not self._dirty:
+                return
+            self._dirty = False
+            path = self._path
+            data = {key: asdict(entry) for key, entry in self._entries.items()}
+
+            def _sync() -> None:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = path.with_suffix(".tmp")
+                    with tmp.open("w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False)
+                    tmp.replace(path)
+                except Exception:
+                    logger.warning(f"[dailyporn] detail stats write failed: {path}")
+
+            await asyncio.to_thread(_sync)
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            path = self._path
+
+            def _sync() -> dict[str, DetailStatsEntry]:
+                try:
+                    if path is None or not path.exists():
+                        return {}
+                    with path.open("r", encoding="utf-8") as f:
+                        obj = json.load(f)
+                    return {key: DetailStatsEntry(**e) for key, e in obj.items()}
+                except Exception:
+                    logger.warning(f"[dailyporn] detail stats read failed: {path}")
+                    return {}
+
+            loaded = await asyncio.to_thread(_sync)
+            self._entries = OrderedDict(
+                sorted(loaded.items(), key=lambda kv: kv[1].stored_at)
+            )
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._loaded = True
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from astrbot.api import logger
+
+
+@dataclass
+class DiskCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    files: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "files": self.files,
+            "bytes": self.bytes,
+        }
+
+
+@dataclass
+class _Entry:
+    size: int
+    atime: float
+
+
+class DiskCacheManager:
+    """Keeps a cache directory under a size and age budget.
+
+    The directory is listed once, on first use; afterwards an in-memory index
+    ordered by last access is kept up to date by `record_hit` / `add`, so
+    sweeps cost O(evicted files) no matter how long the bot has been running.
+    Accesses are written back as file mtimes during the sweep, which keeps
+    the LRU order across restarts without relying on filesystem atime.
+
+    A sweep evicts files not used for `max_age_sec` and then the least recently
+    used files until the directory fits in `max_bytes`. Either limit may be 0
+    to disable it.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        name: str,
+        max_bytes: int = 0,
+        max_age_sec: float = 0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._root = Path(root)
+        self._name = name
+        self._max_bytes = max(0, int(max_bytes))
+        self._max_age_sec = max(0.0, float(max_age_sec))
+        self._clock = clock
+        # LRU-ordered: accesses move to the end, the front is evicted first.
+        self._index: OrderedDict[str, _Entry] = OrderedDict()
+        self._touched: set[str] = set()
+        self._bytes = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._sweep_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._stats = DiskCacheStats()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def stats(self) -> DiskCacheStats:
+        self._stats.files = len(self._index)
+        self._stats.bytes = self._bytes
+        return DiskCacheStats(**self._stats.as_dict())
+
+    def record_hit(self, path: Path | str) -> None:
+        self._stats.hits += 1
+        entry = self._index.get(Path(path).name)
+        if entry is None:
+            return
+        entry.atime = self._clock()
+        self._index.move_to_end(Path(path).name)
+        self._touched.add(Path(path).name)
+
+    def record_miss(self) -> None:
+        self._stats.misses += 1
+
+    def add(self, path: Path | str, size: int | None = None) -> None:
+        """Register a file just written into the cache directory."""
+
+        path = Path(path)
+        if path.parent != self._root:
+            return
+        if size is None:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                return
+        old = self._index.pop(path.name, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._index[path.name] = _Entry(size=int(size), atime=self._clock())
+        self._bytes += int(size)
+
+    def start(self, interval_sec: float) -> None:
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(max(1.0, float(interval_sec))))
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, interval_sec: float) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception(f"[dailyporn] {self._name} cache sweep failed")
+            await asyncio.sleep(interval_sec)
+
+    async def sweep(self) -> int:
+        """Evict expired and least recently used files; returns how many."""
+
+        await self._ensure_loaded()
+        async with self._sweep_lock:
+            now = self._clock()
+            victims: list[str] = []
+            bytes_after = self._bytes
+            for name, entry in self._index.items():
+                expired = self._max_age_sec and now - entry.atime >= self._max_age_sec
+                oversize = self._max_bytes and bytes_after > self._max_bytes
+                if not (expired or oversize):
+                    # The index is ordered by access time, so nothing after
+                    # this entry is older or needed to get under budget.
+                    break
+                victims.append(name)
+                bytes_after -= entry.size
+
+            for name in victims:
+                entry = self._index.pop(name)
+                self._bytes -= entry.size
+                self._touched.discard(name)
+            touched = {
+                name: self._index[name].atime
+                for name in self._touched
+                if name in self._index
+            }
+            self._touched.clear()
+
+            root = self._root
+
+            def _sync() -> None:
+                for name in victims:
+                    try:
+                        (root / name).unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logger.warning(f"[dailyporn] cache evict failed: {name} ({e})")
+                for name, atime in touched.items():
+                    try:
+                        os.utime(root / name, (atime, atime))
+                    except OSError:
+                        pass
+
+            await asyncio.to_thread(_sync)
+            self._stats.evictions += len(victims)
+            if victims:
+                logger.info(
+                    f"[dailyporn] {self._name} cache evicted {len(victims)} file(s), "
+                    f"{self._bytes / 1024 / 1024:.1f}MB in {len(self._index)} file(s)"
+                )
+            return len(victims)
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            root = self._root
+
+            def _sync() -> list[tuple[str, int, float]]:
+                out: list[tuple[str, int, float]] = []
+                try:
+                    with os.scandir(root) as it:
+                        for entry in it:
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                            out.append((entry.name, st.st_size, st.st_mtime))
+                except FileNotFoundError:
+                    pass
+                return out
+
+            listed = await asyncio.to_thread(_sync)
+            # Files registered before the listing finished are the newest.
+            for name, size, mtime in sorted(listed, key=lambda x: x[2], reverse=True):
+                if name in self._index:
+                    continue
+                self._index[name] = _Entry(size=size, atime=mtime)
+                self._index.move_to_end(name, last=False)
+                self._bytes += size
+            self._loaded = True
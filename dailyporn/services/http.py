@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import base64
+import codecs
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
 from urllib.parse import urlparse
 
 import aiohttp
 from astrbot.api import logger
 
+from ..utils.singleflight import SingleFlight
+from .http_cache import HttpResponseCache
+
 _DEFAULT_HEADERS: dict[str, str] = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept-Language": "en-US,en;q=0.9",
@@ -13,6 +20,16 @@ _DEFAULT_HEADERS: dict[str, str] = {
 }
 
 
+_CHUNK_SIZE = 64 * 1024
+# Characters of already scanned text handed to `until` again with each chunk,
+# so a marker split across two chunks is still seen.
+_UNTIL_OVERLAP = 16 * 1024
+
+# Called with each newly read piece of text (plus the tail of the text before
+# it); returning True stops the download.
+EnoughPredicate = Callable[[str], Any]
+
+
 class HttpStatusError(RuntimeError):
     def __init__(self, status: int, url: str):
         super().__init__(f"HTTP {status}: {url}")
@@ -20,19 +37,152 @@ class HttpStatusError(RuntimeError):
         self.url = url
 
 
+class HttpBodyTooLargeError(RuntimeError):
+    def __init__(self, limit: int, url: str):
+        super().__init__(f"body larger than {limit} bytes: {url}")
+        self.limit = limit
+        self.url = url
+
+
+@dataclass(frozen=True)
+class ConnectorPolicy:
+    """Connection-pool settings applied to every per-proxy session."""
+
+    limit: int = 100
+    limit_per_host: int = 8
+    keepalive_timeout_sec: float = 30.0
+    dns_cache_ttl_sec: int = 300
+
+
+@dataclass
+class PoolStats:
+    """In-flight request counters for one connection pool (one proxy URL)."""
+
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    saturated: int = 0
+    host_in_flight: dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "saturated": self.saturated,
+        }
+
+
 class HttpService:
-    def __init__(self, *, timeout_sec: int = 30):
+    def __init__(
+        self,
+        *,
+        timeout_sec: int = 30,
+        policy: ConnectorPolicy | None = None,
+        cache: HttpResponseCache | None = None,
+        max_body_bytes: int = 0,
+    ):
         self._timeout = aiohttp.ClientTimeout(total=timeout_sec)
-        self._session: aiohttp.ClientSession | None = None
+        # Default cap for every body read; 0 = unlimited.
+        self._max_body_bytes = max(0, int(max_body_bytes))
+        self._policy = policy or ConnectorPolicy()
+        self._cache = cache
+        # One pool per proxy URL ("" = direct), so a slow proxy cannot starve
+        # direct connections and vice versa.
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._stats: dict[str, PoolStats] = {}
+        # Identical GETs issued while one is already in flight share its result.
+        self._inflight_text: SingleFlight[str] = SingleFlight()
+        self._inflight_bytes: SingleFlight[bytes] = SingleFlight()
 
     async def start(self) -> None:
-        if self._session and not self._session.closed:
-            return
-        self._session = aiohttp.ClientSession(timeout=self._timeout, trust_env=False)
+        self._session_for("")
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def pool_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-pool counters keyed by proxy URL ("direct" for no proxy)."""
+
+        return {
+            (proxy or "direct"): stats.as_dict()
+            for proxy, stats in self._stats.items()
+        }
+
+    def _session_for(self, proxy: str) -> aiohttp.ClientSession:
+        key = proxy or ""
+        session = self._sessions.get(key)
+        if session is not None and not session.closed:
+            return session
+
+        policy = self._policy
+        keepalive: dict[str, Any] = (
+            {"keepalive_timeout": float(policy.keepalive_timeout_sec)}
+            if policy.keepalive_timeout_sec > 0
+            else {"force_close": True}
+        )
+        connector = aiohttp.TCPConnector(
+            limit=max(0, int(policy.limit)),
+            limit_per_host=max(0, int(policy.limit_per_host)),
+            use_dns_cache=policy.dns_cache_ttl_sec > 0,
+            ttl_dns_cache=(
+                int(policy.dns_cache_ttl_sec) if policy.dns_cache_ttl_sec > 0 else None
+            ),
+            **keepalive,
+        )
+        session = aiohttp.ClientSession(
+            timeout=self._timeout, trust_env=False, connector=connector
+        )
+        self._sessions[key] = session
+        return session
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        proxy: str,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        key = proxy or ""
+        session = self._session_for(key)
+        stats = self._stats.setdefault(key, PoolStats())
+        host = (urlparse(url).hostname or "").lower()
+
+        host_count = stats.host_in_flight.get(host, 0)
+        policy = self._policy
+        if (policy.limit and stats.in_flight >= policy.limit) or (
+            policy.limit_per_host and host_count >= policy.limit_per_host
+        ):
+            stats.saturated += 1
+            logger.debug(
+                f"[dailyporn] http pool saturated ({key or 'direct'}): "
+                f"in_flight={stats.in_flight} host={host} host_in_flight={host_count}"
+            )
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        stats.host_in_flight[host] = host_count + 1
+        try:
+            async with session.request(
+                method,
+                url,
+                proxy=(proxy or None),
+                headers=headers,
+                allow_redirects=True,
+                **kwargs,
+            ) as resp:
+                yield resp
+        finally:
+            stats.in_flight -= 1
+            remaining = stats.host_in_flight.get(host, 1) - 1
+            if remaining > 0:
+                stats.host_in_flight[host] = remaining
+            else:
+                stats.host_in_flight.pop(host, None)
 
     @staticmethod
     def _merge_headers(headers: dict[str, str] | None) -> dict[str, str]:
@@ -41,35 +191,158 @@ class HttpService:
             merged.update(headers)
         return merged
 
+    @staticmethod
+    def _flight_key(url: str, proxy: str, headers: dict[str, str]) -> tuple:
+        return (url, proxy or "", tuple(sorted(headers.items())))
+
     async def get_text(
-        self, url: str, *, proxy: str = "", headers: dict[str, str] | None = None
+        self,
+        url: str,
+        *,
+        proxy: str = "",
+        headers: dict[str, str] | None = None,
+        cache_ttl: float = 0,
+        max_bytes: int = 0,
+        until: Optional[EnoughPredicate] = None,
     ) -> str:
-        await self.start()
-        assert self._session is not None
-        async with self._session.get(
-            url,
-            proxy=(proxy or None),
-            headers=self._merge_headers(headers),
-            allow_redirects=True,
-        ) as resp:
-            if resp.status != 200:
-                raise HttpStatusError(resp.status, url)
-            return await resp.text()
+        """GET `url` as text.
+
+        With a response cache configured and `cache_ttl` > 0, a stored copy
+        younger than `cache_ttl` seconds is returned without a request; an
+        older one is revalidated with If-None-Match / If-Modified-Since.
+
+        The body is streamed and reading stops after `max_bytes` (default: the
+        service-wide cap) or as soon as `until` is truthy for the newest part
+        of the body; the text read up to that point is returned as the page.
+        A body cut off by `until` is cached as truncated and only served to
+        callers whose `until` accepts it; one cut off by the byte cap is not
+        cached.
+        """
+
+        merged = self._merge_headers(headers)
+        limit = self._body_limit(max_bytes)
+        cache = self._cache if cache_ttl > 0 else None
+
+        async def _fetch() -> str:
+            entry = await cache.load(url, merged) if cache else None
+            if entry is not None and entry.truncated:
+                # A prefix stored for another caller; its validators would
+                # only ever confirm the prefix.
+                if until is None or not until(entry.body):
+                    entry = None
+            if entry is not None and entry.is_fresh(cache_ttl):
+                return entry.body
+
+            req_headers = dict(merged)
+            if entry is not None:
+                req_headers.update(entry.validators())
+            async with self._request(
+                "GET", url, proxy=proxy, headers=req_headers
+            ) as resp:
+                if resp.status == 304 and cache and entry is not None:
+                    await cache.touch(url, merged, entry)
+                    return entry.body
+                if resp.status != 200:
+                    raise HttpStatusError(resp.status, url)
+                text, stop = await self._read_text(resp, limit=limit, until=until)
+                if stop == "limit" and until is None:
+                    logger.warning(
+                        f"[dailyporn] response truncated at {limit} bytes: {url}"
+                    )
+                if cache and stop != "limit":
+                    await cache.store(
+                        url, merged, text, resp.headers, truncated=stop == "until"
+                    )
+                return text
+
+        return await self._inflight_text.run(
+            (*self._flight_key(url, proxy, merged), limit, until), _fetch
+        )
 
     async def get_bytes(
-        self, url: str, *, proxy: str = "", headers: dict[str, str] | None = None
+        self,
+        url: str,
+        *,
+        proxy: str = "",
+        headers: dict[str, str] | None = None,
+        max_bytes: int = 0,
     ) -> bytes:
-        await self.start()
-        assert self._session is not None
-        async with self._session.get(
-            url,
-            proxy=(proxy or None),
-            headers=self._merge_headers(headers),
-            allow_redirects=True,
-        ) as resp:
-            if resp.status != 200:
-                raise HttpStatusError(resp.status, url)
-            return await resp.read()
+        """GET `url` as bytes.
+
+        Raises `HttpBodyTooLargeError` once the body exceeds `max_bytes`
+        (default: the service-wide cap); a truncated binary is useless.
+        """
+
+        merged = self._merge_headers(headers)
+        limit = self._body_limit(max_bytes)
+
+        async def _fetch() -> bytes:
+            async with self._request("GET", url, proxy=proxy, headers=merged) as resp:
+                if resp.status != 200:
+                    raise HttpStatusError(resp.status, url)
+                if not limit:
+                    return await resp.read()
+                if (resp.content_length or 0) > limit:
+                    raise HttpBodyTooLargeError(limit, url)
+                buf = bytearray()
+                async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+                    buf += chunk
+                    if len(buf) > limit:
+                        raise HttpBodyTooLargeError(limit, url)
+                return bytes(buf)
+
+        return await self._inflight_bytes.run(
+            (*self._flight_key(url, proxy, merged), limit), _fetch
+        )
+
+    def _body_limit(self, max_bytes: int) -> int:
+        return max(0, int(max_bytes)) or self._max_body_bytes
+
+    @staticmethod
+    async def _read_text(
+        resp: aiohttp.ClientResponse,
+        *,
+        limit: int,
+        until: Optional[EnoughPredicate],
+    ) -> tuple[str, str]:
+        """Read the body; returns the text and why reading stopped early.
+
+        The reason is "limit" (byte cap), "until" (the caller had enough) or
+        "" when the whole body was read.
+        """
+
+        if not limit and until is None:
+            return await resp.text(), ""
+
+        try:
+            decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")("replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        parts: list[str] = []
+        tail = ""
+        read = 0
+        stop = ""
+        async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+            if limit and read + len(chunk) > limit:
+                parts.append(decoder.decode(chunk[: limit - read], final=True))
+                stop = "limit"
+                break
+            read += len(chunk)
+            piece = decoder.decode(chunk)
+            parts.append(piece)
+            if until is not None:
+                # Only the new text and a short overlap are scanned, so the
+                # cost stays linear in the size of the body.
+                window = tail + piece
+                if until(window):
+                    stop = "until"
+                    break
+                tail = window[-_UNTIL_OVERLAP:]
+        else:
+            parts.append(decoder.decode(b"", final=True))
+        # Leaving the response context with unread data drops the connection
+        # instead of draining the rest of the page.
+        return "".join(parts), stop
 
     async def post_json(
         self,
@@ -79,15 +352,12 @@ class HttpService:
         proxy: str = "",
         headers: dict[str, str] | None = None,
     ) -> dict:
-        await self.start()
-        assert self._session is not None
-        merged_headers = self._merge_headers(headers)
-        async with self._session.post(
+        async with self._request(
+            "POST",
             url,
+            proxy=proxy,
+            headers=self._merge_headers(headers),
             json=json_body,
-            proxy=(proxy or None),
-            headers=merged_headers,
-            allow_redirects=True,
         ) as resp:
             if resp.status != 200:
                 raise HttpStatusError(resp.status, url)
@@ -101,15 +371,12 @@ class HttpService:
         proxy: str = "",
         headers: dict[str, str] | None = None,
     ) -> dict:
-        await self.start()
-        assert self._session is not None
-        merged_headers = self._merge_headers(headers)
-        async with self._session.post(
+        async with self._request(
+            "POST",
             url,
+            proxy=proxy,
+            headers=self._merge_headers(headers),
             data=form,
-            proxy=(proxy or None),
-            headers=merged_headers,
-            allow_redirects=True,
         ) as resp:
             if resp.status != 200:
                 raise HttpStatusError(resp.status, url)
@@ -120,7 +387,12 @@ class HttpService:
                 raise RuntimeError(f"Non-JSON response: {text[:200]}")
 
     async def safe_get_bytes(
-        self, url: str, *, proxy: str = "", headers: dict[str, str] | None = None
+        self,
+        url: str,
+        *,
+        proxy: str = "",
+        headers: dict[str, str] | None = None,
+        max_bytes: int = 0,
     ) -> bytes | None:
         if url.startswith("data:"):
             try:
@@ -141,7 +413,9 @@ class HttpService:
             if "Referer" not in merged_headers:
                 if parsed.scheme and parsed.netloc:
                     merged_headers["Referer"] = f"{parsed.scheme}://{parsed.netloc}/"
-            return await self.get_bytes(url, proxy=proxy, headers=merged_headers)
+            return await self.get_bytes(
+                url, proxy=proxy, headers=merged_headers, max_bytes=max_bytes
+            )
         except Exception as e:
             logger.warning(f"[dailyporn] download failed: {url} ({e})")
             return None
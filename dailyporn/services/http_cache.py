@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Mapping, Optional
+
+from astrbot.api import logger
+
+from .disk_cache import DiskCacheManager
+
+# Request headers that change what a site returns; they are part of the key.
+_VARY_HEADERS = ("Accept", "Accept-Language", "Cookie")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    body: str
+    stored_at: float
+    etag: str = ""
+    last_modified: str = ""
+    # The download stopped early because the caller had what it needed, so
+    # the body is only a prefix of the page.
+    truncated: bool = False
+
+    def is_fresh(self, ttl_sec: float, *, now: float | None = None) -> bool:
+        return ((now or time.time()) - self.stored_at) < ttl_sec
+
+    def validators(self) -> dict[str, str]:
+        out: dict[str, str] = {}
+        if self.etag:
+            out["If-None-Match"] = self.etag
+        if self.last_modified:
+            out["If-Modified-Since"] = self.last_modified
+        return out
+
+
+class HttpResponseCache:
+    """On-disk cache of text responses with conditional revalidation support.
+
+    Freshness is decided by the caller-supplied TTL, so each source can choose
+    how long its pages stay valid. Stale entries keep their ETag/Last-Modified
+    so the next request can be sent as a conditional GET. With a `manager`
+    the directory is kept under its size and age budget.
+    """
+
+    def __init__(self, cache_dir: Path, *, manager: DiskCacheManager | None = None):
+        self._cache_dir = Path(cache_dir)
+        self._manager = manager
+
+    @staticmethod
+    def _key(url: str, headers: Mapping[str, str]) -> str:
+        lowered = {k.lower(): v for k, v in headers.items()}
+        parts = [url] + [f"{h}={lowered.get(h.lower(), '')}" for h in _VARY_HEADERS]
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, url: str, headers: Mapping[str, str]) -> Path:
+        return self._cache_dir / f"{self._key(url, headers)}.json"
+
+    async def load(
+        self, url: str, headers: Mapping[str, str]
+    ) -> Optional[CachedResponse]:
+        path = self._path(url, headers)
+
+        def _sync() -> Optional[CachedResponse]:
+            try:
+                if not path.exists():
+                    return None
+                with path.open("r", encoding="utf-8") as f:
+                    obj = json.load(f)
+                if not isinstance(obj, dict) or obj.get("url") != url:
+                    return None
+                return CachedResponse(
+                    url=url,
+                    body=str(obj.get("body") or ""),
+                    stored_at=float(obj.get("stored_at") or 0),
+                    etag=str(obj.get("etag") or ""),
+                    last_modified=str(obj.get("last_modified") or ""),
+                    truncated=bool(obj.get("truncated")),
+                )
+            except Exception:
+                logger.warning(f"[dailyporn] http cache read failed: {path}")
+                return None
+
+        entry = await asyncio.to_thread(_sync)
+        if self._manager is not None:
+            if entry is None:
+                self._manager.record_miss()
+            else:
+                self._manager.record_hit(path)
+        return entry
+
+    async def store(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        body: str,
+        response_headers: Mapping[str, str],
+        *,
+        truncated: bool = False,
+    ) -> None:
+        cache_control = str(response_headers.get("Cache-Control", "")).lower()
+        if "no-store" in cache_control:
+            return
+        entry = CachedResponse(
+            url=url,
+            body=body,
+            stored_at=time.time(),
+            etag=str(response_headers.get("ETag", "") or ""),
+            last_modified=str(response_headers.get("Last-Modified", "") or ""),
+            truncated=truncated,
+        )
+        await self._write(self._path(url, headers), entry)
+
+    async def touch(
+        self, url: str, headers: Mapping[str, str], entry: CachedResponse
+    ) -> CachedResponse:
+        """Mark a revalidated (HTTP 304) entry as fresh again."""
+
+        refreshed = CachedResponse(
+            url=entry.url,
+            body=entry.body,
+            stored_at=time.time(),
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+            truncated=entry.truncated,
+        )
+        await self._write(self._path(url, headers), refreshed)
+        return refreshed
+
+    async def _write(self, path: Path, entry: CachedResponse) -> None:
+        def _sync() -> bool:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                with tmp.open("w", encoding="utf-8") as f:
+                    json.dump(asdict(entry), f, ensure_ascii=False)
+                tmp.replace(path)
+                return True
+            except Exception:
+                logger.warning(f"[dailyporn] http cache write failed: {path}")
+                return False
+
+        if await asyncio.to_thread(_sync) and self._manager is not None:
+            self._manager.add(path)
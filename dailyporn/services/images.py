@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import warnings
-from io import BytesIO
+import json
+import math
+import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from PIL import Image
 
@@ -13,66 +15,351 @@ from astrbot.api import logger
 from astrbot.core.utils.astrbot_path import get_astrbot_data_path
 
 from ..config import DailyPornConfig
+from ..utils.singleflight import SingleFlight
+from .disk_cache import DiskCacheManager
 from .http import HttpService
+from .parse_executor import ParseExecutor
+
+# Covers above this size are rejected before decoding (decompression bombs).
+MAX_COVER_PIXELS = 30_000_000
 
 
 class ImageService:
-    def __init__(self, *, plugin_name: str, cfg: DailyPornConfig, http: HttpService):
+    """Downloads covers and caches them on disk in two tiers.
+
+    Tier one (`covers/raw`) holds downloaded bytes, named by their SHA-256,
+    so URLs serving the identical image share one file; a persisted URL index
+    maps each cover URL to its raw file. Tier two (`covers/`) holds variants
+    derived from a raw file, keyed by (raw hash, mosaic level, target size,
+    format). Changing the mosaic level therefore only redoes the local
+    transform, never the download.
+
+    At most `cover_prefetch_workers` covers are downloaded and processed at a
+    time. Requests for a cover that is already being produced (for example by
+    `prefetch`) join that work instead of starting it again. Decoding,
+    pixelating and encoding run on `executor`; without one a single-thread
+    pool is created. `cache` / `raw_cache`, when given, keep the variant and
+    raw directories within their size and age budgets. `cover_size` is the
+    box the renderer fills with a cover; variants are produced at that size
+    instead of the original resolution. Without a mosaic, covers that already
+    fit that box are served from their raw file.
+    """
+
+    # Upper bound on remembered cover URLs; the oldest are forgotten first.
+    _URL_INDEX_MAX = 50_000
+    # Index writes are delayed so a prefetch wave is saved in one go.
+    _INDEX_SAVE_DELAY_SEC = 1.0
+
+    def __init__(
+        self,
+        *,
+        plugin_name: str,
+        cfg: DailyPornConfig,
+        http: HttpService,
+        executor: ParseExecutor | None = None,
+        cache: DiskCacheManager | None = None,
+        raw_cache: DiskCacheManager | None = None,
+        cover_size: tuple[int, int] | None = None,
+    ):
         self._cfg = cfg
+        self._cover_size = cover_size
         self._http = http
+        self._cache = cache
+        self._raw_cache = raw_cache
+        self._executor = executor or ParseExecutor(max_workers=1, name="image")
         base_dir = Path(get_astrbot_data_path()) / "plugin_data" / plugin_name
         self._cache_dir = base_dir / "cache" / "covers"
+        self._workers = asyncio.Semaphore(cfg.cover_prefetch_workers)
+        self._inflight: SingleFlight[Optional[str]] = SingleFlight()
+        self._prefetch_tasks: set[asyncio.Task] = set()
+        # LRU-ordered: cover URL -> raw file name in `_raw_dir`.
+        self._url_index: OrderedDict[str, str] = OrderedDict()
+        self._index_loaded = False
+        self._index_lock = asyncio.Lock()
+        self._index_dirty = False
+        self._index_save: asyncio.Task | None = None
+        # Raw files that need no transform at mosaic level 0 (already small).
+        self._raw_as_is: set[str] = set()
+
+    @property
+    def _raw_dir(self) -> Path:
+        return self._cache_dir / "raw"
+
+    @property
+    def _index_path(self) -> Path:
+        return self._cache_dir / "index" / "urls.json"
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """Start producing covers in the background; returns immediately."""
+
+        for url in dict.fromkeys((u or "").strip() for u in urls):
+            if not url:
+                continue
+            task = asyncio.ensure_future(self.get_cover_path(url))
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def get_cover_paths(self, urls: Iterable[str]) -> list[Optional[str]]:
+        """`get_cover_path` for several covers at once, in input order."""
+
+        return list(await asyncio.gather(*(self.get_cover_path(u) for u in urls)))
 
     async def get_cover_path(self, url: str) -> Optional[str]:
         url = (url or "").strip()
         if not url:
             return None
+        return await self._inflight.run(url, lambda: self._produce_cover(url))
 
-        mosaic_level = self._cfg.mosaic_level
-        key = hashlib.sha1(f"{url}|{mosaic_level}".encode("utf-8")).hexdigest()
-        out_path = self._cache_dir / f"{key}.png"
-        if out_path.exists():
-            return str(out_path)
+    async def _produce_cover(self, url: str) -> Optional[str]:
+        mosaic_level = max(0, min(100, int(self._cfg.mosaic_level)))
+        await self._load_index()
+        raw_name = self._url_index.get(url)
+        if raw_name is not None:
+            self._url_index.move_to_end(url)
+            out_path = self._output_path(raw_name, mosaic_level)
+            if out_path.exists():
+                self._record_hit(out_path)
+                return str(out_path)
+
+        if self._cache is not None and mosaic_level > 0:
+            self._cache.record_miss()
+        async with self._workers:
+            raw_path = self._raw_dir / raw_name if raw_name else None
+            if raw_path is not None and raw_path.exists():
+                self._record_hit(raw_path)
+            else:
+                raw_path = await self._download_raw(url)
+                if raw_path is None:
+                    return None
+            return await self._derive(raw_path, mosaic_level)
+
+    def _output_path(self, raw_name: str, mosaic_level: int) -> Path:
+        if mosaic_level <= 0 and (
+            self._cover_size is None or raw_name in self._raw_as_is
+        ):
+            # The raw image is served as is.
+            return self._raw_dir / raw_name
+        digest = raw_name.split(".", 1)[0]
+        size = "full"
+        if self._cover_size is not None:
+            size = f"{self._cover_size[0]}x{self._cover_size[1]}"
+        return self._cache_dir / f"{digest}_m{mosaic_level}_{size}.png"
 
+    def _record_hit(self, path: Path) -> None:
+        cache = self._raw_cache if path.parent == self._raw_dir else self._cache
+        if cache is not None:
+            cache.record_hit(path)
+
+    async def _download_raw(self, url: str) -> Optional[Path]:
         data = await self._http.safe_get_bytes(url, proxy=self._cfg.proxy)
         if not data:
             return None
 
-        await asyncio.to_thread(self._cache_dir.mkdir, parents=True, exist_ok=True)
+        raw_name = hashlib.sha256(data).hexdigest() + _raw_suffix(data)
+        raw_path = self._raw_dir / raw_name
 
-        if mosaic_level <= 0:
+        def _sync() -> bool:
+            raw_path.parent.mkdir(parents=True, exist_ok=True)
+            if raw_path.exists():
+                # The same image is already stored for another URL.
+                return False
+            # Two URLs may serve these bytes concurrently; each writes its own.
+            tmp = _tmp_path(raw_path)
             try:
-                await asyncio.to_thread(out_path.write_bytes, data)
-                return str(out_path)
-            except Exception:
-                logger.exception("[dailyporn] cover save failed")
-                return None
+                tmp.write_bytes(data)
+                tmp.replace(raw_path)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+            return True
 
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("error", Image.DecompressionBombWarning)
-                Image.MAX_IMAGE_PIXELS = 30_000_000
-                img = Image.open(BytesIO(data))
-                img.load()
-                img = img.convert("RGB")
-            pixelated = self._pixelate(img, mosaic_level=mosaic_level)
-            await asyncio.to_thread(pixelated.save, out_path, "PNG", optimize=True)
+            created = await asyncio.to_thread(_sync)
+        except Exception:
+            logger.exception("[dailyporn] cover save failed")
+            return None
+        if self._raw_cache is not None:
+            self._raw_cache.record_miss()
+            if created:
+                self._raw_cache.add(raw_path, len(data))
+        self._remember(url, raw_name)
+        return raw_path
+
+    async def _derive(self, raw_path: Path, mosaic_level: int) -> Optional[str]:
+        out_path = self._output_path(raw_path.name, mosaic_level)
+        if out_path == raw_path or out_path.exists():
             return str(out_path)
+
+        await asyncio.to_thread(self._cache_dir.mkdir, parents=True, exist_ok=True)
+        try:
+            written = await self._executor.run(
+                process_cover,
+                str(raw_path),
+                str(out_path),
+                mosaic_level=mosaic_level,
+                max_pixels=MAX_COVER_PIXELS,
+                target_size=self._cover_size,
+                label="cover",
+            )
         except Exception:
             logger.exception("[dailyporn] cover process failed")
             return None
+        if not written:
+            self._raw_as_is.add(raw_path.name)
+            return str(raw_path)
+        if self._cache is not None:
+            self._cache.add(out_path)
+        return str(out_path)
 
-    @staticmethod
-    def _pixelate(img: Image.Image, *, mosaic_level: int) -> Image.Image:
-        level = max(0, min(100, int(mosaic_level)))
-        if level <= 0:
-            return img
+    def _remember(self, url: str, raw_name: str) -> None:
+        self._url_index[url] = raw_name
+        self._url_index.move_to_end(url)
+        while len(self._url_index) > self._URL_INDEX_MAX:
+            self._url_index.popitem(last=False)
+        self._index_dirty = True
+        if self._index_save is None or self._index_save.done():
+            self._index_save = asyncio.ensure_future(self._save_index())
 
+    async def _load_index(self) -> None:
+        if self._index_loaded:
+            return
+        async with self._index_lock:
+            if self._index_loaded:
+                return
+            path = self._index_path
+
+            def _sync() -> dict[str, str]:
+                try:
+                    if not path.exists():
+                        return {}
+                    with path.open("r", encoding="utf-8") as f:
+                        obj = json.load(f)
+                    return {str(k): str(v) for k, v in obj.items()}
+                except Exception:
+                    logger.warning(f"[dailyporn] cover index read failed: {path}")
+                    return {}
+
+            self._url_index = OrderedDict(await asyncio.to_thread(_sync))
+            self._index_loaded = True
+
+    async def _save_index(self) -> None:
+        path = self._index_path
+        while self._index_dirty:
+            await asyncio.sleep(self._INDEX_SAVE_DELAY_SEC)
+            self._index_dirty = False
+            data = dict(self._url_index)
+
+            def _sync() -> None:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = path.with_suffix(".tmp")
+                    with tmp.open("w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False)
+                    tmp.replace(path)
+                except Exception:
+                    logger.warning(f"[dailyporn] cover index write failed: {path}")
+
+            await asyncio.to_thread(_sync)
+
+
+def _raw_suffix(data: bytes) -> str:
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if data.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if data.startswith(b"GIF87a") or data.startswith(b"GIF89a"):
+        return ".gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return ".img"
+
+
+def process_cover(
+    raw_path: str,
+    out_path: str,
+    *,
+    mosaic_level: int,
+    max_pixels: int,
+    target_size: tuple[int, int] | None = None,
+) -> bool:
+    """Decode the image at `raw_path`, pixelate it and write it as PNG.
+
+    Runs in an executor worker, so it only takes picklable arguments. Images
+    larger than `max_pixels` are rejected from their header, before any pixel
+    data is decoded; Pillow's process-wide `Image.MAX_IMAGE_PIXELS` is left
+    alone so concurrent workers cannot race on it.
+
+    With `target_size`, the image is scaled down to the smallest size that
+    still covers that box, so the renderer only has to crop it. JPEGs are
+    decoded at that scale directly (draft mode) and other formats are
+    shrunk with `Image.reduce` before the final resampling, so full-size
+    pixels are never pixelated or encoded.
+
+    Returns False without writing anything when there is neither a mosaic
+    nor a downscale to apply; the raw file can then be used as it is.
+    """
+
+    with Image.open(raw_path) as img:
         w, h = img.size
-        # Map 1..100 -> 2..40
-        factor = 2 + int(level / 100 * 38)
-        small_w = max(1, w // factor)
-        small_h = max(1, h // factor)
+        if w * h > max_pixels:
+            raise ValueError(f"cover too large: {w}x{h} > {max_pixels} pixels")
+        want = _covering_size((w, h), target_size) if target_size else None
+        if want is None and mosaic_level <= 0:
+            return False
+        if want is not None and img.format == "JPEG":
+            img.draft("RGB", want)
+        img.load()
+        rgb = _shrink(img, want) if want is not None else img
+        rgb = rgb.convert("RGB")
+    pixelated = pixelate(rgb, mosaic_level=mosaic_level)
+    path = Path(out_path)
+    tmp = _tmp_path(path)
+    try:
+        pixelated.save(tmp, "PNG", optimize=True)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _tmp_path(path: Path) -> Path:
+    """A private temp name next to `path` for an atomic replace."""
+
+    return path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _covering_size(
+    size: tuple[int, int], box: tuple[int, int]
+) -> tuple[int, int] | None:
+    """Smallest size with `size`'s aspect ratio covering `box`; None if no smaller."""
+
+    w, h = size
+    scale = max(box[0] / w, box[1] / h)
+    if scale >= 1:
+        return None
+    return max(1, math.ceil(w * scale)), max(1, math.ceil(h * scale))
+
+
+def _shrink(img: Image.Image, want: tuple[int, int]) -> Image.Image:
+    factor = min(img.width // want[0], img.height // want[1])
+    if factor >= 2:
+        img = img.reduce(factor)
+    if img.size != want:
+        img = img.resize(want, resample=Image.Resampling.LANCZOS)
+    return img
+
+
+def pixelate(img: Image.Image, *, mosaic_level: int) -> Image.Image:
+    level = max(0, min(100, int(mosaic_level)))
+    if level <= 0:
+        return img
+
+    w, h = img.size
+    # Map 1..100 -> 2..40
+    factor = 2 + int(level / 100 * 38)
+    small_w = max(1, w // factor)
+    small_h = max(1, h // factor)
 
-        small = img.resize((small_w, small_h), resample=Image.Resampling.NEAREST)
-        return small.resize((w, h), resample=Image.Resampling.NEAREST)
+    small = img.resize((small_w, small_h), resample=Image.Resampling.NEAREST)
+    return small.resize((w, h), resample=Image.Resampling.NEAREST)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from astrbot.api import logger
+
+T = TypeVar("T")
+
+PARSE_MODES = ("thread", "process")
+
+
+@dataclass
+class ParseStats:
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class ParseExecutor:
+    """Runs CPU-heavy work (HTML parsing, cover processing) off the event loop.
+
+    `mode="thread"` uses a small thread pool: parsing still holds the GIL, but
+    the event loop is no longer blocked for a whole page. `mode="process"` uses
+    a process pool for real parallelism; callables and arguments must then be
+    picklable. Wall time per call, including queueing, is recorded per label,
+    and the number of calls waiting for a free worker is tracked as the queue
+    depth. `name` only labels the pool's threads.
+    """
+
+    def __init__(
+        self, *, mode: str = "thread", max_workers: int = 2, name: str = "parse"
+    ):
+        self._mode = mode if mode in PARSE_MODES else "thread"
+        self._max_workers = max(1, int(max_workers))
+        self._name = name
+        self._pool: Executor | None = None
+        self._stats: dict[str, ParseStats] = {}
+        self._pending = 0
+        self.peak_queue_depth = 0
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls submitted but not yet picked up by a worker."""
+
+        return max(0, self._pending - self._max_workers)
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self._mode == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix=f"dailyporn-{self._name}",
+                )
+        return self._pool
+
+    async def run(
+        self, fn: Callable[..., T], *args: Any, label: str = "", **kwargs: Any
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        self._pending += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            return await loop.run_in_executor(
+                self._executor(), functools.partial(fn, *args, **kwargs)
+            )
+        finally:
+            self._pending -= 1
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats = self._stats.setdefault(label or "-", ParseStats())
+            stats.calls += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            logger.debug(
+                f"[dailyporn] {self._name} {label or '-'} took {elapsed_ms:.0f}ms"
+            )
+
+    def stats(self) -> dict[str, ParseStats]:
+        return dict(self._stats)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -2,35 +2,62 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from astrbot.api import logger
 
 from ..config import DailyPornConfig
 from ..models import HotItem
 from ..repositories.recommendation_history import RecommendationHistoryRepository
+from ..sources.base import BaseSource, SourceBlockedError
 from ..sources.registry import SourceRegistry
+from ..utils.singleflight import SingleFlight
+from .source_health import SourceHealthTracker
 
 
 @dataclass(frozen=True)
 class CachedValue:
+    fresh_until: float
     expires_at: float
     value: Any
 
 
+@dataclass
+class _Attempt:
+    """One source scrape of a wave; `straggler` is set if it missed the deadline."""
+
+    source_id: str
+    items: list[HotItem]
+    straggler: Optional[asyncio.Future] = None
+    started: float = 0.0
+
+
 class RecommendationService:
     def __init__(
         self,
         cfg: DailyPornConfig,
         sources: SourceRegistry,
         history: RecommendationHistoryRepository | None = None,
+        prefetch_covers: Callable[[Iterable[str]], None] | None = None,
+        health: SourceHealthTracker | None = None,
     ):
         self._cfg = cfg
         self._sources = sources
         self._history = history
-        self._cache: dict[str, CachedValue] = {}
+        # Started as soon as results are known, so covers download while the
+        # caller is still ranking or preparing the render.
+        self._prefetch_covers = prefetch_covers
+        # LRU-ordered: hits move to the end, the front is evicted first.
+        self._cache: OrderedDict[str, CachedValue] = OrderedDict()
+        self._inflight: SingleFlight[list[HotItem]] = SingleFlight()
+        self._inflight_wave: SingleFlight[dict[str, list[HotItem]]] = SingleFlight()
+        # Shared by every scrape, so overlapping waves cannot multiply load.
+        self._source_slots = asyncio.Semaphore(cfg.source_fetch_concurrency)
+        self._health = health
+        self._refresh_tasks: set[asyncio.Task] = set()
 
     async def get_section_items(
         self,
@@ -39,26 +66,238 @@ class RecommendationService:
         per_source_limit: int = 1,
         bypass_cache: bool = False,
     ) -> list[HotItem]:
-        cache_key = f"section:{section}:{per_source_limit}"
-        now = time.time()
+        cache_key = self._cache_key(section, per_source_limit)
         if not bypass_cache:
-            cached = self._cache.get(cache_key)
-            if cached and cached.expires_at > now:
-                return cached.value
+            cached = self._cached(section, per_source_limit)
+            if cached is not None:
+                self._prefetch(cached)
+                return cached
+
+        items = await self._load_section_items(cache_key, section, per_source_limit)
+        if not bypass_cache:
+            self._store(cache_key, items)
+        self._prefetch(items)
+        return items
+
+    async def get_sections_items(
+        self,
+        sections: Iterable[str],
+        *,
+        per_source_limit: int = 1,
+        bypass_cache: bool = False,
+    ) -> dict[str, list[HotItem]]:
+        """`get_section_items` for several sections at once.
+
+        Cache hits are answered directly; every (source, section) pair of the
+        remaining sections is scraped in one concurrent wave.
+        """
+
+        sections = list(dict.fromkeys(sections))
+        out: dict[str, list[HotItem]] = {}
+        missing: list[str] = []
+        for section in sections:
+            cached = None if bypass_cache else self._cached(section, per_source_limit)
+            if cached is None:
+                missing.append(section)
+            else:
+                out[section] = cached
+
+        if missing:
+            fetched = await self._inflight_wave.run(
+                (tuple(missing), per_source_limit),
+                lambda: self._fetch_sections(
+                    missing, per_source_limit=per_source_limit
+                ),
+            )
+            for section in missing:
+                out[section] = fetched[section]
+                if not bypass_cache:
+                    self._store(
+                        self._cache_key(section, per_source_limit), fetched[section]
+                    )
+        return {section: out[section] for section in sections}
+
+    def _prefetch(self, items: Iterable[HotItem]) -> None:
+        if self._prefetch_covers is None:
+            return
+        try:
+            self._prefetch_covers(it.cover_url for it in items if it.cover_url)
+        except Exception:
+            logger.exception("[dailyporn] cover prefetch failed to start")
+
+    def _cached(self, section: str, per_source_limit: int) -> Optional[list[HotItem]]:
+        cache_key = self._cache_key(section, per_source_limit)
+        now = time.time()
+        cached = self._cache.get(cache_key)
+        if not cached or cached.expires_at <= now:
+            return None
+        self._cache.move_to_end(cache_key)
+        if cached.fresh_until <= now:
+            # Stale-while-revalidate: answer now, refresh in the background.
+            self._schedule_refresh(cache_key, section, per_source_limit)
+        return cached.value
+
+    @staticmethod
+    def _cache_key(section: str, per_source_limit: int) -> str:
+        return f"section:{section}:{per_source_limit}"
+
+    async def _load_section_items(
+        self, cache_key: str, section: str, per_source_limit: int
+    ) -> list[HotItem]:
+        # Concurrent misses for the same section share one scrape.
+        return await self._inflight.run(
+            cache_key,
+            lambda: self._fetch_section_items(
+                section, per_source_limit=per_source_limit
+            ),
+        )
+
+    def _store(self, cache_key: str, items: list[HotItem]) -> None:
+        now = time.time()
+        self._cache[cache_key] = CachedValue(
+            fresh_until=now + self._cfg.section_cache_soft_ttl_sec,
+            expires_at=now + self._cfg.section_cache_hard_ttl_sec,
+            value=items,
+        )
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._cfg.section_cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _schedule_refresh(
+        self, cache_key: str, section: str, per_source_limit: int
+    ) -> None:
+        if any(t.get_name() == cache_key for t in self._refresh_tasks):
+            return
+
+        async def _refresh() -> None:
+            items = await self._load_section_items(cache_key, section, per_source_limit)
+            self._store(cache_key, items)
 
+        task = asyncio.create_task(_refresh(), name=cache_key)
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._on_refresh_done)
+
+    async def close(self) -> None:
+        tasks = list(self._refresh_tasks)
+        for t in tasks:
+            t.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh_tasks.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning(
+                f"[dailyporn] background refresh {task.get_name()} failed: "
+                f"{task.exception()}"
+            )
+
+    async def _fetch_section_items(
+        self, section: str, *, per_source_limit: int
+    ) -> list[HotItem]:
+        fetched = await self._fetch_sections(
+            [section], per_source_limit=per_source_limit
+        )
+        return fetched[section]
+
+    async def _fetch_sections(
+        self, sections: list[str], *, per_source_limit: int
+    ) -> dict[str, list[HotItem]]:
         proxy = self._cfg.proxy
-        enabled_sources = list(self._sources.iter_enabled_sources(section))
+        deadline = self._cfg.section_deadline_sec
+        pairs: list[tuple[str, BaseSource]] = []
+        seen: set[tuple[str, str]] = set()
+        for section in sections:
+            for src in self._sources.iter_enabled_sources(section):
+                if (src.source_id, section) not in seen:
+                    seen.add((src.source_id, section))
+                    pairs.append((section, src))
 
-        async def call_source(src) -> list[HotItem]:
+        async def fetch(section: str, src: BaseSource) -> list[HotItem]:
+            started = time.monotonic()
             try:
-                return await src.fetch_hot(section, limit=per_source_limit, proxy=proxy)
+                items = await src.fetch_hot(
+                    section, limit=per_source_limit, proxy=proxy
+                )
             except Exception as e:
                 logger.warning(f"[dailyporn] source {src.source_id} failed: {e}")
+                if self._health is not None:
+                    self._health.record_failure(
+                        src.source_id,
+                        str(e) or type(e).__name__,
+                        (time.monotonic() - started) * 1000,
+                        blocked=isinstance(e, SourceBlockedError),
+                    )
                 return []
+            if self._health is not None:
+                latency_ms = (time.monotonic() - started) * 1000
+                if items or src.may_return_empty:
+                    self._health.record_success(src.source_id, latency_ms)
+                else:
+                    # Sources swallow most scrape errors and return nothing.
+                    self._health.record_failure(
+                        src.source_id, "returned no items", latency_ms
+                    )
+            return items
 
-        tasks = [call_source(src) for src in enabled_sources]
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        async def call_source(section: str, src: BaseSource) -> _Attempt:
+            async with self._source_slots:
+                # The deadline starts once the source holds a slot, so sources
+                # queued behind the concurrency cap are never dropped unstarted.
+                started = time.monotonic()
+                task = asyncio.ensure_future(fetch(section, src))
+                try:
+                    await asyncio.wait({task}, timeout=deadline or None)
+                except BaseException:
+                    task.cancel()
+                    raise
+            if task.done():
+                return _Attempt(src.source_id, task.result(), started=started)
+            # A straggler gives its slot back and is handled by the caller.
+            return _Attempt(src.source_id, [], straggler=task, started=started)
 
+        if not pairs:
+            return {section: [] for section in sections}
+
+        calls = [asyncio.ensure_future(call_source(sec, src)) for sec, src in pairs]
+        try:
+            attempts = await asyncio.gather(*calls)
+        except BaseException:
+            for t in calls:
+                t.cancel()
+            raise
+
+        out: dict[str, list[HotItem]] = {}
+        for section in sections:
+            section_attempts = [
+                a for (sec, _), a in zip(pairs, attempts) if sec == section
+            ]
+            late = [a for a in section_attempts if a.straggler is not None]
+            if late:
+                logger.warning(
+                    f"[dailyporn] section {section}: returning without "
+                    f"{', '.join(a.source_id for a in late)} "
+                    f"(deadline {deadline}s per source)"
+                )
+                if self._cfg.section_deadline_refill:
+                    self._schedule_refill(section, per_source_limit, section_attempts)
+                else:
+                    for a in late:
+                        a.straggler.cancel()
+                        if self._health is not None:
+                            self._health.record_failure(
+                                a.source_id,
+                                f"missed the {deadline}s section deadline",
+                                (time.monotonic() - a.started) * 1000,
+                            )
+            out[section] = self._collect_section_items(
+                [a.items for a in section_attempts if a.straggler is None]
+            )
+        return out
+
+    def _collect_section_items(self, results: list[list[HotItem]]) -> list[HotItem]:
         items: list[HotItem] = []
         for part in results:
             items.extend(part)
@@ -66,13 +305,42 @@ class RecommendationService:
         manual_only = getattr(self._sources, "MANUAL_ONLY_SOURCE_IDS", set())
         if manual_only:
             items = [it for it in items if it.source not in manual_only]
-
-        if not bypass_cache:
-            self._cache[cache_key] = CachedValue(
-                expires_at=now + 600, value=items
-            )  # 10 min
         return items
 
+    def _schedule_refill(
+        self, section: str, per_source_limit: int, attempts: list[_Attempt]
+    ) -> None:
+        """Let sources that missed the deadline finish, then cache the full set."""
+
+        cache_key = self._cache_key(section, per_source_limit)
+        stragglers = [a.straggler for a in attempts if a.straggler is not None]
+        started = min(a.started for a in attempts)
+
+        async def _refill() -> None:
+            await asyncio.gather(*stragglers)
+            logger.info(
+                f"[dailyporn] section {section}: stragglers finished after "
+                f"{time.monotonic() - started:.1f}s, cache refilled"
+            )
+            items = self._collect_section_items(
+                [
+                    a.straggler.result() if a.straggler is not None else a.items
+                    for a in attempts
+                ]
+            )
+            self._store(cache_key, items)
+
+        task = asyncio.create_task(_refill(), name=f"{cache_key}:refill")
+        self._refresh_tasks.add(task)
+
+        def _done(t: asyncio.Task) -> None:
+            if t.cancelled():
+                for pending in stragglers:
+                    pending.cancel()
+            self._on_refresh_done(t)
+
+        task.add_done_callback(_done)
+
     async def get_section_recommendation(
         self,
         section: str,
@@ -84,6 +352,18 @@ class RecommendationService:
         items = await self.get_section_items(
             section, per_source_limit=1, bypass_cache=bypass_cache
         )
+        return await self._rank_section(
+            section, items, now=now, apply_penalty=apply_penalty
+        )
+
+    async def _rank_section(
+        self,
+        section: str,
+        items: list[HotItem],
+        *,
+        now: datetime | None,
+        apply_penalty: bool,
+    ) -> Optional[HotItem]:
         if not items:
             return None
 
@@ -124,16 +404,17 @@ class RecommendationService:
         apply_penalty: bool = True,
         bypass_cache: bool = False,
     ) -> dict[str, HotItem]:
+        items_by_section = await self.get_sections_items(
+            sections, per_source_limit=1, bypass_cache=bypass_cache
+        )
         out: dict[str, HotItem] = {}
-        for section in sections:
-            item = await self.get_section_recommendation(
-                section,
-                now=now,
-                apply_penalty=apply_penalty,
-                bypass_cache=bypass_cache,
+        for section, items in items_by_section.items():
+            item = await self._rank_section(
+                section, items, now=now, apply_penalty=apply_penalty
             )
             if item:
                 out[section] = item
+                self._prefetch([item])
         return out
 
     async def record_daily_recommendations(
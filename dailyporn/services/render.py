@@ -12,6 +12,7 @@ from PIL import Image, ImageDraw, ImageFont, ImageOps
 from ..config import DailyPornConfig
 from ..models import HotItem
 from ..sections import SECTIONS, section_display
+from .disk_cache import DiskCacheManager
 from .images import ImageService
 
 HtmlRenderFn = Callable[..., Awaitable[Any]]
@@ -62,35 +63,40 @@ class RenderService:
         html_render: Optional[HtmlRenderFn],
         templates_dir: Path,
         render_dir: Path,
+        render_cache: DiskCacheManager | None = None,
     ):
         self._cfg = cfg
         self._images = images
         self._html_render = html_render
         self._templates_dir = templates_dir
         self._render_dir = render_dir
+        # Evicts old images from `render_dir`; renders elsewhere are ignored.
+        self._render_cache = render_cache
         self._template_cache: dict[str, str] = {}
 
     async def render_daily(
-        self, recos: dict[str, HotItem], *, reason: str
+        self,
+        recos: dict[str, HotItem],
+        *,
+        reason: str,
+        now: datetime | None = None,
     ) -> str | None:
         if self._cfg.delivery_mode != "html_image":
             return None
 
-        blocks = []
-        for section_key in [s.key for s in SECTIONS]:
-            item = recos.get(section_key)
-            if not item:
-                continue
-            blocks.append(
-                {
-                    "title": f"{section_display(section_key)} 推荐",
-                    "items": [await self._item_ctx(item)],
-                }
-            )
+        picks = [(s.key, recos[s.key]) for s in SECTIONS if recos.get(s.key)]
+        item_ctxs = await asyncio.gather(*(self._item_ctx(item) for _, item in picks))
+        blocks = [
+            {
+                "title": f"{section_display(section_key)} 推荐",
+                "items": [item_ctx],
+            }
+            for (section_key, _), item_ctx in zip(picks, item_ctxs)
+        ]
 
         ctx = {
             "title": "DailyPorn 日报",
-            "subtitle": f"{datetime.now().strftime('%Y-%m-%d %H:%M')} · 触发: {reason}",
+            "subtitle": f"{(now or datetime.now()).strftime('%Y-%m-%d %H:%M')} · 触发: {reason}",
             "blocks": blocks,
             "mosaic_level": self._cfg.mosaic_level,
         }
@@ -103,7 +109,9 @@ class RenderService:
         blocks = [
             {
                 "title": f"{section_display(section)} 热门",
-                "items": [await self._item_ctx(i) for i in items],
+                "items": list(
+                    await asyncio.gather(*(self._item_ctx(i) for i in items))
+                ),
             }
         ]
 
@@ -188,6 +196,7 @@ class RenderService:
                                 return result
                         out_path = Path(str(result)).resolve()
                         out_path = await self._compress_render(out_path)
+                        self._track(out_path)
                         if send_mode == "base64":
                             data = await asyncio.to_thread(out_path.read_bytes)
                             return base64.b64encode(data).decode("ascii")
@@ -204,6 +213,7 @@ class RenderService:
                 else:
                     logger.info("[dailyporn] rendered via local backend (remote skipped)")
                 out_path = await self._compress_render(local_path)
+                self._track(out_path)
                 if send_mode == "base64":
                     data = await asyncio.to_thread(out_path.read_bytes)
                     return base64.b64encode(data).decode("ascii")
@@ -244,6 +254,10 @@ class RenderService:
         b64 = base64.b64encode(data).decode("ascii")
         return f"data:{mime};base64,{b64}"
 
+    def _track(self, path: Path) -> None:
+        if self._render_cache is not None:
+            self._render_cache.add(path)
+
     async def _compress_render(self, path: Path) -> Path:
         try:
             size = path.stat().st_size
@@ -287,6 +301,21 @@ class RenderService:
         with Image.open(path) as img:
             img.save(path, "PNG", optimize=True, compress_level=9)
 
+    @classmethod
+    def cover_size(cls) -> tuple[int, int]:
+        """The largest cover box of the layout (a block with a single item).
+
+        Covers are produced at this size; smaller cards crop them down.
+        """
+
+        return cls._thumb_size(1)
+
+    @classmethod
+    def _thumb_size(cls, cols: int) -> tuple[int, int]:
+        inner = cls._LOCAL_CANVAS_WIDTH - cls._LOCAL_PADDING * 2
+        card_width = (inner - cls._LOCAL_GAP * (cols - 1)) // cols
+        return card_width, int(card_width * 9 / 16)
+
     def _render_local(self, ctx: dict[str, Any]) -> Path | None:
         blocks = ctx.get("blocks") if isinstance(ctx.get("blocks"), list) else []
         if not blocks:
@@ -331,8 +360,7 @@ class RenderService:
                 continue
             count = len(items)
             cols = 1 if count <= 1 else 2 if count == 2 else 3
-            card_width = (width - padding * 2 - gap * (cols - 1)) // cols
-            thumb_height = int(card_width * 9 / 16)
+            card_width, thumb_height = self._thumb_size(cols)
             card_height = thumb_height + meta_height
             rows = (count + cols - 1) // cols
             block_title_h = self._text_size(
@@ -1,21 +1,41 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
 
 from astrbot.api import logger
 from astrbot.api.event import MessageChain
 from astrbot.api.star import Context
 
 from ..config import DailyPornConfig
-from ..events import DailyReportRequested
+from ..events import DailyReportPrewarmRequested, DailyReportRequested
+from ..models import HotItem
 from ..repositories.subscriptions import SubscriptionRepository
 from ..sections import SECTIONS, section_display
+from .delivery import DeliveryService
 from .images import ImageService
 from .render import RenderService
 from .recommendation import RecommendationService
 
 
+@dataclass(frozen=True)
+class PreparedReport:
+    """Daily report content built once and shared by every target session."""
+
+    scheduled_for: datetime
+    recos: dict[str, HotItem]
+    image_ref: Optional[str] = None
+    cover_paths: dict[str, Optional[str]] = field(default_factory=dict)
+
+
 class ReportService:
+    # A pre-warmed report is only used for the trigger it was built for.
+    _PREWARM_MAX_SKEW = timedelta(hours=1)
+    # How long the trigger waits for a pre-warm that is still running.
+    _PREWARM_WAIT_SEC = 120.0
+
     def __init__(
         self,
         *,
@@ -26,6 +46,7 @@ class ReportService:
         recommendations: RecommendationService,
         images: ImageService,
         renderer: RenderService | None,
+        delivery: DeliveryService | None = None,
     ):
         self._context = context
         self._cfg = cfg
@@ -34,9 +55,111 @@ class ReportService:
         self._reco = recommendations
         self._images = images
         self._renderer = renderer
+        self._delivery = delivery or DeliveryService(context=context)
+        self._prewarm: asyncio.Future[PreparedReport] | None = None
 
     def register(self) -> None:
         self._bus.subscribe(DailyReportRequested, self._on_daily_report)
+        self._bus.subscribe(DailyReportPrewarmRequested, self._on_prewarm)
+
+    async def stop(self) -> None:
+        """Cancel a pre-warm that is still running."""
+
+        fut, self._prewarm = self._prewarm, None
+        if fut is None or fut.done():
+            return
+        fut.cancel()
+        try:
+            await fut
+        except BaseException:
+            pass
+
+    async def _on_prewarm(self, event: DailyReportPrewarmRequested) -> None:
+        fut = asyncio.ensure_future(self._prepare(event.scheduled_for))
+        self._prewarm = fut
+        try:
+            prepared = await fut
+        except Exception:
+            logger.exception(
+                "[dailyporn] pre-warm failed, report will be built at trigger time"
+            )
+            return
+        logger.info(
+            f"[dailyporn] pre-warmed report for {event.scheduled_for} "
+            f"(sections={len(prepared.recos)} image={bool(prepared.image_ref)})"
+        )
+
+    async def _prepare(self, scheduled_for: datetime) -> PreparedReport:
+        recos = await self._reco.get_daily_recommendations(
+            [s.key for s in SECTIONS],
+            now=scheduled_for,
+            apply_penalty=True,
+            bypass_cache=False,
+        )
+        return await self._build_report(recos, reason="schedule", now=scheduled_for)
+
+    def _wants_image(self) -> bool:
+        return self._cfg.delivery_mode == "html_image" and self._renderer is not None
+
+    async def _build_report(
+        self, recos: dict[str, HotItem], *, reason: str, now: datetime
+    ) -> PreparedReport:
+        """Render (or resolve covers for) a report once for all target sessions."""
+
+        if recos:
+            summary = ", ".join(
+                f"{section_display(k)}:{v.source}(score={v.score_tuple()[0]} stars={v.stars or 0} views={v.views or 0})"
+                for k, v in recos.items()
+            )
+            logger.info(f"[dailyporn] render picks: {summary}")
+
+        image_ref = None
+        if self._wants_image():
+            image_ref = await self._renderer.render_daily(recos, reason=reason, now=now)
+
+        report = PreparedReport(scheduled_for=now, recos=recos, image_ref=image_ref)
+        if not image_ref and not (
+            reason == "schedule" and self._cfg.delivery_mode == "html_image"
+        ):
+            await asyncio.gather(
+                *(self._cover_path(report, key, item) for key, item in recos.items())
+            )
+        return report
+
+    async def _cover_path(
+        self, report: PreparedReport, key: str, item: HotItem
+    ) -> Optional[str]:
+        if not item.cover_url:
+            return None
+        if key not in report.cover_paths:
+            report.cover_paths[key] = await self._images.get_cover_path(
+                item.cover_url
+            )
+        return report.cover_paths[key]
+
+    async def _take_prewarmed(
+        self, event: DailyReportRequested
+    ) -> Optional[PreparedReport]:
+        if event.reason != "schedule" or self._prewarm is None:
+            return None
+        fut, self._prewarm = self._prewarm, None
+
+        # A slow pre-warm is still the same work; wait for it instead of redoing
+        # it, but not forever.
+        try:
+            prepared = await asyncio.wait_for(fut, self._PREWARM_WAIT_SEC)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[dailyporn] pre-warm still running after "
+                f"{self._PREWARM_WAIT_SEC:.0f}s, building the report now"
+            )
+            return None
+        except Exception:
+            # Already logged by _on_prewarm.
+            return None
+        if abs(prepared.scheduled_for - event.requested_at) > self._PREWARM_MAX_SKEW:
+            return None
+        return prepared
 
     async def _on_daily_report(self, event: DailyReportRequested) -> None:
         try:
@@ -44,14 +167,18 @@ class ReportService:
             if not targets:
                 return
 
-            sections = [s.key for s in SECTIONS]
-            bypass_cache = event.reason == "manual"
-            recos = await self._reco.get_daily_recommendations(
-                sections,
-                now=event.requested_at,
-                apply_penalty=True,
-                bypass_cache=bypass_cache,
-            )
+            prepared = await self._take_prewarmed(event)
+            if prepared is not None:
+                recos = prepared.recos
+            else:
+                sections = [s.key for s in SECTIONS]
+                bypass_cache = event.reason == "manual"
+                recos = await self._reco.get_daily_recommendations(
+                    sections,
+                    now=event.requested_at,
+                    apply_penalty=True,
+                    bypass_cache=bypass_cache,
+                )
 
             if recos:
                 should_record = event.reason in {"schedule", "manual"}
@@ -66,20 +193,23 @@ class ReportService:
                 )
                 logger.info(f"[dailyporn] daily picks ({event.reason}): {summary}")
 
-            for session in targets:
-                await self._send_daily(session, recos, reason=event.reason)
+            report = prepared
+            if report is None or (self._wants_image() and not report.image_ref):
+                report = await self._build_report(
+                    recos, reason=event.reason, now=event.requested_at
+                )
+            await self._delivery.fan_out(
+                targets,
+                lambda session: self._send_daily(session, report, reason=event.reason),
+            )
         except Exception:
             logger.exception("[dailyporn] report failed")
 
-    async def _send_daily(self, session: str, recos: dict, *, reason: str) -> None:
-        if recos:
-            summary = ", ".join(
-                f"{section_display(k)}:{v.source}(score={v.score_tuple()[0]} stars={v.stars or 0} views={v.views or 0})"
-                for k, v in recos.items()
-            )
-            logger.info(f"[dailyporn] render picks: {summary}")
-        if self._cfg.delivery_mode == "html_image" and self._renderer is not None:
-            image_ref = await self._renderer.render_daily(recos, reason=reason)
+    async def _send_daily(
+        self, session: str, report: PreparedReport, *, reason: str
+    ) -> None:
+        image_ref = report.image_ref
+        if self._wants_image():
             if image_ref:
                 try:
                     chain = MessageChain()
@@ -93,7 +223,7 @@ class ReportService:
                         chain.base64_image(image_ref)
                     else:
                         chain.file_image(image_ref)
-                    await self._context.send_message(session, chain)
+                    await self._delivery.send(session, chain)
                     return
                 except Exception as e:
                     logger.warning(f"[dailyporn] send daily image failed: {e}")
@@ -106,12 +236,12 @@ class ReportService:
 
         header = f"DailyPorn 日报 ({datetime.now().strftime('%Y-%m-%d %H:%M')}) 触发: {reason}"
         try:
-            await self._context.send_message(session, MessageChain().message(header))
+            await self._delivery.send(session, MessageChain().message(header))
         except Exception as e:
             logger.warning(f"[dailyporn] send header failed: {e}")
             return
 
-        for key, item in recos.items():
+        for key, item in report.recos.items():
             title = item.title
             stars = item.stars if item.stars is not None else "-"
             views = item.views if item.views is not None else "-"
@@ -125,12 +255,11 @@ class ReportService:
             )
             chain = MessageChain().message(text)
 
-            if item.cover_url:
-                cover_path = await self._images.get_cover_path(item.cover_url)
-                if cover_path:
-                    chain.file_image(cover_path)
+            cover_path = await self._cover_path(report, key, item)
+            if cover_path:
+                chain.file_image(cover_path)
 
             try:
-                await self._context.send_message(session, chain)
+                await self._delivery.send(session, chain)
             except Exception as e:
                 logger.warning(f"[dailyporn] send item failed: {e}")
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from astrbot.api import logger
 
 from ..config import DailyPornConfig
-from ..events import DailyReportRequested
+from ..events import DailyReportPrewarmRequested, DailyReportRequested
 
 
 class SchedulerService:
@@ -32,6 +32,15 @@ class SchedulerService:
     async def _run(self) -> None:
         while True:
             trigger = _next_trigger_time(self._cfg.trigger_time)
+            prewarm_at = trigger - timedelta(minutes=self._cfg.prewarm_lead_min)
+            if self._cfg.prewarm_lead_min > 0 and prewarm_at > datetime.now():
+                sleep_seconds = (prewarm_at - datetime.now()).total_seconds()
+                logger.info(
+                    f"[dailyporn] next pre-warm at {prewarm_at} (in {int(sleep_seconds)}s)"
+                )
+                await asyncio.sleep(sleep_seconds)
+                self._bus.publish(DailyReportPrewarmRequested(scheduled_for=trigger))
+
             sleep_seconds = max(5, (trigger - datetime.now()).total_seconds())
             logger.info(
                 f"[dailyporn] next report at {trigger} (in {int(sleep_seconds)}s)"
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from astrbot.api import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class SourceHealth:
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency_ewma_ms: float = 0.0
+    last_error: str = ""
+    state: str = CLOSED
+    open_until: float = 0.0
+    cooldown_sec: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        total = self.successes + self.failures
+        return self.successes / total if total else 1.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "success_rate": round(self.success_rate, 3),
+            "latency_ewma_ms": round(self.latency_ewma_ms, 1),
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+
+class SourceHealthTracker:
+    """Per-source circuit breaker fed by scrape outcomes.
+
+    After `failure_threshold` consecutive failures (or one `SourceBlockedError`)
+    a source is opened and skipped for `cooldown_sec`. It then goes half-open:
+    exactly one scrape is let through as a probe. A successful probe closes the
+    circuit; a failed one reopens it with the cooldown doubled, up to
+    `max_cooldown_sec`. `failure_threshold` = 0 disables the breaker while
+    still keeping the statistics.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 3,
+        cooldown_sec: float = 1800,
+        max_cooldown_sec: float = 24 * 3600,
+        ewma_alpha: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._threshold = max(0, int(failure_threshold))
+        self._cooldown_sec = max(1.0, float(cooldown_sec))
+        self._max_cooldown_sec = max(self._cooldown_sec, float(max_cooldown_sec))
+        self._alpha = min(1.0, max(0.01, float(ewma_alpha)))
+        self._clock = clock
+        self._health: dict[str, SourceHealth] = {}
+
+    def _get(self, source_id: str) -> SourceHealth:
+        return self._health.setdefault(source_id, SourceHealth())
+
+    def allow(self, source_id: str) -> bool:
+        """Whether a scrape of `source_id` may run now (reserves the probe)."""
+
+        h = self._get(source_id)
+        if h.state == CLOSED:
+            return True
+        now = self._clock()
+        if now < h.open_until:
+            return False
+        # A probe that never reported back (e.g. it was cancelled) expires
+        # after one more cooldown.
+        h.state = HALF_OPEN
+        h.open_until = now + h.cooldown_sec
+        return True
+
+    def record_success(self, source_id: str, latency_ms: float) -> None:
+        h = self._get(source_id)
+        h.successes += 1
+        h.consecutive_failures = 0
+        self._observe_latency(h, latency_ms)
+        if h.state != CLOSED:
+            logger.info(f"[dailyporn] source {source_id} recovered, circuit closed")
+        h.state = CLOSED
+        h.open_until = 0.0
+        h.cooldown_sec = 0.0
+
+    def record_failure(
+        self,
+        source_id: str,
+        error: str,
+        latency_ms: float = 0.0,
+        *,
+        blocked: bool = False,
+    ) -> None:
+        h = self._get(source_id)
+        h.failures += 1
+        h.consecutive_failures += 1
+        h.last_error = error
+        if latency_ms:
+            self._observe_latency(h, latency_ms)
+        if not self._threshold:
+            return
+        if h.state == HALF_OPEN:
+            self._open(source_id, h, min(self._max_cooldown_sec, h.cooldown_sec * 2))
+        elif blocked or h.consecutive_failures >= self._threshold:
+            self._open(source_id, h, self._cooldown_sec)
+
+    def snapshot(self) -> dict[str, SourceHealth]:
+        return dict(self._health)
+
+    def _open(self, source_id: str, h: SourceHealth, cooldown_sec: float) -> None:
+        h.state = OPEN
+        h.cooldown_sec = cooldown_sec
+        h.open_until = self._clock() + cooldown_sec
+        logger.warning(
+            f"[dailyporn] source {source_id} circuit opened for {cooldown_sec:.0f}s "
+            f"after {h.consecutive_failures} failure(s): {h.last_error}"
+        )
+
+    def _observe_latency(self, h: SourceHealth, latency_ms: float) -> None:
+        if not h.latency_ewma_ms:
+            h.latency_ewma_ms = latency_ms
+        else:
+            h.latency_ewma_ms += self._alpha * (latency_ms - h.latency_ewma_ms)
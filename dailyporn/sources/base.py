@@ -1,19 +1,132 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from bs4 import BeautifulSoup
 
 from ..models import HotItem
+from ..services.candidate_pools import CandidatePoolCache
+from ..services.detail_stats import DetailStatsCache
+from ..services.parse_executor import ParseExecutor
+from ..utils.hedge import first_success
+from .soup import DEFAULT_HTML_BACKEND, ParseRegion, make_soup
+
+T = TypeVar("T")
 
 
 class SourceBlockedError(RuntimeError):
     pass
 
 
+class IncompletePoolError(RuntimeError):
+    """Raised by a candidate pool loader when part of the ranking failed.
+
+    `items` is what could be loaded; it is used once but not cached.
+    """
+
+    def __init__(self, items: list[HotItem]):
+        super().__init__("candidate pool incomplete")
+        self.items = items
+
+
 class BaseSource(ABC):
     source_id: str
     display_name: str
     sections: set[str]
+    # How long a downloaded detail page may be reused from the HTTP response
+    # cache before it is revalidated (seconds). 0 disables caching.
+    detail_cache_ttl_sec: int = 6 * 3600
+    # How long stats parsed from a detail page are reused for the same video
+    # without requesting the page at all (seconds). 0 always refetches.
+    detail_stats_ttl_sec: int = 3 * 3600
+    # Whether an empty hot list is a normal answer. Otherwise it counts as a
+    # failure for the circuit breaker, since most scrapers swallow errors.
+    may_return_empty: bool = False
+    # Hot-list pages in order of preference, fetched by `_fetch_first`.
+    _HOT_URLS: list[str] = []
+    _HEADERS: dict[str, str] = {}
+    _parser: Optional[ParseExecutor] = None
+    _pools: Optional[CandidatePoolCache] = None
+    _stats: Optional[DetailStatsCache] = None
+    _html_backend: str = DEFAULT_HTML_BACKEND
+    _hedge_delay_sec: float = 0.0
+
+    def bind_parser(self, parser: ParseExecutor) -> None:
+        self._parser = parser
+
+    def bind_pool_cache(self, pools: CandidatePoolCache) -> None:
+        self._pools = pools
+
+    def bind_stats_cache(self, stats: DetailStatsCache) -> None:
+        self._stats = stats
+
+    def use_html_backend(self, backend: str) -> None:
+        self._html_backend = backend
+
+    def use_hedge_delay(self, delay_sec: float) -> None:
+        self._hedge_delay_sec = max(0.0, float(delay_sec))
+
+    def _soup(
+        self, html: str, region: Optional[ParseRegion] = None
+    ) -> BeautifulSoup:
+        return make_soup(html, self._html_backend, region=region)
+
+    async def _parse(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a synchronous parse step off the event loop when bound."""
+
+        if self._parser is None:
+            return fn(*args, **kwargs)
+        return await self._parser.run(fn, *args, label=self.source_id, **kwargs)
+
+    async def _fetch_first(self, proxy: str) -> str:
+        """GET the most preferred `_HOT_URLS` page that answers.
+
+        A slow URL is hedged with the next fallback after `_hedge_delay_sec`;
+        the remaining requests are cancelled once one succeeds.
+        """
+
+        return await first_success(
+            [
+                functools.partial(
+                    self._http.get_text, url, proxy=proxy, headers=self._HEADERS
+                )
+                for url in self._HOT_URLS
+            ],
+            hedge_delay=self._hedge_delay_sec,
+        )
+
+    async def _candidate_pool(
+        self, period: str, load: Callable[[], Awaitable[list[HotItem]]]
+    ) -> list[HotItem]:
+        """Return the ranking pool for `period`, calling `load` on a miss.
+
+        Only complete, non-empty pools are cached; `load` raises
+        `IncompletePoolError` when some ranking pages failed.
+        """
+
+        if self._pools is not None:
+            items = await self._pools.get(self.source_id, period)
+            if items is not None:
+                return items
+        try:
+            items = await load()
+        except IncompletePoolError as e:
+            return e.items
+        if items and self._pools is not None:
+            await self._pools.put(self.source_id, period, items)
+        return items
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Bound parse methods may be shipped to a process pool; the HTTP client
+        # and the executor itself stay in this process.
+        state = dict(self.__dict__)
+        state.pop("_http", None)
+        state.pop("_parser", None)
+        state.pop("_pools", None)
+        state.pop("_stats", None)
+        return state
 
     def supports(self, section: str) -> bool:
         return section in self.sections
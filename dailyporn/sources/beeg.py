@@ -4,8 +4,6 @@ import json
 import re
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from .base import BaseSource
@@ -45,7 +43,9 @@ class BeegSource(BaseSource):
                 html = await self._http.get_text(hot_url, proxy=proxy, headers=self._HEADERS)
             except Exception:
                 continue
-            items = self._parse_home(html, limit=limit, section=section)
+            items = await self._parse(
+                self._parse_home, html, limit=limit, section=section
+            )
             if items:
                 return items
 
@@ -150,7 +150,7 @@ class BeegSource(BaseSource):
         return items
 
     def _parse_home(self, html: str, *, limit: int, section: str) -> list[HotItem]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
         items: list[HotItem] = []
         seen: set[str] = set()
 
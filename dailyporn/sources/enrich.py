@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, Mapping, Optional
+from urllib.parse import urlparse
+
+from ..models import HotItem
+from ..services.detail_stats import DetailStatsCache, DetailStatsEntry
+from ..services.http import EnoughPredicate, HttpService
+from ..services.parse_executor import ParseExecutor
+
+DetailStats = tuple[Optional[int], Optional[int], Mapping[str, Any]]
+DetailMerger = Callable[[HotItem, str], HotItem]
+
+DEFAULT_PER_HOST_LIMIT = 4
+
+
+def merge_detail_stats(
+    item: HotItem,
+    likes: Optional[int],
+    views: Optional[int],
+    extra_meta: Mapping[str, Any],
+    *,
+    title: str = "",
+) -> HotItem:
+    """Return a copy of `item` with detail-page stats layered on top.
+
+    Detail values win when present; list-page values are kept as fallback.
+    """
+
+    meta = dict(item.meta) if isinstance(item.meta, dict) else {}
+    meta.update(extra_meta)
+    return HotItem(
+        source=item.source,
+        section=item.section,
+        title=title or item.title,
+        url=item.url,
+        cover_url=item.cover_url,
+        stars=likes if likes is not None else item.stars,
+        views=views if views is not None else item.views,
+        meta=meta,
+    )
+
+
+async def enrich_items(
+    http: HttpService,
+    items: list[HotItem],
+    merge: DetailMerger,
+    *,
+    proxy: str,
+    headers: dict[str, str] | None = None,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    cache_ttl: float = 0,
+    parser: ParseExecutor | None = None,
+    until: EnoughPredicate | None = None,
+    stats: DetailStatsCache | None = None,
+    stats_ttl: float = 0,
+) -> list[HotItem]:
+    """Fetch detail pages concurrently and merge their stats into `items`.
+
+    At most `per_host_limit` detail requests run against the same host at a
+    time. Output order matches input order; an item whose detail page fails to
+    download or parse is returned unchanged. `cache_ttl` is forwarded to
+    `HttpService.get_text` so detail pages can be served from the HTTP cache.
+    When `parser` is given, `merge` runs on it instead of the event loop.
+    `until` lets a source stop each download once the part of the page its
+    merger reads has arrived. With `stats`, items enriched less than
+    `stats_ttl` seconds ago are answered from the stats cache without a
+    request, and fresh results are stored back.
+    """
+
+    if not items:
+        return []
+
+    per_host_limit = max(1, int(per_host_limit))
+    limiters: dict[str, asyncio.Semaphore] = {}
+
+    def _limiter(url: str) -> asyncio.Semaphore:
+        host = (urlparse(url).hostname or "").lower()
+        sem = limiters.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(per_host_limit)
+            limiters[host] = sem
+        return sem
+
+    async def _one(it: HotItem) -> HotItem:
+        if stats is not None:
+            cached = await stats.get(it.url, stats_ttl)
+            if cached is not None:
+                return merge_detail_stats(
+                    it, cached.stars, cached.views, cached.meta, title=cached.title
+                )
+        out = await _fetch(it)
+        if stats is not None and stats_ttl > 0 and out is not it:
+            await stats.put(it.url, _stats_delta(it, out))
+        return out
+
+    async def _fetch(it: HotItem) -> HotItem:
+        async with _limiter(it.url):
+            try:
+                html = await http.get_text(
+                    it.url,
+                    proxy=proxy,
+                    headers=headers,
+                    cache_ttl=cache_ttl,
+                    until=until,
+                )
+            except Exception:
+                return it
+        try:
+            if parser is not None:
+                return await parser.run(merge, it, html, label=it.source)
+            return merge(it, html)
+        except Exception:
+            return it
+
+    out = list(await asyncio.gather(*(_one(it) for it in items)))
+    if stats is not None:
+        await stats.save()
+    return out
+
+
+def _stats_delta(item: HotItem, enriched: HotItem) -> DetailStatsEntry:
+    """What `enriched` adds on top of `item`, to be layered onto later items."""
+
+    before = item.meta if isinstance(item.meta, dict) else {}
+    after = enriched.meta if isinstance(enriched.meta, dict) else {}
+    return DetailStatsEntry(
+        stored_at=time.time(),
+        title=enriched.title if enriched.title != item.title else "",
+        stars=enriched.stars if enriched.stars != item.stars else None,
+        views=enriched.views if enriched.views != item.views else None,
+        meta={k: v for k, v in after.items() if k not in before or before[k] != v},
+    )
@@ -4,8 +4,6 @@ import html as _html
 import re
 from urllib.parse import parse_qs, urljoin, urlparse
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
@@ -37,9 +35,45 @@ class HanimeSource(BaseSource):
         html = await self._http.get_text(
             self._SEARCH_URL, proxy=proxy, headers=self._HEADERS
         )
-        soup = BeautifulSoup(html or "", "html.parser")
+        cards = await self._parse(self._parse_cards, html)
 
         items: list[HotItem] = []
+        for full_url, title, thumb in cards:
+            views = None
+            stars = None
+            try:
+                detail = await self._http.get_text(
+                    full_url, proxy=proxy, headers=self._HEADERS
+                )
+                views = self._extract_views(detail)
+                stars = self._extract_stars(detail)
+                if title.startswith("Video "):
+                    title = self._extract_detail_title(detail) or title
+                if not thumb:
+                    thumb = self._extract_detail_thumb(detail) or thumb
+            except Exception:
+                pass
+
+            items.append(
+                HotItem(
+                    source=self.source_id,
+                    section=section,
+                    title=title,
+                    url=full_url,
+                    cover_url=thumb,
+                    stars=stars,
+                    views=views,
+                )
+            )
+            if len(items) >= limit:
+                break
+
+        return items
+
+    def _parse_cards(self, html: str) -> list[tuple[str, str, str]]:
+        soup = self._soup(html)
+
+        cards: list[tuple[str, str, str]] = []
         seen: set[str] = set()
 
         for a in soup.select('a.video-link[href*="watch?v="]'):
@@ -72,36 +106,8 @@ class HanimeSource(BaseSource):
             if thumb and not thumb.startswith("http"):
                 thumb = urljoin(self._BASE_URL, thumb)
 
-            views = None
-            stars = None
-            try:
-                detail = await self._http.get_text(
-                    full_url, proxy=proxy, headers=self._HEADERS
-                )
-                views = self._extract_views(detail)
-                stars = self._extract_stars(detail)
-                if title.startswith("Video "):
-                    title = self._extract_detail_title(detail) or title
-                if not thumb:
-                    thumb = self._extract_detail_thumb(detail) or thumb
-            except Exception:
-                pass
-
-            items.append(
-                HotItem(
-                    source=self.source_id,
-                    section=section,
-                    title=title,
-                    url=full_url,
-                    cover_url=thumb,
-                    stars=stars,
-                    views=views,
-                )
-            )
-            if len(items) >= limit:
-                break
-
-        return items
+            cards.append((full_url, title, thumb))
+        return cards
 
     @staticmethod
     def _extract_thumbnail_for_id(html: str, video_id: str) -> str:
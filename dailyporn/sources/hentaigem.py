@@ -6,16 +6,17 @@ import io
 import json
 import random
 import re
+from datetime import datetime
 from typing import Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 from PIL import Image, ImageDraw
 
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int, parse_percent_int
-from .base import BaseSource
+from .base import BaseSource, IncompletePoolError
+from .enrich import enrich_items, merge_detail_stats
 
 
 class HentaiGemSource(BaseSource):
@@ -35,9 +36,24 @@ class HentaiGemSource(BaseSource):
             return []
 
         url = f"{self._ROOT_URL}/top-rated/"
-        try:
-            html = await self._http.get_text(url, proxy=proxy)
-        except Exception:
+        offline = False
+
+        async def _load() -> list[HotItem]:
+            nonlocal offline
+            try:
+                html = await self._http.get_text(url, proxy=proxy)
+            except Exception:
+                offline = True
+                return []
+            html, filtered = await self._apply_today_filter(html, url, proxy=proxy)
+            items = await self._parse(self._parse_list, html, section)
+            if not filtered:
+                # The unfiltered list is not today's ranking; use it this once.
+                raise IncompletePoolError(items)
+            return items
+
+        items = await self._candidate_pool(f"today/{datetime.now():%Y-%m-%d}", _load)
+        if offline:
             return [
                 HotItem(
                     source=self.source_id,
@@ -50,8 +66,25 @@ class HentaiGemSource(BaseSource):
                     meta={"duration": "", "rating": None, "rating_percent": None},
                 )
             ][:limit]
-        html = await self._apply_today_filter(html, url, proxy=proxy)
-        soup = BeautifulSoup(html, "html.parser")
+        if not items:
+            return items
+
+        if len(items) > limit:
+            items = random.sample(items, k=limit)
+
+        return await enrich_items(
+            self._http,
+            items,
+            self._merge_detail,
+            proxy=proxy,
+            cache_ttl=self.detail_cache_ttl_sec,
+            parser=self._parser,
+            stats=self._stats,
+            stats_ttl=self.detail_stats_ttl_sec,
+        )
+
+    def _parse_list(self, html: str, section: str) -> list[HotItem]:
+        soup = self._soup(html)
 
         items: list[HotItem] = []
         seen_ids: set[str] = set()
@@ -121,48 +154,56 @@ class HentaiGemSource(BaseSource):
                     },
                 )
             )
-        if not items:
-            return items
+        return items
 
-        if len(items) > limit:
-            items = random.sample(items, k=limit)
+    async def _apply_today_filter(
+        self, html: str, base_url: str, *, proxy: str
+    ) -> tuple[str, bool]:
+        """Return the "today" list and whether the filter was applied.
+
+        When the filtered ajax block cannot be loaded the unfiltered `html`
+        is returned, flagged as not filtered.
+        """
 
-        enriched: list[HotItem] = []
-        for it in items:
+        target = await self._parse(self._today_filter_params, html)
+        if target is None:
+            return html, True
+        params, block_id = target
+
+        query = self._params_to_query(params)
+        ajax_url = f"{base_url}?mode=async&function=get_block&block_id={block_id}"
+        if query:
+            ajax_url += "&" + query
+
+        try:
+            resp = await self._http.get_text(ajax_url, proxy=proxy)
+        except Exception:
+            return html, False
+
+        payload = resp
+        if resp.lstrip().startswith("{"):
             try:
-                detail_html = await self._http.get_text(it.url, proxy=proxy)
+                data = json.loads(resp)
             except Exception:
-                enriched.append(it)
-                continue
+                data = None
+            if isinstance(data, dict):
+                payload = data.get("html") or data.get("data") or resp
 
-            views, likes, extra_meta = self._parse_detail_stats(detail_html)
-            meta = dict(it.meta) if isinstance(it.meta, dict) else {}
-            meta.update(extra_meta)
+        if not payload:
+            return html, False
+        return payload, True
 
-            enriched.append(
-                HotItem(
-                    source=it.source,
-                    section=it.section,
-                    title=it.title,
-                    url=it.url,
-                    cover_url=it.cover_url,
-                    views=views if views is not None else it.views,
-                    stars=likes if likes is not None else it.stars,
-                    meta=meta,
-                )
-            )
-
-        return enriched
+    def _today_filter_params(self, html: str) -> tuple[str, str] | None:
+        """Return (params, block_id) for the "today" sort, or None if not needed."""
 
-    async def _apply_today_filter(self, html: str, base_url: str, *, proxy: str) -> str:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
         sort = soup.select_one(".sort")
         if not sort:
-            return html
+            return None
 
         strong = sort.find("strong")
         if strong and "today" in strong.get_text(" ", strip=True).lower():
-            return html
+            return None
 
         today_link = None
         for link in sort.find_all("a"):
@@ -178,26 +219,7 @@ class HentaiGemSource(BaseSource):
             params = "sort_by:rating_today"
         if not block_id:
             block_id = "list_videos_common_videos_list"
-        query = self._params_to_query(params)
-        ajax_url = f"{base_url}?mode=async&function=get_block&block_id={block_id}"
-        if query:
-            ajax_url += "&" + query
-
-        try:
-            resp = await self._http.get_text(ajax_url, proxy=proxy)
-        except Exception:
-            return html
-
-        payload = resp
-        if resp.lstrip().startswith("{"):
-            try:
-                data = json.loads(resp)
-            except Exception:
-                data = None
-            if isinstance(data, dict):
-                payload = data.get("html") or data.get("data") or resp
-
-        return payload or html
+        return params, block_id
 
     @staticmethod
     def _params_to_query(params: str) -> str:
@@ -217,10 +239,14 @@ class HentaiGemSource(BaseSource):
             query_parts.append(f"{key}={value}")
         return "&".join(query_parts)
 
+    def _merge_detail(self, item: HotItem, html: str) -> HotItem:
+        views, likes, extra_meta = self._parse_detail_stats(html)
+        return merge_detail_stats(item, likes, views, extra_meta)
+
     def _parse_detail_stats(
         self, html: str
     ) -> tuple[int | None, int | None, dict[str, object]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
 
         views = None
         duration = ""
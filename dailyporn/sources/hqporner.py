@@ -39,13 +39,15 @@ class HQPornerSource(BaseSource):
             return []
 
         html = await self._fetch_first(proxy)
-        items = parse_tube_list(
+        items = await self._parse(
+            parse_tube_list,
             html,
             base_url=self._BASE_URL,
             source_id=self.source_id,
             section=section,
             link_patterns=self._LINK_PATTERNS,
             limit=limit,
+            backend=self._html_backend,
         )
         if not items:
             return items
@@ -63,16 +65,3 @@ class HQPornerSource(BaseSource):
             )
             for it in items
         ]
-
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
@@ -7,12 +7,16 @@ import time
 from typing import Any
 from urllib.parse import quote, urljoin
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from .base import BaseSource
-from .tube_common import extract_counts, extract_img_url, extract_title
+from .tube_common import (
+    TextLengthIndex,
+    extract_counts,
+    extract_img_url,
+    extract_title,
+    pick_container,
+)
 
 
 class MissAVSource(BaseSource):
@@ -74,77 +78,69 @@ class MissAVSource(BaseSource):
                 except Exception:
                     continue
 
-                soup = BeautifulSoup(html or "", "html.parser")
-                items: list[HotItem] = []
-                seen: set[str] = set()
-
-                for a in soup.find_all("a", href=True):
-                    href = (a.get("href") or "").strip()
-                    if not href:
-                        continue
-
-                    href_path = href
-                    if href_path.startswith(base):
-                        href_path = href_path[len(base) :]
-                    if not href_path.startswith("/"):
-                        continue
-                    if not self._RE_VIDEO.match(href_path):
-                        continue
-
-                    full_url = urljoin(base, href_path)
-                    if full_url in seen:
-                        continue
-                    seen.add(full_url)
-
-                    best = None
-                    best_len = -1
-                    cur = a
-                    for _ in range(6):
-                        cur = getattr(cur, "parent", None)
-                        if cur is None:
-                            break
-                        name = getattr(cur, "name", "")
-                        if name in {"html", "body"}:
-                            break
-                        if name not in {"article", "div", "li", "section"}:
-                            continue
-                        txt = cur.get_text(" ", strip=True)
-                        if len(txt) > best_len:
-                            best = cur
-                            best_len = len(txt)
-
-                    container = best or a.parent
-                    img = (
-                        a.find("img")
-                        or (container.find("img") if container else None)
-                        or a.find("source")
-                        or (container.find("source") if container else None)
-                    )
-
-                    title = extract_title(a, img) or full_url
-                    cover = extract_img_url(img)
-                    if cover and not cover.startswith("http"):
-                        cover = urljoin(base, cover)
-
-                    text = container.get_text(" ", strip=True) if container else ""
-                    stars, views = extract_counts(text)
-
-                    items.append(
-                        HotItem(
-                            source=self.source_id,
-                            section="real",
-                            title=title,
-                            url=full_url,
-                            cover_url=cover,
-                            stars=stars,
-                            views=views,
-                        )
-                    )
-                    if len(items) >= limit:
-                        return items
+                items = await self._parse(
+                    self._parse_scrape_page, html, base=base, limit=limit
+                )
+                if len(items) >= limit:
+                    return items
 
         return []
 
+    def _parse_scrape_page(self, html: str, *, base: str, limit: int) -> list[HotItem]:
+        soup = self._soup(html)
+        lengths = TextLengthIndex()
+        items: list[HotItem] = []
+        seen: set[str] = set()
+
+        for a in soup.find_all("a", href=True):
+            href = (a.get("href") or "").strip()
+            if not href:
+                continue
+
+            href_path = href
+            if href_path.startswith(base):
+                href_path = href_path[len(base) :]
+            if not href_path.startswith("/"):
+                continue
+            if not self._RE_VIDEO.match(href_path):
+                continue
+
+            full_url = urljoin(base, href_path)
+            if full_url in seen:
+                continue
+            seen.add(full_url)
+
+            container = pick_container(a, lengths)
+            img = (
+                a.find("img")
+                or (container.find("img") if container else None)
+                or a.find("source")
+                or (container.find("source") if container else None)
+            )
+
+            title = extract_title(a, img) or full_url
+            cover = extract_img_url(img)
+            if cover and not cover.startswith("http"):
+                cover = urljoin(base, cover)
+
+            text = container.get_text(" ", strip=True) if container else ""
+            stars, views = extract_counts(text)
+
+            items.append(
+                HotItem(
+                    source=self.source_id,
+                    section="real",
+                    title=title,
+                    url=full_url,
+                    cover_url=cover,
+                    stars=stars,
+                    views=views,
+                )
+            )
+            if len(items) >= limit:
+                return items
+        return items
+
     async def _fetch_hot_recombee(self, *, limit: int, proxy: str) -> list[HotItem]:
         path = f"/recomms/users/{quote('anonymous', safe='')}/items/"
         body: dict[str, Any] = {
@@ -198,8 +194,7 @@ class MissAVSource(BaseSource):
                     detail_html = await self._http.get_text(
                         detail_url, proxy=proxy, headers=self._HEADERS
                     )
-                    soup = BeautifulSoup(detail_html or "", "html.parser")
-                    s = soup.get_text(" ", strip=True)
+                    s = await self._parse(self._page_text, detail_html)
                     stars, views = extract_counts(s)
                     if stars is not None and views is not None:
                         page_url = detail_url
@@ -224,6 +219,9 @@ class MissAVSource(BaseSource):
 
         return items
 
+    def _page_text(self, html: str) -> str:
+        return self._soup(html).get_text(" ", strip=True)
+
     def _sign_path(self, path: str) -> str:
         ts = int(time.time())
         unsigned = f"/{self._DATABASE_ID}{path}"
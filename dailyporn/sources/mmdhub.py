@@ -4,8 +4,6 @@ import html as _html
 import re
 from urllib.parse import quote, urljoin
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
@@ -73,71 +71,9 @@ class MmdHubSource(BaseSource):
             except Exception:
                 continue
 
-            soup = BeautifulSoup(html or "", "html.parser")
-
-            title = ""
-            meta_title = soup.find("meta", attrs={"property": "og:title"})
-            if meta_title and meta_title.get("content"):
-                title = str(meta_title.get("content") or "")
-            if not title:
-                h1 = soup.find("h1")
-                if h1:
-                    title = h1.get_text(" ", strip=True)
-            if not title:
-                t = soup.find("title")
-                if t:
-                    title = t.get_text(" ", strip=True)
-            title = (
-                _html.unescape(title or slug)
-                .replace(" - MMDHub", "")
-                .replace(" | MMDHub", "")
-                .strip()
-            )
-
-            thumb = ""
-            og_img = soup.find("meta", attrs={"property": "og:image"})
-            if og_img and og_img.get("content"):
-                thumb = str(og_img.get("content") or "").strip()
-            if thumb and not thumb.startswith("http"):
-                thumb = urljoin(self._ROOT_URL, thumb)
-
-            views = None
-            views_el = soup.find(id="video-views-count")
-            if views_el:
-                views = parse_compact_int(views_el.get_text(" ", strip=True))
-            if views is None:
-                views = parse_compact_int(self._extract_first(html, [self._RE_VIEWS]))
-
-            likes = None
-            dislikes = None
-            likes_bar = soup.find(id="likes-bar")
-            if likes_bar:
-                likes = parse_compact_int(str(likes_bar.get("data-likes") or ""))
-                dislikes = parse_compact_int(str(likes_bar.get("data-dislikes") or ""))
-            if likes is None:
-                likes = parse_compact_int(self._extract_first(html, [self._RE_LIKES_DATA]))
-            if dislikes is None:
-                dislikes = parse_compact_int(
-                    self._extract_first(html, [self._RE_DISLIKES_DATA])
-                )
-
-            meta: dict[str, object] = {}
-            if dislikes is not None:
-                meta["dislikes"] = dislikes
-            published_on = self._extract_first(html, [self._RE_PUBLISHED_ON])
-            if published_on:
-                meta["published_on"] = published_on
-
             items.append(
-                HotItem(
-                    source=self.source_id,
-                    section=section,
-                    title=title,
-                    url=url,
-                    cover_url=thumb,
-                    stars=likes,
-                    views=views,
-                    meta=meta,
+                await self._parse(
+                    self._parse_watch_page, html, url=url, slug=slug, section=section
                 )
             )
             if len(items) >= limit:
@@ -145,6 +81,75 @@ class MmdHubSource(BaseSource):
 
         return items
 
+    def _parse_watch_page(
+        self, html: str, *, url: str, slug: str, section: str
+    ) -> HotItem:
+        soup = self._soup(html)
+
+        title = ""
+        meta_title = soup.find("meta", attrs={"property": "og:title"})
+        if meta_title and meta_title.get("content"):
+            title = str(meta_title.get("content") or "")
+        if not title:
+            h1 = soup.find("h1")
+            if h1:
+                title = h1.get_text(" ", strip=True)
+        if not title:
+            t = soup.find("title")
+            if t:
+                title = t.get_text(" ", strip=True)
+        title = (
+            _html.unescape(title or slug)
+            .replace(" - MMDHub", "")
+            .replace(" | MMDHub", "")
+            .strip()
+        )
+
+        thumb = ""
+        og_img = soup.find("meta", attrs={"property": "og:image"})
+        if og_img and og_img.get("content"):
+            thumb = str(og_img.get("content") or "").strip()
+        if thumb and not thumb.startswith("http"):
+            thumb = urljoin(self._ROOT_URL, thumb)
+
+        views = None
+        views_el = soup.find(id="video-views-count")
+        if views_el:
+            views = parse_compact_int(views_el.get_text(" ", strip=True))
+        if views is None:
+            views = parse_compact_int(self._extract_first(html, [self._RE_VIEWS]))
+
+        likes = None
+        dislikes = None
+        likes_bar = soup.find(id="likes-bar")
+        if likes_bar:
+            likes = parse_compact_int(str(likes_bar.get("data-likes") or ""))
+            dislikes = parse_compact_int(str(likes_bar.get("data-dislikes") or ""))
+        if likes is None:
+            likes = parse_compact_int(self._extract_first(html, [self._RE_LIKES_DATA]))
+        if dislikes is None:
+            dislikes = parse_compact_int(
+                self._extract_first(html, [self._RE_DISLIKES_DATA])
+            )
+
+        meta: dict[str, object] = {}
+        if dislikes is not None:
+            meta["dislikes"] = dislikes
+        published_on = self._extract_first(html, [self._RE_PUBLISHED_ON])
+        if published_on:
+            meta["published_on"] = published_on
+
+        return HotItem(
+            source=self.source_id,
+            section=section,
+            title=title,
+            url=url,
+            cover_url=thumb,
+            stars=likes,
+            views=views,
+            meta=meta,
+        )
+
     @staticmethod
     def _extract_first(content: str, patterns: list[re.Pattern[str]]) -> str | None:
         for p in patterns:
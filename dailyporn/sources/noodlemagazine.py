@@ -4,8 +4,6 @@ import random
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
@@ -35,44 +33,10 @@ class NoodleMagazineSource(BaseSource):
             return []
 
         html = await self._http.get_text(self._HOT_URL, proxy=proxy)
-        soup = BeautifulSoup(html or "", "html.parser")
+        cards = await self._parse(self._parse_cards, html)
 
         items: list[HotItem] = []
-        seen: set[str] = set()
-
-        for a in soup.select('a.item_link[href^="/watch/"]'):
-            href = (a.get("href") or "").strip()
-            if not href.startswith("/watch/"):
-                continue
-
-            full_url = urljoin(self._ROOT_URL, href)
-            if full_url in seen:
-                continue
-            seen.add(full_url)
-
-            img = a.find("img")
-            cover = extract_img_url(img)
-            if cover and cover.startswith("//"):
-                cover = "https:" + cover
-            if cover and cover.startswith("/"):
-                cover = urljoin(self._ROOT_URL, cover)
-
-            title = extract_title(a, img) or href.replace("/watch/", "")
-
-            card = a.find_parent("div", class_="item") or a.parent
-
-            views = None
-            duration = ""
-
-            views_el = card.select_one(".m_views") if card else None
-            if views_el:
-                views = parse_compact_int(views_el.get_text(" ", strip=True))
-
-            time_el = card.select_one(".m_time") if card else None
-            if time_el:
-                m = self._RE_DURATION.search(time_el.get_text(" ", strip=True))
-                duration = (m.group(1) if m else "").strip()
-
+        for full_url, cover, title, views, duration in cards[: max(limit * 6, limit)]:
             likes = None
             dislikes = None
 
@@ -83,34 +47,9 @@ class NoodleMagazineSource(BaseSource):
                 detail = ""
 
             if detail:
-                detail_soup = BeautifulSoup(detail, "html.parser")
-                views_el = detail_soup.select_one(".h_info .meta span")
-                if views_el:
-                    views = parse_compact_int(views_el.get_text(" ", strip=True))
-
-                likes_el = detail_soup.select_one(".h_info .actions a.like span")
-                if likes_el:
-                    likes = parse_compact_int(likes_el.get_text(" ", strip=True))
-
-                dislikes_el = detail_soup.select_one(
-                    ".h_info .actions a.dislike span"
+                views, likes, dislikes = await self._parse(
+                    self._parse_detail, detail, views=views
                 )
-                if dislikes_el:
-                    dislikes = parse_compact_int(dislikes_el.get_text(" ", strip=True))
-
-                t = " ".join(detail_soup.get_text(" ").split())
-                if likes is None:
-                    likes = parse_compact_int(
-                        self._extract_first(t, [self._RE_LIKE_BLOCK])
-                    )
-                if dislikes is None:
-                    dislikes = parse_compact_int(
-                        self._extract_first(t, [self._RE_DISLIKE_BLOCK])
-                    )
-                if views is None:
-                    views = parse_compact_int(
-                        self._extract_first(t, [self._RE_VIEWS_TEXT])
-                    )
 
             meta: dict[str, object] = {}
             if duration:
@@ -130,8 +69,6 @@ class NoodleMagazineSource(BaseSource):
                     meta=meta,
                 )
             )
-            if len(items) >= max(limit * 6, limit):
-                break
 
         if not items:
             return items
@@ -141,6 +78,81 @@ class NoodleMagazineSource(BaseSource):
 
         return items
 
+    def _parse_cards(
+        self, html: str
+    ) -> list[tuple[str, str, str, int | None, str]]:
+        soup = self._soup(html)
+
+        cards: list[tuple[str, str, str, int | None, str]] = []
+        seen: set[str] = set()
+
+        for a in soup.select('a.item_link[href^="/watch/"]'):
+            href = (a.get("href") or "").strip()
+            if not href.startswith("/watch/"):
+                continue
+
+            full_url = urljoin(self._ROOT_URL, href)
+            if full_url in seen:
+                continue
+            seen.add(full_url)
+
+            img = a.find("img")
+            cover = extract_img_url(img)
+            if cover and cover.startswith("//"):
+                cover = "https:" + cover
+            if cover and cover.startswith("/"):
+                cover = urljoin(self._ROOT_URL, cover)
+
+            title = extract_title(a, img) or href.replace("/watch/", "")
+
+            card = a.find_parent("div", class_="item") or a.parent
+
+            views = None
+            duration = ""
+
+            views_el = card.select_one(".m_views") if card else None
+            if views_el:
+                views = parse_compact_int(views_el.get_text(" ", strip=True))
+
+            time_el = card.select_one(".m_time") if card else None
+            if time_el:
+                m = self._RE_DURATION.search(time_el.get_text(" ", strip=True))
+                duration = (m.group(1) if m else "").strip()
+
+            cards.append((full_url, cover, title, views, duration))
+        return cards
+
+    def _parse_detail(
+        self, detail: str, *, views: int | None
+    ) -> tuple[int | None, int | None, int | None]:
+        likes = None
+        dislikes = None
+
+        detail_soup = self._soup(detail)
+        views_el = detail_soup.select_one(".h_info .meta span")
+        if views_el:
+            views = parse_compact_int(views_el.get_text(" ", strip=True))
+
+        likes_el = detail_soup.select_one(".h_info .actions a.like span")
+        if likes_el:
+            likes = parse_compact_int(likes_el.get_text(" ", strip=True))
+
+        dislikes_el = detail_soup.select_one(".h_info .actions a.dislike span")
+        if dislikes_el:
+            dislikes = parse_compact_int(dislikes_el.get_text(" ", strip=True))
+
+        t = " ".join(detail_soup.get_text(" ").split())
+        if likes is None:
+            likes = parse_compact_int(self._extract_first(t, [self._RE_LIKE_BLOCK]))
+        if dislikes is None:
+            dislikes = parse_compact_int(
+                self._extract_first(t, [self._RE_DISLIKE_BLOCK])
+            )
+        if views is None:
+            views = parse_compact_int(self._extract_first(t, [self._RE_VIEWS_TEXT]))
+
+        return views, likes, dislikes
+
     @staticmethod
     def _extract_first(content: str, patterns: list[re.Pattern[str]]) -> str | None:
         for p in patterns:
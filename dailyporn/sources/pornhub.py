@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
 from .base import BaseSource
+from .enrich import enrich_items, merge_detail_stats
+from .soup import ParseRegion
 from .tube_common import parse_tube_list
 
 
@@ -16,6 +16,9 @@ class PornhubSource(BaseSource):
     display_name = "PornHub"
     sections = {"real"}
 
+    # Trending counters move quickly; reuse parsed stats for an hour only.
+    detail_stats_ttl_sec = 3600
+
     _BASE_URL = "https://www.pornhub.com"
     _HOT_URLS = [
         f"{_BASE_URL}/video?o=mv",  # most viewed
@@ -50,6 +53,23 @@ class PornhubSource(BaseSource):
         r"(?is)(?:votesDown|dislikeCount|rateDown)[^<]{0,40}>\s*(\d[\d,\.]*[KMB]?)\s*<"
     )
 
+    # Everything _parse_detail_stats selects; regex fallbacks read the raw page.
+    _DETAIL_REGION = ParseRegion(
+        classes=("views", "votesUp", "votesDown"),
+        attrs=frozenset(
+            {
+                "itemprop",
+                "data-video-views",
+                "data-votes-up",
+                "data-video-votes-up",
+                "data-likes",
+                "data-votes-down",
+                "data-video-votes-down",
+                "data-dislikes",
+            }
+        ),
+    )
+
     def __init__(self, http: HttpService):
         self._http = http
 
@@ -58,13 +78,15 @@ class PornhubSource(BaseSource):
             return []
 
         html = await self._fetch_first(proxy)
-        items = parse_tube_list(
+        items = await self._parse(
+            parse_tube_list,
             html,
             base_url=self._BASE_URL,
             source_id=self.source_id,
             section=section,
             link_patterns=self._LINK_PATTERNS,
             limit=limit,
+            backend=self._html_backend,
         )
         if not items:
             return items
@@ -72,55 +94,28 @@ class PornhubSource(BaseSource):
         # Enrich with detail-page stats (likes/dislikes/views). The listing pages
         # often omit vote counts or render them via JS, which would otherwise show
         # up as 0 in debug reports.
-        enriched: list[HotItem] = []
-        for it in items:
-            try:
-                detail_html = await self._http.get_text(
-                    it.url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception:
-                enriched.append(it)
-                continue
-
-            likes, views, extra_meta = self._parse_detail_stats(detail_html)
-
-            stars = likes if likes is not None else it.stars
-            v = views if views is not None else it.views
-            meta = dict(it.meta) if isinstance(it.meta, dict) else {}
-            meta.update(extra_meta)
-
-            enriched.append(
-                HotItem(
-                    source=it.source,
-                    section=it.section,
-                    title=it.title,
-                    url=it.url,
-                    cover_url=it.cover_url,
-                    stars=stars,
-                    views=v,
-                    meta=meta,
-                )
-            )
-
-        return enriched
+        return await enrich_items(
+            self._http,
+            items,
+            self._merge_detail,
+            proxy=proxy,
+            headers=self._HEADERS,
+            cache_ttl=self.detail_cache_ttl_sec,
+            parser=self._parser,
+            stats=self._stats,
+            stats_ttl=self.detail_stats_ttl_sec,
+            # The vote counters close the stats block; related videos and
+            # comments follow.
+            until=self._RE_DOM_DISLIKES.search,
+        )
 
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
+    def _merge_detail(self, item: HotItem, html: str) -> HotItem:
+        return merge_detail_stats(item, *self._parse_detail_stats(html))
 
     def _parse_detail_stats(
         self, html: str
     ) -> tuple[int | None, int | None, dict[str, object]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html, self._DETAIL_REGION)
 
         # Views
         views = None
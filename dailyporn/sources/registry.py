@@ -4,7 +4,11 @@ from dataclasses import dataclass
 from typing import Iterable
 
 from ..config import DailyPornConfig
+from ..services.candidate_pools import CandidatePoolCache
+from ..services.detail_stats import DetailStatsCache
 from ..services.http import HttpService
+from ..services.parse_executor import ParseExecutor
+from ..services.source_health import SourceHealthTracker
 from .base import BaseSource
 from .beeg import BeegSource
 from .eporner import EPornerSource
@@ -17,6 +21,7 @@ from .noodlemagazine import NoodleMagazineSource
 from .pornhub import PornhubSource
 from .porntrex import PornTrexSource
 from .sexcom import SexComSource
+from .soup import resolve_html_backend
 from .rule34video import Rule34VideoSource
 from .spankbang import SpankBangSource
 from .three_d_porndude import ThreeDPornDudeSource
@@ -41,9 +46,19 @@ class SourceInfo:
 class SourceRegistry:
     MANUAL_ONLY_SOURCE_IDS = {"hqporner", "missav"}
 
-    def __init__(self, http: HttpService, cfg: DailyPornConfig):
+    def __init__(
+        self,
+        http: HttpService,
+        cfg: DailyPornConfig,
+        *,
+        parser: ParseExecutor | None = None,
+        health: SourceHealthTracker | None = None,
+        pools: CandidatePoolCache | None = None,
+        stats: DetailStatsCache | None = None,
+    ):
         self._http = http
         self._cfg = cfg
+        self.health = health or SourceHealthTracker(failure_threshold=0)
         self._sources: dict[str, BaseSource] = {
             "3dporn": ThreeDPornSource(http),
             "3dporndude": ThreeDPornDudeSource(http),
@@ -68,6 +83,16 @@ class SourceRegistry:
             "xview": XViewSource(http),
             "xxxgfporn": XXXGFPornSource(http),
         }
+        html_backend = resolve_html_backend(cfg.html_parser_backend)
+        for src in self._sources.values():
+            src.use_html_backend(html_backend)
+            src.use_hedge_delay(cfg.fetch_hedge_delay_ms / 1000)
+            if parser is not None:
+                src.bind_parser(parser)
+            if pools is not None:
+                src.bind_pool_cache(pools)
+            if stats is not None:
+                src.bind_stats_cache(stats)
 
     def list_sources(self) -> list[SourceInfo]:
         out: list[SourceInfo] = []
@@ -90,6 +115,9 @@ class SourceRegistry:
                 continue
             if not self._cfg.is_source_enabled(sid):
                 continue
+            # Checked last: letting a half-open source through uses its probe.
+            if not self.health.allow(sid):
+                continue
             yield src
 
     def iter_all_sources(self) -> Iterable[BaseSource]:
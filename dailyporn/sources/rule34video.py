@@ -2,14 +2,13 @@ import html as _html
 import json
 import random
 import re
+from datetime import datetime
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
-from .base import BaseSource
+from .base import BaseSource, IncompletePoolError
 
 
 class Rule34VideoSource(BaseSource):
@@ -60,13 +59,28 @@ class Rule34VideoSource(BaseSource):
         if section not in self.sections:
             return []
 
-        html = await self._fetch_top_rated_list(proxy=proxy)
-
-        urls: list[str] = []
-        for full_path, _video_id in self._RE_VIDEO_LINK.findall(html):
-            url = urljoin(self._ROOT_URL, full_path)
-            if url not in urls:
-                urls.append(url)
+        async def _load() -> list[HotItem]:
+            html, ranked = await self._fetch_top_rated_list(proxy=proxy)
+            urls: list[str] = []
+            for full_path, _video_id in self._RE_VIDEO_LINK.findall(html):
+                url = urljoin(self._ROOT_URL, full_path)
+                if url not in urls:
+                    urls.append(url)
+            # The listing only yields links; titles and stats come from the
+            # video page of the sampled candidates.
+            items = [
+                HotItem(source=self.source_id, section=section, title="", url=url)
+                for url in urls
+            ]
+            if not ranked:
+                # Homepage links stand in for the ranking; use them this once.
+                raise IncompletePoolError(items)
+            return items
+
+        pool = await self._candidate_pool(
+            f"top-rated/{datetime.now():%Y-%m-%d}", _load
+        )
+        urls = [it.url for it in pool]
         if len(urls) > limit:
             urls = random.sample(urls, k=limit)
 
@@ -77,41 +91,9 @@ class Rule34VideoSource(BaseSource):
             except Exception:
                 continue
 
-            title = (
-                self._extract_first(page, [self._RE_TITLE_H1, self._RE_TITLE])
-                or "Untitled"
-            )
-            title = _html.unescape(title).strip()
-
-            thumb = (
-                self._extract_first(
-                    page,
-                    [
-                        self._RE_THUMB_OG,
-                        self._RE_THUMB_TW,
-                        self._RE_THUMBNAIL_URL,
-                        self._RE_THUMB_SCREENS,
-                        self._RE_THUMB_POSTER,
-                    ],
-                )
-                or ""
-            )
-            thumb = thumb.replace("\\/", "/")
-            if thumb and not thumb.startswith("http"):
-                thumb = urljoin(self._ROOT_URL, thumb)
-
-            likes, views, meta = self._parse_detail_stats(page)
-
             items.append(
-                HotItem(
-                    source=self.source_id,
-                    section=section,
-                    title=title,
-                    url=url,
-                    cover_url=thumb,
-                    stars=likes,
-                    views=views,
-                    meta=meta,
+                await self._parse(
+                    self._parse_video_page, page, url=url, section=section
                 )
             )
             if len(items) >= limit:
@@ -119,26 +101,57 @@ class Rule34VideoSource(BaseSource):
 
         return items
 
-    async def _fetch_top_rated_list(self, *, proxy: str) -> str:
+    def _parse_video_page(self, page: str, *, url: str, section: str) -> HotItem:
+        title = (
+            self._extract_first(page, [self._RE_TITLE_H1, self._RE_TITLE])
+            or "Untitled"
+        )
+        title = _html.unescape(title).strip()
+
+        thumb = (
+            self._extract_first(
+                page,
+                [
+                    self._RE_THUMB_OG,
+                    self._RE_THUMB_TW,
+                    self._RE_THUMBNAIL_URL,
+                    self._RE_THUMB_SCREENS,
+                    self._RE_THUMB_POSTER,
+                ],
+            )
+            or ""
+        )
+        thumb = thumb.replace("\\/", "/")
+        if thumb and not thumb.startswith("http"):
+            thumb = urljoin(self._ROOT_URL, thumb)
+
+        likes, views, meta = self._parse_detail_stats(page)
+
+        return HotItem(
+            source=self.source_id,
+            section=section,
+            title=title,
+            url=url,
+            cover_url=thumb,
+            stars=likes,
+            views=views,
+            meta=meta,
+        )
+
+    async def _fetch_top_rated_list(self, *, proxy: str) -> tuple[str, bool]:
+        """Return the top-rated block and whether it is the real ranking.
+
+        When the sorted ajax block cannot be loaded the homepage is returned
+        instead, flagged as not ranked.
+        """
+
         base_url = f"{self._ROOT_URL}/"
         try:
             html = await self._http.get_text(base_url, proxy=proxy)
         except Exception:
-            return ""
+            return "", True
 
-        soup = BeautifulSoup(html or "", "html.parser")
-        link = soup.select_one(
-            "a[data-action='ajax'][data-parameters*='sort_by:rating']"
-        )
-        params = ""
-        block_id = ""
-        if link:
-            params = (link.get("data-parameters") or "").strip()
-            block_id = (link.get("data-block-id") or "").strip()
-        if not block_id:
-            block_id = "custom_list_videos_most_recent_videos"
-        if not params:
-            params = "sort_by:rating"
+        params, block_id = await self._parse(self._rating_sort_params, html)
 
         ajax_url = f"{base_url}?mode=async&function=get_block&block_id={block_id}"
         query = self._params_to_query(params)
@@ -148,7 +161,7 @@ class Rule34VideoSource(BaseSource):
         try:
             resp = await self._http.get_text(ajax_url, proxy=proxy)
         except Exception:
-            return html
+            return html, False
 
         payload = resp
         if resp.lstrip().startswith("{"):
@@ -159,12 +172,14 @@ class Rule34VideoSource(BaseSource):
             if isinstance(data, dict):
                 payload = data.get("html") or data.get("data") or resp
 
-        return payload or html
+        if not payload:
+            return html, False
+        return payload, True
 
     def _parse_detail_stats(
         self, html: str
     ) -> tuple[int | None, int | None, dict[str, object]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
 
         views = None
         info = soup.select_one("div.info")
@@ -212,6 +227,22 @@ class Rule34VideoSource(BaseSource):
                 return (m.group(1) or "").strip()
         return None
 
+    def _rating_sort_params(self, html: str) -> tuple[str, str]:
+        soup = self._soup(html)
+        link = soup.select_one(
+            "a[data-action='ajax'][data-parameters*='sort_by:rating']"
+        )
+        params = ""
+        block_id = ""
+        if link:
+            params = (link.get("data-parameters") or "").strip()
+            block_id = (link.get("data-block-id") or "").strip()
+        if not block_id:
+            block_id = "custom_list_videos_most_recent_videos"
+        if not params:
+            params = "sort_by:rating"
+        return params, block_id
+
     @staticmethod
     def _params_to_query(params: str) -> str:
         if not params:
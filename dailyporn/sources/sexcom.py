@@ -3,8 +3,6 @@ from __future__ import annotations
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
@@ -32,7 +30,10 @@ class SexComSource(BaseSource):
             return []
 
         html = await self._http.get_text(self._HOT_URL, proxy=proxy)
-        soup = BeautifulSoup(html or "", "html.parser")
+        return await self._parse(self._parse_list, html, limit=limit, section=section)
+
+    def _parse_list(self, html: str, *, limit: int, section: str) -> list[HotItem]:
+        soup = self._soup(html)
 
         items: list[HotItem] = []
         seen: set[str] = set()
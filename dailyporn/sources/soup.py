@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import importlib.util
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from astrbot.api import logger
+
+# Sources only use the BeautifulSoup API (select/select_one/find/find_all/
+# find_parent/get_text/attribute access), so a backend is just the tree
+# builder BeautifulSoup runs on top of.
+HTML_BACKENDS = ("auto", "lxml", "html.parser")
+DEFAULT_HTML_BACKEND = "html.parser"
+
+
+@lru_cache(maxsize=None)
+def _lxml_available() -> bool:
+    return importlib.util.find_spec("lxml") is not None
+
+
+def resolve_html_backend(name: str) -> str:
+    """Map a configured backend name to an installed BeautifulSoup builder."""
+
+    name = (name or "auto").strip().lower()
+    if name in {"auto", "lxml"}:
+        if _lxml_available():
+            return "lxml"
+        if name == "lxml":
+            logger.warning("[dailyporn] lxml is not installed, using html.parser")
+    return DEFAULT_HTML_BACKEND
+
+
+@dataclass(frozen=True)
+class ParseRegion:
+    """The part of a page a parser actually reads.
+
+    Only elements matching one of the rules are built, together with their
+    whole subtree; everything else is skipped by the tree builder. A region
+    must therefore cover every element the parser's selectors can match.
+    `classes` match as substrings of the class attribute, so they also
+    cover `[class*=...]` selectors. `start`/`end` are optional text markers:
+    when `start` is present, only the markup from it up to the end of `end`
+    (or the end of the page) is parsed.
+    """
+
+    names: frozenset[str] = frozenset()
+    ids: frozenset[str] = frozenset()
+    classes: tuple[str, ...] = ()
+    attrs: frozenset[str] = frozenset()
+    start: str = ""
+    end: str = ""
+    _probe: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Every rule needs its name to appear somewhere in the markup, so a
+        # page without any of them can skip tree building entirely.
+        needles = [f"<{n}" for n in self.names]
+        needles += [*self.ids, *self.classes, *self.attrs]
+        probe = "|".join(re.escape(n) for n in needles) or r"(?!)"
+        object.__setattr__(self, "_probe", re.compile(probe, re.IGNORECASE))
+
+    def keeps(self, name: str, attrs: Optional[dict]) -> bool:
+        if name in self.names:
+            return True
+        if not attrs:
+            return False
+        if self.attrs and any(a in attrs for a in self.attrs):
+            return True
+        if self.ids and attrs.get("id") in self.ids:
+            return True
+        if self.classes:
+            cls = attrs.get("class") or ""
+            if not isinstance(cls, str):
+                cls = " ".join(cls)
+            return any(c in cls for c in self.classes)
+        return False
+
+    def slice(self, html: str) -> str:
+        if not self.start:
+            return html
+        i = html.find(self.start)
+        if i < 0:
+            return html
+        if self.end:
+            j = html.find(self.end, i + len(self.start))
+            if j >= 0:
+                return html[i : j + len(self.end)]
+        return html[i:]
+
+    def probe(self, html: str) -> bool:
+        return self._probe.search(html) is not None
+
+
+class _RegionStrainer(SoupStrainer):
+    def __init__(self, region: ParseRegion):
+        super().__init__()
+        self._region = region
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._region.keeps(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs=None):
+        # beautifulsoup4 < 4.13 calls this instead of allow_tag_creation.
+        if self._region.keeps(markup_name, markup_attrs):
+            return markup_name
+        return None
+
+
+def make_soup(
+    html: str,
+    backend: str = DEFAULT_HTML_BACKEND,
+    *,
+    region: Optional[ParseRegion] = None,
+) -> BeautifulSoup:
+    if region is None:
+        return BeautifulSoup(html or "", backend)
+    html = region.slice(html or "")
+    if not region.probe(html):
+        return BeautifulSoup("", backend)
+    return BeautifulSoup(html, backend, parse_only=_RegionStrainer(region))
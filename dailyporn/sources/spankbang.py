@@ -39,30 +39,24 @@ class SpankBangSource(BaseSource):
             return []
 
         html = await self._fetch_first(proxy)
-        return parse_tube_list(
+        return await self._parse(
+            parse_tube_list,
             html,
             base_url=self._BASE_URL,
             source_id=self.source_id,
             section=section,
             link_patterns=self._LINK_PATTERNS,
             limit=limit,
+            backend=self._html_backend,
         )
 
     async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-                continue
-        if last_err:
-            if isinstance(last_err, HttpStatusError) and last_err.status == 403:
+        try:
+            return await super()._fetch_first(proxy)
+        except HttpStatusError as e:
+            if e.status == 403:
                 raise SourceBlockedError(
                     "HTTP 403 (Cloudflare/anti-bot). "
                     "Provide a working proxy in plugin config or disable this source."
                 )
-            raise last_err
-        raise RuntimeError("no url")
+            raise
@@ -2,16 +2,15 @@ from __future__ import annotations
 
 import random
 import re
-from urllib.parse import urljoin
-
-from bs4 import BeautifulSoup
-
+from datetime import datetime
 from typing import Any
+from urllib.parse import urljoin
 
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int, parse_percent_int
 from .base import BaseSource
+from .enrich import enrich_items, merge_detail_stats
 
 
 class ThreeDPornDudeSource(BaseSource):
@@ -49,60 +48,39 @@ class ThreeDPornDudeSource(BaseSource):
         if section not in self.sections:
             return []
 
-        list_html = await self._fetch_first(proxy)
         # Per-source limit is often 1. If we always pick the first list item, users
         # will see the same result repeatedly. Build a candidate pool, then sample.
         limit = max(1, int(limit))
         pool_limit = min(max(limit * 30, 60), 200)
-        items = self._parse_list(list_html, limit=pool_limit, section=section)
+
+        async def _load() -> list[HotItem]:
+            list_html = await self._fetch_first(proxy)
+            return await self._parse(
+                self._parse_list, list_html, limit=pool_limit, section=section
+            )
+
+        items = await self._candidate_pool(
+            f"today/{datetime.now():%Y-%m-%d}/{pool_limit}", _load
+        )
         if len(items) > limit:
             items = random.sample(items, k=limit)
 
         # This site shows rating% on list pages; detail pages contain real
         # like/dislike counts and a more accurate view counter. Prefer detail.
-        enriched: list[HotItem] = []
-        for it in items:
-            try:
-                detail_html = await self._http.get_text(
-                    it.url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception:
-                enriched.append(it)
-                continue
-
-            likes, views, extra_meta = self._parse_detail_stats(detail_html)
-            meta = dict(it.meta) if isinstance(it.meta, dict) else {}
-            meta.update(extra_meta)
-
-            enriched.append(
-                HotItem(
-                    source=it.source,
-                    section=it.section,
-                    title=it.title,
-                    url=it.url,
-                    cover_url=it.cover_url,
-                    stars=likes if likes is not None else it.stars,
-                    views=views if views is not None else it.views,
-                    meta=meta,
-                )
-            )
-        return enriched
-
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
+        return await enrich_items(
+            self._http,
+            items,
+            self._merge_detail,
+            proxy=proxy,
+            headers=self._HEADERS,
+            cache_ttl=self.detail_cache_ttl_sec,
+            parser=self._parser,
+            stats=self._stats,
+            stats_ttl=self.detail_stats_ttl_sec,
+        )
 
     def _parse_list(self, html: str, *, limit: int, section: str) -> list[HotItem]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
         items: list[HotItem] = []
         seen: set[str] = set()
 
@@ -184,10 +162,13 @@ class ThreeDPornDudeSource(BaseSource):
 
         return items
 
+    def _merge_detail(self, item: HotItem, html: str) -> HotItem:
+        return merge_detail_stats(item, *self._parse_detail_stats(html))
+
     def _parse_detail_stats(
         self, html: str
     ) -> tuple[int | None, int | None, dict[str, Any]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
 
         likes: int | None = None
         dislikes: int | None = None
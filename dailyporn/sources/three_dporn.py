@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import random
 import re
 from urllib.parse import quote, urljoin
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int, parse_percent_int
@@ -57,6 +56,9 @@ class ThreeDPornSource(BaseSource):
     )
     _RE_DETAIL_RATING_PERCENT = re.compile(r"(\d{1,3}(?:\.\d+)?)%")
 
+    # Detail pages validated concurrently per wave while looking for video posts.
+    _VALIDATE_WAVE_SIZE = 6
+
     def __init__(self, http: HttpService):
         self._http = http
 
@@ -65,9 +67,98 @@ class ThreeDPornSource(BaseSource):
             return []
 
         html = await self._fetch_first(proxy)
-        soup = BeautifulSoup(html or "", "html.parser")
+        candidates = await self._parse(self._parse_candidates, html)
 
         items: list[HotItem] = []
+        limit = max(1, int(limit))
+        pool_limit = min(max(limit * 30, 60), 200)
+        if len(candidates) > 1:
+            random.shuffle(candidates)
+
+        validated = await self._validate_candidates(
+            candidates[:pool_limit], limit=limit, proxy=proxy
+        )
+        pages: dict[str, str] = {}
+        for cand, detail_html in validated:
+            full_url = str(cand["url"])
+            duration = str(cand["duration"] or "")
+            item = HotItem(
+                source=self.source_id,
+                section=section,
+                title=str(cand["title"] or full_url),
+                url=full_url,
+                cover_url=str(cand["cover_url"] or ""),
+                stars=cand["stars"],
+                views=cand["views"],
+                meta={"duration": duration} if duration else {},
+            )
+            items.append(item)
+            pages[full_url] = detail_html
+
+        # Enrich with server-side stats (views/likes/rating) via WP admin-ajax if available.
+        # The detail page downloaded during validation is reused here.
+        async def _enrich(it: HotItem) -> HotItem:
+            if it.stars is not None and it.views is not None:
+                return it
+            try:
+                return await self._enrich_post_stats(
+                    it, proxy=proxy, html=pages.get(it.url)
+                )
+            except Exception:
+                return it
+
+        return list(await asyncio.gather(*(_enrich(it) for it in items)))
+
+    async def _validate_candidates(
+        self, candidates: list[dict[str, object]], *, limit: int, proxy: str
+    ) -> list[tuple[dict[str, object], str]]:
+        """Return up to `limit` (candidate, detail_html) pairs that are video pages.
+
+        Candidates are checked in concurrent waves. Results keep candidate order,
+        and a wave is cut short (outstanding requests cancelled) as soon as the
+        leading candidates already settle the answer.
+        """
+
+        async def _check(cand: dict[str, object]) -> str | None:
+            try:
+                html = await self._http.get_text(
+                    str(cand["url"]),
+                    proxy=proxy,
+                    headers=self._HEADERS,
+                    cache_ttl=self.detail_cache_ttl_sec,
+                )
+            except Exception:
+                return None
+            return html if self._looks_like_video_page(html) else None
+
+        picked: list[tuple[dict[str, object], str]] = []
+        wave_size = max(1, self._VALIDATE_WAVE_SIZE)
+        for start in range(0, len(candidates), wave_size):
+            wave = candidates[start : start + wave_size]
+            tasks = [asyncio.create_task(_check(c)) for c in wave]
+            settled = 0
+            try:
+                for fut in asyncio.as_completed(tasks):
+                    await fut
+                    # Consume finished tasks in candidate order only, so the pick
+                    # does not depend on which request happened to return first.
+                    while settled < len(tasks) and tasks[settled].done():
+                        html = tasks[settled].result()
+                        if html is not None:
+                            picked.append((wave[settled], html))
+                        settled += 1
+                        if len(picked) >= limit:
+                            return picked
+            finally:
+                for t in tasks:
+                    if not t.done():
+                        t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        return picked
+
+    def _parse_candidates(self, html: str) -> list[dict[str, object]]:
+        soup = self._soup(html)
+
         seen: set[str] = set()
         candidates: list[dict[str, object]] = []
 
@@ -109,68 +200,7 @@ class ThreeDPornSource(BaseSource):
                     "duration": duration,
                 }
             )
-
-        limit = max(1, int(limit))
-        pool_limit = min(max(limit * 30, 60), 200)
-        if len(candidates) > 1:
-            random.shuffle(candidates)
-
-        for cand in candidates[:pool_limit]:
-            full_url = str(cand["url"])
-            cover = str(cand["cover_url"] or "")
-            title = str(cand["title"] or full_url)
-            likes = cand["stars"]
-            views = cand["views"]
-            duration = str(cand["duration"] or "")
-
-            try:
-                detail_html = await self._http.get_text(
-                    full_url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception:
-                continue
-            if not self._looks_like_video_page(detail_html):
-                continue
-
-            items.append(
-                HotItem(
-                    source=self.source_id,
-                    section=section,
-                    title=title,
-                    url=full_url,
-                    cover_url=cover,
-                    stars=likes,
-                    views=views,
-                    meta={"duration": duration} if duration else {},
-                )
-            )
-            if len(items) >= limit:
-                break
-
-        # Enrich with server-side stats (views/likes/rating) via WP admin-ajax if available.
-        enriched: list[HotItem] = []
-        for it in items:
-            if it.stars is not None and it.views is not None:
-                enriched.append(it)
-                continue
-            try:
-                enriched.append(await self._enrich_post_stats(it, proxy=proxy))
-            except Exception:
-                enriched.append(it)
-        return enriched
-
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
+        return candidates
 
     def _looks_like_video_page(self, html: str) -> bool:
         if not html:
@@ -181,58 +211,22 @@ class ThreeDPornSource(BaseSource):
             return True
         return False
 
-    async def _enrich_post_stats(self, item: HotItem, *, proxy: str) -> HotItem:
-        html = await self._http.get_text(item.url, proxy=proxy, headers=self._HEADERS)
+    async def _enrich_post_stats(
+        self, item: HotItem, *, proxy: str, html: str | None = None
+    ) -> HotItem:
+        if html is None:
+            html = await self._http.get_text(
+                item.url, proxy=proxy, headers=self._HEADERS
+            )
 
         # Prefer values visible in the real HTML (the ajax payload can be stale or
         # structured differently across pages).
-        soup = BeautifulSoup(html or "", "html.parser")
-
-        views_from_html = None
-        views_el = soup.select_one("#video-views .views-number") or soup.select_one(
-            ".views-number"
-        )
-        if views_el:
-            views_from_html = parse_compact_int(
-                views_el.get_text(" ", strip=True)
-            )
-        if views_from_html is None:
-            views_from_html = parse_compact_int(
-                self._extract_first(html, [self._RE_DETAIL_VIEWS])
-            )
-
-        likes_from_html = None
-        likes_el = soup.select_one(".likes_count")
-        if likes_el:
-            likes_from_html = parse_compact_int(
-                likes_el.get_text(" ", strip=True)
-            )
-        if likes_from_html is None:
-            m = self._RE_DETAIL_LIKES.search(html or "")
-            if m:
-                likes_from_html = parse_compact_int(m.group(1) or m.group(2))
-
-        dislikes_from_html = None
-        dislikes_el = soup.select_one(".dislikes_count")
-        if dislikes_el:
-            dislikes_from_html = parse_compact_int(
-                dislikes_el.get_text(" ", strip=True)
-            )
-        if dislikes_from_html is None:
-            m = self._RE_DETAIL_DISLIKES.search(html or "")
-            if m:
-                dislikes_from_html = parse_compact_int(m.group(1) or m.group(2))
-
-        rating_percent_from_html = None
-        percent_el = soup.select_one(".rating-result .percentage")
-        if percent_el:
-            rating_percent_from_html = parse_percent_int(
-                percent_el.get_text(" ", strip=True)
-            )
-        if rating_percent_from_html is None:
-            rating_percent_from_html = parse_percent_int(
-                self._extract_first(html, [self._RE_DETAIL_RATING_PERCENT])
-            )
+        (
+            views_from_html,
+            likes_from_html,
+            dislikes_from_html,
+            rating_percent_from_html,
+        ) = await self._parse(self._parse_post_html_stats, html)
 
         stars = item.stars
         if likes_from_html is not None:
@@ -392,6 +386,63 @@ class ThreeDPornSource(BaseSource):
             meta=meta,
         )
 
+    def _parse_post_html_stats(
+        self, html: str
+    ) -> tuple[int | None, int | None, int | None, int | None]:
+        soup = self._soup(html)
+
+        views_from_html = None
+        views_el = soup.select_one("#video-views .views-number") or soup.select_one(
+            ".views-number"
+        )
+        if views_el:
+            views_from_html = parse_compact_int(
+                views_el.get_text(" ", strip=True)
+            )
+        if views_from_html is None:
+            views_from_html = parse_compact_int(
+                self._extract_first(html, [self._RE_DETAIL_VIEWS])
+            )
+
+        likes_from_html = None
+        likes_el = soup.select_one(".likes_count")
+        if likes_el:
+            likes_from_html = parse_compact_int(
+                likes_el.get_text(" ", strip=True)
+            )
+        if likes_from_html is None:
+            m = self._RE_DETAIL_LIKES.search(html or "")
+            if m:
+                likes_from_html = parse_compact_int(m.group(1) or m.group(2))
+
+        dislikes_from_html = None
+        dislikes_el = soup.select_one(".dislikes_count")
+        if dislikes_el:
+            dislikes_from_html = parse_compact_int(
+                dislikes_el.get_text(" ", strip=True)
+            )
+        if dislikes_from_html is None:
+            m = self._RE_DETAIL_DISLIKES.search(html or "")
+            if m:
+                dislikes_from_html = parse_compact_int(m.group(1) or m.group(2))
+
+        rating_percent_from_html = None
+        percent_el = soup.select_one(".rating-result .percentage")
+        if percent_el:
+            rating_percent_from_html = parse_percent_int(
+                percent_el.get_text(" ", strip=True)
+            )
+        if rating_percent_from_html is None:
+            rating_percent_from_html = parse_percent_int(
+                self._extract_first(html, [self._RE_DETAIL_RATING_PERCENT])
+            )
+
+        return (
+            views_from_html,
+            likes_from_html,
+            dislikes_from_html,
+            rating_percent_from_html,
+        )
 
     @staticmethod
     def _extract_first(content: str, patterns: list[re.Pattern[str]]) -> str | None:
@@ -4,10 +4,11 @@ import re
 from typing import Iterable, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4.element import NavigableString, Tag
 
 from ..models import HotItem
 from ..utils.numbers import parse_compact_int
+from .soup import DEFAULT_HTML_BACKEND, make_soup
 
 
 def pick_first_nonempty(*values: str) -> str:
@@ -135,6 +136,88 @@ def extract_counts(text: str) -> tuple[Optional[int], Optional[int]]:
     return likes, views
 
 
+_CONTAINER_TAGS = {"article", "div", "li", "section"}
+
+
+class TextLengthIndex:
+    """Memo of `len(tag.get_text(" ", strip=True))` for one parsed document.
+
+    The first lookup walks the whole document once, bottom-up, and records
+    the stripped-text length of every tag, so scoring a card's ancestors no
+    longer re-serialises the same overlapping subtrees for every link.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[int, tuple[int, int]] | None = None
+        self._types = None
+
+    def length(self, tag: Tag) -> int:
+        types = tag.interesting_string_types
+        if types is None:
+            types = Tag.MAIN_CONTENT_STRING_TYPES
+        if self._totals is None:
+            self._types = types
+            self._totals = self._build(tag, types)
+        if types != self._types or id(tag) not in self._totals:
+            return len(tag.get_text(" ", strip=True))
+        chars, count = self._totals[id(tag)]
+        return chars + max(0, count - 1)
+
+    @staticmethod
+    def _build(tag: Tag, types) -> dict[int, tuple[int, int]]:
+        root = tag
+        while root.parent is not None:
+            root = root.parent
+
+        # Reverse document order visits every tag after all of its descendants.
+        totals: dict[int, tuple[int, int]] = {}
+        for node in reversed([root, *root.find_all(True)]):
+            chars = 0
+            count = 0
+            for child in node.contents:
+                if isinstance(child, Tag):
+                    c, n = totals[id(child)]
+                    chars += c
+                    count += n
+                elif isinstance(child, NavigableString) and _is_text_type(child, types):
+                    stripped = child.strip()
+                    if stripped:
+                        chars += len(stripped)
+                        count += 1
+            totals[id(node)] = (chars, count)
+        return totals
+
+
+def _is_text_type(s: NavigableString, types) -> bool:
+    # Mirrors the string filter in bs4's Tag._all_strings.
+    if isinstance(types, type):
+        return type(s) is types
+    return types is None or type(s) in types
+
+
+def pick_container(a: Tag, lengths: TextLengthIndex) -> Optional[Tag]:
+    """Pick the card element around link `a`: the nearest of up to six block
+    ancestors with the most text, falling back to the direct parent."""
+
+    best = None
+    best_len = -1
+    cur = a
+    for _ in range(6):
+        cur = getattr(cur, "parent", None)
+        if cur is None:
+            break
+        name = getattr(cur, "name", "")
+        if name in {"html", "body"}:
+            break
+        if name not in _CONTAINER_TAGS:
+            continue
+        n = lengths.length(cur)
+        if n > best_len:
+            best = cur
+            best_len = n
+    return best or a.parent
+
+
 def parse_tube_list(
     html: str,
     *,
@@ -143,8 +226,10 @@ def parse_tube_list(
     section: str,
     link_patterns: Iterable[re.Pattern[str]],
     limit: int,
+    backend: str = DEFAULT_HTML_BACKEND,
 ) -> list[HotItem]:
-    soup = BeautifulSoup(html or "", "html.parser")
+    soup = make_soup(html, backend)
+    lengths = TextLengthIndex()
 
     items: list[HotItem] = []
     seen: set[str] = set()
@@ -162,24 +247,7 @@ def parse_tube_list(
             continue
         seen.add(full_url)
 
-        best = None
-        best_len = -1
-        cur = a
-        for _ in range(6):
-            cur = getattr(cur, "parent", None)
-            if cur is None:
-                break
-            name = getattr(cur, "name", "")
-            if name in {"html", "body"}:
-                break
-            if name not in {"article", "div", "li", "section"}:
-                continue
-            txt = cur.get_text(" ", strip=True)
-            if len(txt) > best_len:
-                best = cur
-                best_len = len(txt)
-
-        container = best or a.parent
+        container = pick_container(a, lengths)
         img = (
             a.find("img")
             or a.find("source")
@@ -3,8 +3,6 @@ from __future__ import annotations
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService, HttpStatusError
 from .base import BaseSource, SourceBlockedError
@@ -48,7 +46,10 @@ class Vip91Source(BaseSource):
                     "Provide a working proxy in plugin config or disable this source."
                 ) from e
             raise
-        soup = BeautifulSoup(html, "html.parser")
+        return await self._parse(self._parse_list, html, limit=limit, section=section)
+
+    def _parse_list(self, html: str, *, limit: int, section: str) -> list[HotItem]:
+        soup = self._soup(html)
 
         items: list[HotItem] = []
         for card in soup.select(self._VIDEO_CARD_SELECTOR)[: max(limit * 3, limit)]:
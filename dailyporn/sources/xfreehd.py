@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
 from .base import BaseSource
+from .enrich import enrich_items, merge_detail_stats
 from .tube_common import parse_tube_list
 
 
@@ -46,61 +45,38 @@ class XFreeHDSource(BaseSource):
             return []
 
         html = await self._fetch_first(proxy)
-        items = parse_tube_list(
+        items = await self._parse(
+            parse_tube_list,
             html,
             base_url=self._BASE_URL,
             source_id=self.source_id,
             section=section,
             link_patterns=self._LINK_PATTERNS,
             limit=limit,
+            backend=self._html_backend,
         )
         if not items:
             return items
 
-        enriched: list[HotItem] = []
-        for it in items:
-            try:
-                detail = await self._http.get_text(it.url, proxy=proxy, headers=self._HEADERS)
-            except Exception:
-                enriched.append(it)
-                continue
-
-            likes, views, extra_meta = self._parse_detail_stats(it.url, detail)
-            meta = dict(it.meta) if isinstance(it.meta, dict) else {}
-            meta.update(extra_meta)
-
-            enriched.append(
-                HotItem(
-                    source=it.source,
-                    section=it.section,
-                    title=it.title,
-                    url=it.url,
-                    cover_url=it.cover_url,
-                    stars=likes if likes is not None else it.stars,
-                    views=views if views is not None else it.views,
-                    meta=meta,
-                )
-            )
-
-        return enriched
-
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
+        return await enrich_items(
+            self._http,
+            items,
+            self._merge_detail,
+            proxy=proxy,
+            headers=self._HEADERS,
+            cache_ttl=self.detail_cache_ttl_sec,
+            parser=self._parser,
+            stats=self._stats,
+            stats_ttl=self.detail_stats_ttl_sec,
+        )
+
+    def _merge_detail(self, item: HotItem, html: str) -> HotItem:
+        return merge_detail_stats(item, *self._parse_detail_stats(item.url, html))
 
     def _parse_detail_stats(
         self, url: str, html: str
     ) -> tuple[int | None, int | None, dict[str, object]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
 
         likes = None
         m = self._RE_VIDEO_ID.search(url or "")
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int, parse_percent_int
 from .base import BaseSource
+from .enrich import enrich_items, merge_detail_stats
 from .tube_common import parse_tube_list
 
 
@@ -49,13 +48,15 @@ class XHamsterSource(BaseSource):
             return []
 
         html = await self._fetch_first(proxy)
-        candidates = parse_tube_list(
+        candidates = await self._parse(
+            parse_tube_list,
             html,
             base_url=self._BASE_URL,
             source_id=self.source_id,
             section=section,
             link_patterns=self._LINK_PATTERNS,
             limit=max(limit * 8, limit),
+            backend=self._html_backend,
         )
         out: list[HotItem] = []
         for item in candidates:
@@ -88,52 +89,25 @@ class XHamsterSource(BaseSource):
                     break
 
         # Enrich with detail-page stats to avoid list-page heuristic mistakes.
-        enriched: list[HotItem] = []
-        for it in out:
-            try:
-                detail = await self._http.get_text(
-                    it.url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception:
-                enriched.append(it)
-                continue
-
-            likes, views, extra_meta = self._parse_detail_stats(detail)
-            meta = dict(it.meta) if isinstance(it.meta, dict) else {}
-            meta.update(extra_meta)
-
-            enriched.append(
-                HotItem(
-                    source=it.source,
-                    section=it.section,
-                    title=it.title,
-                    url=it.url,
-                    cover_url=it.cover_url,
-                    stars=likes if likes is not None else it.stars,
-                    views=views if views is not None else it.views,
-                    meta=meta,
-                )
-            )
-
-        return enriched
+        return await enrich_items(
+            self._http,
+            out,
+            self._merge_detail,
+            proxy=proxy,
+            headers=self._HEADERS,
+            cache_ttl=self.detail_cache_ttl_sec,
+            parser=self._parser,
+            stats=self._stats,
+            stats_ttl=self.detail_stats_ttl_sec,
+        )
 
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
+    def _merge_detail(self, item: HotItem, html: str) -> HotItem:
+        return merge_detail_stats(item, *self._parse_detail_stats(html))
 
     def _parse_detail_stats(
         self, html: str
     ) -> tuple[int | None, int | None, dict[str, object]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
         text = soup.get_text(" ", strip=True)
 
         views = None
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int
 from .base import BaseSource
+from .enrich import enrich_items, merge_detail_stats
 from .tube_common import parse_tube_list
 
 
@@ -56,69 +55,42 @@ class XNXXSource(BaseSource):
             return []
 
         html = await self._fetch_first(proxy)
-        items = parse_tube_list(
+        items = await self._parse(
+            parse_tube_list,
             html,
             base_url=self._BASE_URL,
             source_id=self.source_id,
             section=section,
             link_patterns=self._LINK_PATTERNS,
             limit=limit,
+            backend=self._html_backend,
         )
         if not items:
             return items
 
-        enriched: list[HotItem] = []
-        for it in items:
-            try:
-                detail_html = await self._http.get_text(
-                    it.url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception:
-                enriched.append(it)
-                continue
-
-            likes, views, extra_meta = self._parse_detail_stats(detail_html)
-            detail_title = self._extract_detail_title(detail_html)
-            stars = likes if likes is not None else it.stars
-            v = views if views is not None else it.views
-            meta = dict(it.meta) if isinstance(it.meta, dict) else {}
-            meta.update(extra_meta)
-            title = it.title
-            if (not title) or title.startswith("http"):
-                title = detail_title or title
-
-            enriched.append(
-                HotItem(
-                    source=it.source,
-                    section=it.section,
-                    title=title,
-                    url=it.url,
-                    cover_url=it.cover_url,
-                    stars=stars,
-                    views=v,
-                    meta=meta,
-                )
-            )
-
-        return enriched
+        return await enrich_items(
+            self._http,
+            items,
+            self._merge_detail,
+            proxy=proxy,
+            headers=self._HEADERS,
+            cache_ttl=self.detail_cache_ttl_sec,
+            parser=self._parser,
+            stats=self._stats,
+            stats_ttl=self.detail_stats_ttl_sec,
+        )
 
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
+    def _merge_detail(self, item: HotItem, html: str) -> HotItem:
+        likes, views, extra_meta = self._parse_detail_stats(html)
+        title = item.title
+        if (not title) or title.startswith("http"):
+            title = self._extract_detail_title(html) or title
+        return merge_detail_stats(item, likes, views, extra_meta, title=title)
 
     def _parse_detail_stats(
         self, html: str
     ) -> tuple[int | None, int | None, dict[str, object]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
 
         views = None
         for sel in (
@@ -166,7 +138,7 @@ class XNXXSource(BaseSource):
         return likes, views, meta
 
     def _extract_detail_title(self, html: str) -> str:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html)
         el = soup.select_one(".video-title-container .video-title strong")
         if not el:
             el = soup.select_one(".video-title strong")
@@ -4,12 +4,12 @@ import random
 import re
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
 from ..models import HotItem
 from ..services.http import HttpService
 from ..utils.numbers import parse_compact_int, parse_percent_int
-from .base import BaseSource
+from .base import BaseSource, IncompletePoolError
+from .enrich import enrich_items, merge_detail_stats
+from .soup import ParseRegion
 from .tube_common import parse_tube_list
 
 
@@ -18,6 +18,10 @@ class XVideosSource(BaseSource):
     display_name = "XVideos"
     sections = {"real"}
 
+    # Candidates come from the monthly ranking; their pages change slowly.
+    detail_cache_ttl_sec = 12 * 3600
+    detail_stats_ttl_sec = 12 * 3600
+
     _BASE_URL = "https://www.xvideos.com"
     _MONTHLY_PAGES = 3
     _HOT_URLS = []
@@ -46,6 +50,20 @@ class XVideosSource(BaseSource):
     )
     _RE_DETAIL_RATING_PERCENT = re.compile(r"(\d{1,3}(?:\.\d+)?)%")
 
+    # Everything _parse_detail_stats selects; regex fallbacks read the raw page.
+    _DETAIL_REGION = ParseRegion(
+        ids=frozenset({"v-views", "video-views"}),
+        classes=(
+            "video-views",
+            "mobile-hide",
+            "rate-infos",
+            "rating-good-nbr",
+            "rating-bad-nbr",
+            "rating-good-perc",
+            "rating-total-txt",
+        ),
+    )
+
     def __init__(self, http: HttpService):
         self._http = http
         self._HOT_URLS = self._monthly_best_urls()
@@ -57,27 +75,41 @@ class XVideosSource(BaseSource):
         urls = self._monthly_best_urls()
         self._HOT_URLS = urls
 
-        candidates: list[HotItem] = []
-        seen: set[str] = set()
         page_limit = max(limit * 8, 60)
-        for url in urls:
-            try:
-                html = await self._http.get_text(url, proxy=proxy, headers=self._HEADERS)
-            except Exception:
-                continue
-            for item in parse_tube_list(
-                html,
-                base_url=self._BASE_URL,
-                source_id=self.source_id,
-                section=section,
-                link_patterns=self._LINK_PATTERNS,
-                limit=page_limit,
-            ):
-                if item.url in seen:
-                    continue
-                seen.add(item.url)
-                candidates.append(item)
 
+        async def _load() -> list[HotItem]:
+            candidates: list[HotItem] = []
+            seen: set[str] = set()
+            failed = False
+            for url in urls:
+                try:
+                    html = await self._http.get_text(
+                        url, proxy=proxy, headers=self._HEADERS
+                    )
+                except Exception:
+                    failed = True
+                    continue
+                for item in await self._parse(
+                    parse_tube_list,
+                    html,
+                    base_url=self._BASE_URL,
+                    source_id=self.source_id,
+                    section=section,
+                    link_patterns=self._LINK_PATTERNS,
+                    limit=page_limit,
+                    backend=self._html_backend,
+                ):
+                    if item.url in seen:
+                        continue
+                    seen.add(item.url)
+                    candidates.append(item)
+            if failed:
+                raise IncompletePoolError(candidates)
+            return candidates
+
+        # urls[0] is ".../best/<YYYY-MM>", the ranking the pool is built from.
+        period = urls[0][len(self._BASE_URL) + 1 :]
+        candidates = await self._candidate_pool(f"{period}/{page_limit}", _load)
         if candidates:
             if len(candidates) <= limit:
                 items = candidates
@@ -88,59 +120,32 @@ class XVideosSource(BaseSource):
         if not items:
             return items
 
-        enriched: list[HotItem] = []
-        for it in items:
-            try:
-                detail_html = await self._http.get_text(
-                    it.url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception:
-                enriched.append(it)
-                continue
-
-            likes, views, extra_meta = self._parse_detail_stats(detail_html)
-            stars = likes if likes is not None else it.stars
-            v = views if views is not None else it.views
-            meta = dict(it.meta) if isinstance(it.meta, dict) else {}
-            meta.update(extra_meta)
-
-            enriched.append(
-                HotItem(
-                    source=it.source,
-                    section=it.section,
-                    title=it.title,
-                    url=it.url,
-                    cover_url=it.cover_url,
-                    stars=stars,
-                    views=v,
-                    meta=meta,
-                )
-            )
-
-        return enriched
+        return await enrich_items(
+            self._http,
+            items,
+            self._merge_detail,
+            proxy=proxy,
+            headers=self._HEADERS,
+            cache_ttl=self.detail_cache_ttl_sec,
+            parser=self._parser,
+            stats=self._stats,
+            stats_ttl=self.detail_stats_ttl_sec,
+            # The vote total is the last counter the stats parser reads.
+            until=self._RE_DETAIL_VOTES_TOTAL.search,
+        )
 
     def _monthly_best_urls(self) -> list[str]:
         now = datetime.utcnow()
         base = f"{self._BASE_URL}/best/{now:%Y-%m}"
         return [base] + [f"{base}/{i}" for i in range(1, self._MONTHLY_PAGES)]
 
-    async def _fetch_first(self, proxy: str) -> str:
-        last_err: Exception | None = None
-        for url in self._HOT_URLS:
-            try:
-                return await self._http.get_text(
-                    url, proxy=proxy, headers=self._HEADERS
-                )
-            except Exception as e:
-                last_err = e
-        if last_err:
-            raise last_err
-        raise RuntimeError("no url")
+    def _merge_detail(self, item: HotItem, html: str) -> HotItem:
+        return merge_detail_stats(item, *self._parse_detail_stats(html))
 
     def _parse_detail_stats(
         self, html: str
     ) -> tuple[int | None, int | None, dict[str, object]]:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = self._soup(html, self._DETAIL_REGION)
 
         views = None
         for sel in (
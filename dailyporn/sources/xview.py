@@ -61,7 +61,9 @@ class XViewSource(BaseSource):
                         "User-Agent": self._HEADERS.get("User-Agent", "Mozilla/5.0")
                     },
                 )
-                stars, views = self._extract_chaturbate_counts(detail_html)
+                stars, views = await self._parse(
+                    self._extract_chaturbate_counts, detail_html
+                )
             except Exception:
                 pass
 
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+async def first_success(
+    factories: Sequence[Callable[[], Awaitable[T]]], *, hedge_delay: float = 0
+) -> T:
+    """Return the result of the first factory that succeeds, in preference order.
+
+    Factories are started one at a time. Without `hedge_delay` the next one
+    starts only after the previous one failed. With `hedge_delay` > 0 it also
+    starts when no attempt has finished within `hedge_delay` seconds, or as
+    soon as any attempt fails. Attempts finishing together are
+    ranked by their position in `factories`. Once a result is taken, attempts
+    still running are cancelled. If every factory fails, the last error is
+    raised.
+    """
+
+    if not factories:
+        raise RuntimeError("no url")
+
+    pending: dict[asyncio.Future[T], int] = {}
+    next_index = 0
+    last_err: BaseException | None = None
+
+    def _start_next() -> None:
+        nonlocal next_index
+        task = asyncio.ensure_future(factories[next_index]())
+        pending[task] = next_index
+        next_index += 1
+
+    _start_next()
+    try:
+        while pending:
+            can_hedge = hedge_delay > 0 and next_index < len(factories)
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=hedge_delay if can_hedge else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                _start_next()
+                continue
+            for task in sorted(done, key=pending.__getitem__):
+                del pending[task]
+                if task.exception() is None:
+                    return task.result()
+                last_err = task.exception()
+            # A failed hedge is replaced right away instead of after a delay.
+            if next_index < len(factories) and (not pending or hedge_delay > 0):
+                _start_next()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    if last_err is None:
+        raise RuntimeError("no url")
+    raise last_err
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket: `acquire()` waits until a token is available.
+
+    Tokens refill continuously at `rate_per_sec` up to `capacity`; waiters are
+    served in arrival order.
+    """
+
+    def __init__(self, rate_per_sec: float, *, capacity: int = 1) -> None:
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self._rate = float(rate_per_sec)
+        self._capacity = max(1, int(capacity))
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
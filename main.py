@@ -31,7 +31,7 @@ class DailyPornPlugin(Star):
 
     @filter.command("dailyporn")
     async def dailyporn(self, event: AstrMessageEvent, arg1: str = ""):
-        """日报：/dailyporn on|off|test|<分区>"""
+        """日报：/dailyporn on|off|test|status|<分区>"""
         session = event.unified_msg_origin
         sub = (arg1 or "").strip()
         sub_lower = sub.lower()
@@ -53,6 +53,10 @@ class DailyPornPlugin(Star):
             )
             return
 
+        if sub_lower == "status":
+            yield event.plain_result(self._status_text())
+            return
+
         # Manual-only sources (no reliable stats; disabled by default; never used in scheduled daily picks).
         if sub_lower in {"hqporner", "missav"}:
             async for r in self._send_manual_source(event, sub_lower):
@@ -148,7 +152,10 @@ class DailyPornPlugin(Star):
             f"【{section_display(section)} 热门】共 {len(items)} 个源"
         )
 
-        for item in items:
+        cover_paths = await self.app.images.get_cover_paths(
+            item.cover_url or "" for item in items
+        )
+        for item, cover_path in zip(items, cover_paths):
             stars = item.stars if item.stars is not None else "-"
             views = item.views if item.views is not None else "-"
             duration = (
@@ -163,16 +170,86 @@ class DailyPornPlugin(Star):
             )
 
             chain = []
-            cover_path = (
-                await self.app.images.get_cover_path(item.cover_url)
-                if item.cover_url
-                else None
-            )
             if cover_path:
                 chain.append(Comp.Image.fromFileSystem(cover_path))
             chain.append(Comp.Plain(text))
             yield event.chain_result(chain)
 
+    def _status_text(self) -> str:
+        health = self.app.health.snapshot()
+        lines = ["DailyPorn 运行状态", "信息源："]
+        for info in self.app.sources.list_sources():
+            if not info.enabled:
+                continue
+            h = health.get(info.source_id)
+            if h is None:
+                lines.append(f"- {info.display_name}: 尚未抓取")
+                continue
+            line = (
+                f"- {info.display_name}: {h.state} | 成功率 {h.success_rate:.0%}"
+                f" | 延迟 {h.latency_ewma_ms:.0f}ms"
+            )
+            if h.consecutive_failures:
+                line += f" | 连续失败 {h.consecutive_failures}: {h.last_error[:80]}"
+            lines.append(line)
+
+        pools = self.app.http.pool_stats()
+        if pools:
+            lines.append("连接池：")
+            for proxy, st in pools.items():
+                lines.append(
+                    f"- {proxy}: 进行中 {st['in_flight']} | 峰值 {st['peak_in_flight']}"
+                    f" | 饱和 {st['saturated']}"
+                )
+
+        parse = self.app.parser.stats()
+        if parse:
+            lines.append(f"解析（{self.app.parser.mode}）：")
+            for label, st in sorted(parse.items()):
+                avg = st.total_ms / st.calls if st.calls else 0
+                lines.append(
+                    f"- {label}: {st.calls} 次 | 平均 {avg:.0f}ms | 最长 {st.max_ms:.0f}ms"
+                )
+
+        images = self.app.image_executor
+        cover = images.stats().get("cover")
+        if cover is not None:
+            avg = cover.total_ms / cover.calls if cover.calls else 0
+            lines.append(
+                f"封面处理（{images.mode}）：{cover.calls} 张 | 平均 {avg:.0f}ms"
+                f" | 排队 {images.queue_depth} | 排队峰值 {images.peak_queue_depth}"
+            )
+
+        for label, cache in (
+            ("封面缓存", self.app.cover_cache),
+            ("原图缓存", self.app.cover_raw_cache),
+            ("渲染缓存", self.app.render_cache),
+            ("HTTP 缓存", self.app.http_cache),
+        ):
+            if cache is None:
+                continue
+            st = cache.stats()
+            lines.append(
+                f"{label}：{st.files} 个 / {st.bytes / 1024 / 1024:.1f}MB"
+                f" | 命中 {st.hits} | 未命中 {st.misses} | 淘汰 {st.evictions}"
+            )
+
+        stats = self.app.detail_stats
+        if stats is not None:
+            lines.append(
+                f"详情统计缓存：{len(stats)} 条 | 命中 {stats.hits} | 未命中 {stats.misses}"
+            )
+
+        delivery = self.app.delivery.stats()
+        if delivery:
+            sent = sum(s.sent for s in delivery.values())
+            failed = sum(s.failed for s in delivery.values())
+            retries = sum(s.retries for s in delivery.values())
+            lines.append(
+                f"发送：{len(delivery)} 个会话 | 成功 {sent} | 失败 {failed} | 重试 {retries}"
+            )
+        return "\n".join(lines)
+
     def _help_text(self) -> str:
         trigger_time = self.app.cfg.trigger_time
         enabled = [s for s in self.app.sources.list_sources() if s.enabled]
@@ -185,6 +262,7 @@ class DailyPornPlugin(Star):
             "DailyPorn 使用说明\n"
             f"- /dailyporn on|off：在当前群聊开关日报\n"
             f"- /dailyporn test：手动触发一次日报（仅当前群聊）\n"
+            f"- /dailyporn status：查看各源健康状态与运行统计\n"
             f"- /dailyporn <分区>：返回对应分区不同源最热门封面+信息\n"
             f"- /dailyporn hqporner|missav：手动抓取该源最新热榜（默认关闭，不参与定时推荐）\n"
             f"  分区: {sections_text}\n"
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import unittest
+
+from aiohttp import web
+
+from dailyporn.services.http import HttpService
+
+
+class LocalServerTestCase(unittest.IsolatedAsyncioTestCase):
+    """Serves `routes()` from a local aiohttp app on a free port per test.
+
+    `self.base` is the server's base URL and `self.http` an `HttpService`
+    built by `make_http()`; both are closed again after each test.
+    """
+
+    def routes(self) -> list[web.RouteDef]:
+        raise NotImplementedError
+
+    def make_http(self) -> HttpService:
+        return HttpService(timeout_sec=10)
+
+    async def asyncSetUp(self) -> None:
+        app = web.Application()
+        app.add_routes(self.routes())
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base = f"http://127.0.0.1:{port}"
+        self.http = self.make_http()
+
+    async def asyncTearDown(self) -> None:
+        await self.http.close()
+        await self.runner.cleanup()
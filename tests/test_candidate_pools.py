@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from dailyporn.models import HotItem
+from dailyporn.services.candidate_pools import CandidatePoolCache
+from dailyporn.sources.base import IncompletePoolError
+from dailyporn.sources.hentaigem import HentaiGemSource
+from dailyporn.sources.porntrex import PornTrexSource
+from dailyporn.sources.rule34video import Rule34VideoSource
+
+_LISTING = """
+<div class="sort"><strong>Top rated</strong><a href="#">Today</a></div>
+<a href="/video/1/first/">one</a><a href="/videos/1/first/">one</a>
+<a href="/video/2/second/">two</a><a href="/videos/2/second/">two</a>
+"""
+
+
+def _items(n: int) -> list[HotItem]:
+    return [
+        HotItem(
+            source="porntrex",
+            section="real",
+            title=f"video {i}",
+            url=f"https://www.porntrex.com/video/{i}/",
+            views=i * 100,
+        )
+        for i in range(n)
+    ]
+
+
+class _NoAjaxHttp:
+    """Serves `_LISTING` for every page but fails the sorted ajax block."""
+
+    def __init__(self) -> None:
+        self.listings = 0
+
+    async def get_text(self, url: str, **_kwargs) -> str:
+        if "mode=async" in url:
+            raise RuntimeError("ajax blocked")
+        if url.endswith(".com/") or url.endswith("/top-rated/"):
+            self.listings += 1
+        return _LISTING
+
+
+class CandidatePoolCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_pool_survives_restart_within_period(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = CandidatePoolCache(Path(tmp))
+            await cache.put("porntrex", "best/2026-10", _items(3))
+
+            reloaded = CandidatePoolCache(Path(tmp))
+            self.assertEqual(await reloaded.get("porntrex", "best/2026-10"), _items(3))
+            self.assertIsNone(await reloaded.get("porntrex", "best/2026-11"))
+            self.assertIsNone(await reloaded.get("xvideos", "best/2026-10"))
+
+    async def test_expired_or_corrupt_pool_is_a_miss(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            await CandidatePoolCache(Path(tmp)).put("porntrex", "daily", _items(2))
+            self.assertIsNone(
+                await CandidatePoolCache(Path(tmp), ttl_sec=0).get("porntrex", "daily")
+            )
+
+            (Path(tmp) / "porntrex.json").write_text("{", encoding="utf-8")
+            corrupt = CandidatePoolCache(Path(tmp))
+            self.assertIsNone(await corrupt.get("porntrex", "daily"))
+
+    async def test_source_loads_each_period_once(self) -> None:
+        calls: list[str] = []
+
+        def _loader(tag: str):
+            async def _load() -> list[HotItem]:
+                calls.append(tag)
+                return _items(4) if tag != "empty" else []
+
+            return _load
+
+        with tempfile.TemporaryDirectory() as tmp:
+            src = PornTrexSource(http=object())
+            src.bind_pool_cache(CandidatePoolCache(Path(tmp)))
+
+            first = await src._candidate_pool("daily/2026-10-17", _loader("a"))
+            second = await src._candidate_pool("daily/2026-10-17", _loader("b"))
+            await src._candidate_pool("daily/2026-10-18", _loader("c"))
+            # Empty pools are not cached, so a failed scrape is retried.
+            await src._candidate_pool("empty", _loader("empty"))
+            await src._candidate_pool("empty", _loader("empty"))
+
+            # Pools for other periods (or limits) are kept side by side.
+            await src._candidate_pool("daily/2026-10-17", _loader("d"))
+
+            stored = json.loads((Path(tmp) / "porntrex.json").read_text("utf-8"))
+
+        self.assertEqual(first, second)
+        self.assertEqual(calls, ["a", "c", "empty", "empty"])
+        self.assertEqual(
+            [p["period"] for p in stored["pools"]],
+            ["daily/2026-10-17", "daily/2026-10-18"],
+        )
+
+    async def test_keeps_the_most_recent_pools_and_reads_disk_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = CandidatePoolCache(Path(tmp), max_pools=2)
+            for limit in (20, 40, 80):
+                await cache.put("porntrex", f"daily/{limit}", _items(2))
+
+            reloaded = CandidatePoolCache(Path(tmp))
+            reads = 0
+            read = reloaded._read
+
+            async def counted(source_id: str):
+                nonlocal reads
+                reads += 1
+                return await read(source_id)
+
+            reloaded._read = counted
+            self.assertIsNone(await reloaded.get("porntrex", "daily/20"))
+            self.assertIsNotNone(await reloaded.get("porntrex", "daily/40"))
+            self.assertIsNotNone(await reloaded.get("porntrex", "daily/80"))
+            self.assertIsNone(await reloaded.get("xvideos", "daily/80"))
+            self.assertIsNone(await reloaded.get("xvideos", "daily/80"))
+        self.assertEqual(reads, 2)
+
+    async def test_incomplete_pool_is_used_but_not_cached(self) -> None:
+        calls = 0
+
+        async def _load() -> list[HotItem]:
+            nonlocal calls
+            calls += 1
+            raise IncompletePoolError(_items(2))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            src = PornTrexSource(http=object())
+            src.bind_pool_cache(CandidatePoolCache(Path(tmp)))
+
+            self.assertEqual(await src._candidate_pool("daily", _load), _items(2))
+            await src._candidate_pool("daily", _load)
+            self.assertFalse((Path(tmp) / "porntrex.json").exists())
+        self.assertEqual(calls, 2)
+
+    async def test_unsorted_fallback_listing_is_not_cached(self) -> None:
+        for cls in (Rule34VideoSource, HentaiGemSource):
+            with self.subTest(source=cls.source_id):
+                http = _NoAjaxHttp()
+                src = cls(http=http)
+                with tempfile.TemporaryDirectory() as tmp:
+                    src.bind_pool_cache(CandidatePoolCache(Path(tmp)))
+                    items = await src.fetch_hot("2.5d", limit=1, proxy="")
+                    await src.fetch_hot("2.5d", limit=1, proxy="")
+                    cached = (Path(tmp) / f"{cls.source_id}.json").exists()
+
+                self.assertEqual(len(items), 1)
+                self.assertEqual(http.listings, 2)
+                self.assertFalse(cached)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from dailyporn.services.delivery import DeliveryService
+
+
+class _FlakyContext:
+    def __init__(self, failures: int = 0, delay: float = 0.0) -> None:
+        self._failures = failures
+        self._delay = delay
+        self.sent: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_message(self, session: str, chain) -> bool:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            if self._failures > 0:
+                self._failures -= 1
+                raise ConnectionError("temporary")
+            self.sent.append(session)
+            return True
+        finally:
+            self.in_flight -= 1
+
+
+class DeliveryServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_transient_failures(self) -> None:
+        ctx = _FlakyContext(failures=2)
+        svc = DeliveryService(context=ctx, max_retries=2, backoff_sec=0)
+
+        ok = await svc.send("aiocqhttp:GroupMessage:1", object())
+
+        self.assertTrue(ok)
+        stats = svc.stats()["aiocqhttp:GroupMessage:1"]
+        self.assertEqual((stats.sent, stats.failed, stats.retries), (1, 0, 2))
+
+    async def test_gives_up_after_max_retries(self) -> None:
+        ctx = _FlakyContext(failures=5)
+        svc = DeliveryService(context=ctx, max_retries=1, backoff_sec=0)
+
+        with self.assertRaises(ConnectionError):
+            await svc.send("aiocqhttp:GroupMessage:1", object())
+        self.assertEqual(svc.stats()["aiocqhttp:GroupMessage:1"].failed, 1)
+
+    async def test_fan_out_caps_concurrent_sessions(self) -> None:
+        ctx = _FlakyContext(delay=0.01)
+        svc = DeliveryService(context=ctx, concurrency=3)
+        sessions = [f"aiocqhttp:GroupMessage:{i}" for i in range(10)]
+
+        await svc.fan_out(sessions, lambda s: svc.send(s, object()))
+
+        self.assertEqual(sorted(ctx.sent), sorted(sessions))
+        self.assertEqual(ctx.max_in_flight, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
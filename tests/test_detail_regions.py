@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from dailyporn.sources.eporner import EPornerSource
+from dailyporn.sources.pornhub import PornhubSource
+from dailyporn.sources.soup import (
+    HTML_BACKENDS,
+    ParseRegion,
+    make_soup,
+    resolve_html_backend,
+)
+from dailyporn.sources.xvideos import XVideosSource
+
+_FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class DetailRegionTests(unittest.TestCase):
+    def test_region_parse_matches_full_parse(self) -> None:
+        cases = [
+            (PornhubSource, "pornhub_detail.html"),
+            (XVideosSource, "xvideos_detail.html"),
+            (EPornerSource, "eporner_detail.html"),
+        ]
+        backends = sorted({resolve_html_backend(b) for b in HTML_BACKENDS})
+        for cls, fixture in cases:
+            html = (_FIXTURES / fixture).read_text(encoding="utf-8")
+            for backend in backends:
+                with self.subTest(source=cls.source_id, backend=backend):
+                    src = cls(http=None)
+                    src.use_html_backend(backend)
+                    strained = src._parse_detail_stats(html)
+                    src._DETAIL_REGION = None
+                    self.assertEqual(strained, src._parse_detail_stats(html))
+
+    def test_region_keeps_only_matching_subtrees(self) -> None:
+        html = (
+            '<html><body><div class="nav">menu</div>'
+            '<div class="rate-infos big"><b>12</b></div>'
+            '<p id="v">3</p><p data-x="1"></p></body></html>'
+        )
+        region = ParseRegion(
+            ids=frozenset({"v"}), classes=("rate-infos",), attrs=frozenset({"data-x"})
+        )
+
+        soup = make_soup(html, region=region)
+
+        self.assertEqual([t.name for t in soup.find_all(True)], ["div", "b", "p", "p"])
+        self.assertIsNone(soup.select_one(".nav"))
+
+    def test_markers_and_probe(self) -> None:
+        region = ParseRegion(classes=("stats",), start="<main", end="</main>")
+        html = '<div class="stats">a</div><main><div class="stats">b</div></main>'
+
+        self.assertEqual(make_soup(html, region=region).get_text(), "b")
+        self.assertEqual(make_soup("<div>none</div>", region=region).contents, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
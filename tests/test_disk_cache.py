@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from dailyporn.services.disk_cache import DiskCacheManager
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _write(root: Path, name: str, size: int, mtime: float) -> Path:
+    path = root / name
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class DiskCacheManagerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_evicts_least_recently_used_over_budget(self) -> None:
+        clock = _Clock()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            # Listed at startup, oldest first by mtime.
+            a = _write(root, "a.png", 100, clock.now - 30)
+            b = _write(root, "b.png", 100, clock.now - 20)
+            c = _write(root, "c.png", 100, clock.now - 10)
+            cache = DiskCacheManager(root, name="cover", max_bytes=250, clock=clock)
+            await cache.sweep()
+            self.assertFalse(a.exists())
+
+            clock.now += 1
+            cache.record_hit(b)
+            d = _write(root, "d.png", 100, clock.now)
+            cache.add(d)
+            self.assertEqual(await cache.sweep(), 1)
+
+            self.assertEqual(sorted(p.name for p in root.iterdir()), ["b.png", "d.png"])
+            self.assertFalse(c.exists())
+            # The hit was written back so the order survives a restart.
+            self.assertEqual(b.stat().st_mtime, clock.now)
+
+        st = cache.stats()
+        self.assertEqual((st.files, st.bytes), (2, 200))
+        self.assertEqual((st.hits, st.evictions), (1, 2))
+
+    async def test_evicts_files_unused_for_max_age(self) -> None:
+        clock = _Clock()
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            old = _write(root, "daily_old.png", 10, clock.now - 7200)
+            cache = DiskCacheManager(root, name="render", max_age_sec=3600, clock=clock)
+            fresh = _write(root, "daily_new.jpg", 10, clock.now)
+            cache.add(fresh)
+            cache.add(root.parent / "elsewhere.png", size=10)
+
+            self.assertEqual(await cache.sweep(), 1)
+            self.assertFalse(old.exists())
+            self.assertTrue(fresh.exists())
+            self.assertEqual(cache.stats().files, 1)
+
+    async def test_sweep_does_not_relist_the_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            cache = DiskCacheManager(root, name="cover", max_bytes=1)
+            await cache.sweep()
+            # Files that bypass the manager are invisible until the next start.
+            stray = _write(root, "stray.png", 100, 0)
+            self.assertEqual(await cache.sweep(), 0)
+            self.assertTrue(stray.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
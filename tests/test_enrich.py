@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import tempfile
+import time
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from dailyporn.models import HotItem
+from dailyporn.services.detail_stats import (
+    DetailStatsCache,
+    DetailStatsEntry,
+    canonical_video_url,
+)
+from dailyporn.sources.enrich import enrich_items, merge_detail_stats
+
+
+class _FakeHttp:
+    def __init__(self, fail_urls: set[str] | None = None) -> None:
+        self._fail_urls = fail_urls or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested: list[str] = []
+
+    async def get_text(
+        self,
+        url: str,
+        *,
+        proxy: str = "",
+        headers=None,
+        cache_ttl: float = 0,
+        until=None,
+    ) -> str:
+        self.requested.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later URLs finish first, so ordering must not depend on completion.
+            await asyncio.sleep(0.01 * (10 - int(url.rsplit("/", 1)[-1])))
+            if url in self._fail_urls:
+                raise RuntimeError("boom")
+            return url.rsplit("/", 1)[-1]
+        finally:
+            self.in_flight -= 1
+
+
+def _item(i: int) -> HotItem:
+    return HotItem(
+        source="fake",
+        section="real",
+        title=f"item-{i}",
+        url=f"https://example.com/{i}",
+        stars=None,
+        views=1,
+    )
+
+
+def _merge(item: HotItem, html: str) -> HotItem:
+    return merge_detail_stats(item, int(html), int(html) * 100, {"detail": True})
+
+
+class EnrichItemsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_preserves_order_and_keeps_failed_items(self) -> None:
+        http = _FakeHttp(fail_urls={"https://example.com/2"})
+        items = [_item(i) for i in range(5)]
+
+        out = await enrich_items(http, items, _merge, proxy="")
+
+        self.assertEqual([it.title for it in out], [it.title for it in items])
+        self.assertEqual(out[1].stars, 1)
+        self.assertEqual(out[1].views, 100)
+        self.assertEqual(out[1].meta, {"detail": True})
+        self.assertIs(out[2], items[2])
+
+    async def test_caps_concurrency_per_host(self) -> None:
+        http = _FakeHttp()
+        items = [_item(i) for i in range(8)]
+
+        await enrich_items(http, items, _merge, proxy="", per_host_limit=3)
+
+        self.assertEqual(http.max_in_flight, 3)
+
+    async def test_stats_cache_skips_fresh_detail_pages(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            http = _FakeHttp(fail_urls={"https://example.com/2"})
+            stats = DetailStatsCache(Path(tmp), max_entries=10)
+            first = await enrich_items(
+                http,
+                [_item(i) for i in range(3)],
+                _merge,
+                proxy="",
+                stats=stats,
+                stats_ttl=3600,
+            )
+
+            # Same videos behind a different URL spelling, after a restart.
+            http = _FakeHttp()
+            again = [
+                dataclasses.replace(_item(i), url=f"https://WWW.Example.com/{i}")
+                for i in range(3)
+            ]
+            second = await enrich_items(
+                http,
+                again,
+                _merge,
+                proxy="",
+                stats=DetailStatsCache(Path(tmp)),
+                stats_ttl=3600,
+            )
+
+        # Only the item whose detail page failed earlier is requested again.
+        self.assertEqual(http.requested, ["https://WWW.Example.com/2"])
+        for cached, fresh in zip(second[:2], first[:2]):
+            self.assertEqual((cached.stars, cached.views), (fresh.stars, fresh.views))
+            self.assertEqual(cached.meta, {"detail": True})
+        self.assertEqual((second[2].stars, second[2].views), (2, 200))
+
+    async def test_stats_cache_respects_ttl_and_bound(self) -> None:
+        http = _FakeHttp()
+        stats = DetailStatsCache(max_entries=2)
+        items = [_item(i) for i in range(3)]
+        await enrich_items(http, items, _merge, proxy="", stats=stats, stats_ttl=3600)
+        await enrich_items(http, items[:1], _merge, proxy="", stats=stats, stats_ttl=0)
+
+        self.assertEqual(len(stats), 2)
+        self.assertEqual(len(http.requested), 4)
+
+    async def test_concurrent_saves_are_serialized(self) -> None:
+        writers = 0
+        overlapped = False
+        dump = json.dump
+
+        def slow_dump(*args, **kwargs):
+            nonlocal writers, overlapped
+            writers += 1
+            overlapped = overlapped or writers > 1
+            time.sleep(0.02)
+            writers -= 1
+            return dump(*args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stats = DetailStatsCache(Path(tmp))
+            with unittest.mock.patch(
+                "dailyporn.services.detail_stats.json.dump", slow_dump
+            ):
+                saves = []
+                for i in range(4):
+                    entry = DetailStatsEntry(stored_at=time.time())
+                    await stats.put(_item(i).url, entry)
+                    saves.append(asyncio.ensure_future(stats.save()))
+                    await asyncio.sleep(0)
+                await asyncio.gather(*saves)
+
+            reloaded = DetailStatsCache(Path(tmp))
+            self.assertIsNotNone(await reloaded.get(_item(3).url, 3600))
+            self.assertEqual(len(reloaded), 4)
+        self.assertFalse(overlapped)
+
+    def test_canonical_video_url(self) -> None:
+        self.assertEqual(
+            canonical_video_url(
+                "HTTPS://www.Pornhub.com/view_video.php?viewkey=ab&utm_source=x#t"
+            ),
+            canonical_video_url("https://pornhub.com/view_video.php?viewkey=ab"),
+        )
+        self.assertNotEqual(
+            canonical_video_url("https://pornhub.com/view_video.php?viewkey=ab"),
+            canonical_video_url("https://pornhub.com/view_video.php?viewkey=cd"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
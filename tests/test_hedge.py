@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from local_server import LocalServerTestCase
+
+from dailyporn.sources.porntrex import PornTrexSource
+from dailyporn.utils.hedge import first_success
+
+
+class FirstSuccessTests(unittest.IsolatedAsyncioTestCase):
+    async def test_hedges_slow_primary_and_cancels_it(self) -> None:
+        cancelled: list[str] = []
+
+        async def slow() -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("primary")
+                raise
+            return "primary"
+
+        async def fast() -> str:
+            await asyncio.sleep(0.01)
+            return "fallback"
+
+        result = await asyncio.wait_for(
+            first_success([slow, fast], hedge_delay=0.02), timeout=1
+        )
+
+        self.assertEqual(result, "fallback")
+        self.assertEqual(cancelled, ["primary"])
+
+    async def test_without_hedging_tries_in_order(self) -> None:
+        started: list[str] = []
+
+        def _attempt(name: str, ok: bool):
+            async def _run() -> str:
+                started.append(name)
+                if not ok:
+                    raise RuntimeError(name)
+                return name
+
+            return _run
+
+        result = await first_success(
+            [_attempt("a", False), _attempt("b", True), _attempt("c", True)]
+        )
+
+        self.assertEqual(result, "b")
+        self.assertEqual(started, ["a", "b"])
+
+    async def test_raises_last_error_when_all_fail(self) -> None:
+        async def boom() -> str:
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            await first_success([boom, boom], hedge_delay=0.01)
+
+
+class FetchFirstTests(LocalServerTestCase):
+    def routes(self) -> list[web.RouteDef]:
+        return [web.get("/slow", self._slow), web.get("/fast", self._fast)]
+
+    async def _slow(self, request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        try:
+            for _ in range(500):
+                await resp.write(b"<p>slow</p>")
+                await asyncio.sleep(0.01)
+        except (ConnectionError, asyncio.CancelledError):
+            self.slow_outcome.set_result("aborted")
+            raise
+        self.slow_outcome.set_result("done")
+        return resp
+
+    async def _fast(self, request: web.Request) -> web.Response:
+        return web.Response(text="<p>fast</p>")
+
+    async def asyncSetUp(self) -> None:
+        self.slow_outcome: asyncio.Future[str] = asyncio.Future()
+        await super().asyncSetUp()
+
+    async def test_losing_request_is_aborted_on_the_server(self) -> None:
+        src = PornTrexSource(http=self.http)
+        src._HOT_URLS = [f"{self.base}/slow", f"{self.base}/fast"]
+        src.use_hedge_delay(0.05)
+
+        html = await asyncio.wait_for(src._fetch_first(""), timeout=2)
+
+        self.assertEqual(html, "<p>fast</p>")
+        self.assertEqual(await asyncio.wait_for(self.slow_outcome, 2), "aborted")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+from local_server import LocalServerTestCase
+
+from dailyporn.services.disk_cache import DiskCacheManager
+from dailyporn.services.http import HttpService
+from dailyporn.services.http_cache import HttpResponseCache
+
+_ETAG = '"v1"'
+_LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class HttpResponseCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_store_and_revalidate_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HttpResponseCache(Path(tmp))
+            url = "https://example.com/view_video.php?viewkey=1"
+            headers = {"Accept-Language": "en-US", "Cookie": "age_verified=1"}
+
+            await cache.store(
+                url,
+                headers,
+                "<html>body</html>",
+                {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            )
+            entry = await cache.load(url, headers)
+            assert entry is not None
+
+            self.assertEqual(entry.body, "<html>body</html>")
+            self.assertTrue(entry.is_fresh(60))
+            self.assertFalse(entry.is_fresh(60, now=entry.stored_at + 61))
+            self.assertEqual(
+                entry.validators(),
+                {
+                    "If-None-Match": '"abc"',
+                    "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+                },
+            )
+
+            refreshed = await cache.touch(url, headers, entry)
+            self.assertGreaterEqual(refreshed.stored_at, entry.stored_at)
+            self.assertEqual(refreshed.etag, '"abc"')
+
+    async def test_key_varies_on_relevant_headers_only(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HttpResponseCache(Path(tmp))
+            url = "https://example.com/a"
+
+            await cache.store(url, {"Cookie": "a=1"}, "one", {})
+
+            self.assertIsNone(await cache.load(url, {"Cookie": "a=2"}))
+            hit = await cache.load(url, {"Cookie": "a=1", "Referer": "x"})
+            self.assertIsNotNone(hit)
+
+    async def test_no_store_responses_are_not_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HttpResponseCache(Path(tmp))
+            url = "https://example.com/b"
+
+            await cache.store(url, {}, "secret", {"Cache-Control": "no-store"})
+
+            self.assertIsNone(await cache.load(url, {}))
+
+    async def test_manager_evicts_least_recently_used_pages(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = DiskCacheManager(Path(tmp), name="http", max_bytes=5000)
+            cache = HttpResponseCache(Path(tmp), manager=manager)
+            await manager.sweep()
+            for name in ("a", "b", "c"):
+                await cache.store(f"https://example.com/{name}", {}, "x" * 2000, {})
+            self.assertIsNotNone(await cache.load("https://example.com/a", {}))
+
+            self.assertEqual(await manager.sweep(), 1)
+
+            self.assertIsNone(await cache.load("https://example.com/b", {}))
+            self.assertIsNotNone(await cache.load("https://example.com/a", {}))
+            self.assertIsNotNone(await cache.load("https://example.com/c", {}))
+        st = manager.stats()
+        self.assertEqual((st.files, st.hits, st.misses), (2, 3, 1))
+
+
+class RevalidationTests(LocalServerTestCase):
+    ttl = 0.3
+
+    def routes(self) -> list[web.RouteDef]:
+        return [web.get("/video", self._video)]
+
+    def make_http(self) -> HttpService:
+        return HttpService(timeout_sec=10, cache=HttpResponseCache(Path(self.tmp.name)))
+
+    async def _video(self, request: web.Request) -> web.Response:
+        self.requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == _ETAG:
+            return web.Response(status=304)
+        headers = {"ETag": _ETAG, "Last-Modified": _LAST_MODIFIED}
+        return web.Response(text="<html>video</html>", headers=headers)
+
+    async def asyncSetUp(self) -> None:
+        self.requests: list[dict[str, str]] = []
+        self.tmp = tempfile.TemporaryDirectory()
+        await super().asyncSetUp()
+
+    async def asyncTearDown(self) -> None:
+        await super().asyncTearDown()
+        self.tmp.cleanup()
+
+    async def test_stale_entry_is_revalidated_and_refreshed_on_304(self) -> None:
+        url = f"{self.base}/video"
+
+        first = await self.http.get_text(url, cache_ttl=self.ttl)
+        fresh = await self.http.get_text(url, cache_ttl=self.ttl)
+        self.assertEqual(len(self.requests), 1)
+        self.assertNotIn("If-None-Match", self.requests[0])
+
+        await asyncio.sleep(self.ttl + 0.1)
+        revalidated = await self.http.get_text(url, cache_ttl=self.ttl)
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].get("If-None-Match"), _ETAG)
+        self.assertEqual(self.requests[1].get("If-Modified-Since"), _LAST_MODIFIED)
+
+        # The 304 restarted the entry's lifetime, so this one is a fresh hit.
+        again = await self.http.get_text(url, cache_ttl=self.ttl)
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(
+            [first, fresh, revalidated, again], ["<html>video</html>"] * 4
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from local_server import LocalServerTestCase
+
+from dailyporn.services.http import ConnectorPolicy, HttpService
+
+
+class ConnectionPoolTests(LocalServerTestCase):
+    policy = ConnectorPolicy(
+        limit=5, limit_per_host=2, keepalive_timeout_sec=12, dns_cache_ttl_sec=60
+    )
+
+    def routes(self) -> list[web.RouteDef]:
+        return [web.get("/{name}", self._slow)]
+
+    def make_http(self) -> HttpService:
+        return HttpService(timeout_sec=10, policy=self.policy)
+
+    async def _slow(self, request: web.Request) -> web.Response:
+        await self.release.wait()
+        return web.Response(text=request.path)
+
+    async def asyncSetUp(self) -> None:
+        self.release = asyncio.Event()
+        await super().asyncSetUp()
+
+    async def asyncTearDown(self) -> None:
+        self.release.set()
+        await super().asyncTearDown()
+
+    async def test_proxied_and_direct_requests_get_separate_pools(self) -> None:
+        direct = self.http._session_for("")
+        proxied = self.http._session_for("http://proxy.example.com:8080")
+
+        self.assertIsNot(direct, proxied)
+        self.assertIs(self.http._session_for(""), direct)
+        for session in (direct, proxied):
+            connector = session.connector
+            self.assertEqual(connector.limit, self.policy.limit)
+            self.assertEqual(connector.limit_per_host, self.policy.limit_per_host)
+            self.assertEqual(connector._keepalive_timeout, 12)
+            self.assertTrue(connector.use_dns_cache)
+
+    async def test_saturation_is_counted_when_the_pool_is_full(self) -> None:
+        fetches = [
+            asyncio.ensure_future(self.http.get_text(f"{self.base}/page{i}"))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        stats = self.http.pool_stats()["direct"]
+        self.assertEqual(stats["in_flight"], 4)
+        # The third and fourth request found both per-host slots taken.
+        self.assertEqual(stats["saturated"], 2)
+
+        self.release.set()
+        pages = await asyncio.gather(*fetches)
+
+        self.assertEqual(pages, [f"/page{i}" for i in range(4)])
+        stats = self.http.pool_stats()
+        self.assertEqual(list(stats), ["direct"])
+        self.assertEqual(stats["direct"]["in_flight"], 0)
+        self.assertEqual(stats["direct"]["peak_in_flight"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
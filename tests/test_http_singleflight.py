@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from local_server import LocalServerTestCase
+
+
+class CoalescedGetTests(LocalServerTestCase):
+    def routes(self) -> list[web.RouteDef]:
+        return [web.get("/page", self._slow), web.get("/stream", self._stream)]
+
+    async def _stream(self, request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        self.stream_started.set()
+        try:
+            for _ in range(500):
+                await resp.write(b"x" * 1024)
+                await asyncio.sleep(0.01)
+        except (ConnectionError, asyncio.CancelledError):
+            self.stream_outcome.set_result("aborted")
+            raise
+        self.stream_outcome.set_result("done")
+        return resp
+
+    async def _slow(self, request: web.Request) -> web.Response:
+        # The proxied case uses this server as its forward proxy.
+        self.requests.append(request.path)
+        await self.release.wait()
+        return web.Response(text="<p>" + "x" * 50_000 + "</p>")
+
+    async def asyncSetUp(self) -> None:
+        self.release = asyncio.Event()
+        self.requests: list[str] = []
+        self.stream_started = asyncio.Event()
+        self.stream_outcome: asyncio.Future[str] = asyncio.Future()
+        await super().asyncSetUp()
+
+    async def asyncTearDown(self) -> None:
+        self.release.set()
+        await super().asyncTearDown()
+
+    async def _gather(self, *calls) -> list[str]:
+        tasks = [asyncio.ensure_future(c) for c in calls]
+        await asyncio.sleep(0.05)
+        self.release.set()
+        return await asyncio.gather(*tasks)
+
+    async def test_identical_gets_share_one_request(self) -> None:
+        url = f"{self.base}/page"
+        pages = await self._gather(*(self.http.get_text(url) for _ in range(5)))
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(len(set(pages)), 1)
+
+    async def test_gets_that_differ_are_not_merged(self) -> None:
+        def enough(text: str) -> bool:
+            return len(text) > 10
+
+        url = f"{self.base}/page"
+        pages = await self._gather(
+            self.http.get_text(url),
+            self.http.get_text(url, proxy=self.base),
+            self.http.get_text(url, headers={"X-Tag": "a"}),
+            self.http.get_text(url, max_bytes=1000),
+            self.http.get_text(url, until=enough),
+        )
+
+        self.assertEqual(len(self.requests), 5)
+        self.assertEqual(len(pages[3].encode("utf-8")), 1000)
+        self.assertEqual(pages[1], pages[0])
+
+    async def test_request_is_aborted_when_its_last_caller_is_cancelled(self) -> None:
+        url = f"{self.base}/stream"
+        first = asyncio.ensure_future(self.http.get_text(url))
+        second = asyncio.ensure_future(self.http.get_text(url))
+        await self.stream_started.wait()
+
+        # One caller leaving does not cancel the shared request...
+        first.cancel()
+        await asyncio.sleep(0.05)
+        self.assertFalse(self.stream_outcome.done())
+
+        # ...but the last one does, and the connection is dropped.
+        second.cancel()
+        outcome = await asyncio.wait_for(self.stream_outcome, timeout=2)
+
+        self.assertEqual(outcome, "aborted")
+        self.assertEqual(len(self.http._inflight_text), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
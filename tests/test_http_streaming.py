@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+from local_server import LocalServerTestCase
+
+from dailyporn.services.http import (
+    _CHUNK_SIZE,
+    _UNTIL_OVERLAP,
+    HttpBodyTooLargeError,
+    HttpService,
+)
+from dailyporn.services.http_cache import HttpResponseCache
+
+_CHUNK = b"<div>" + b"x" * 8000 + b"</div>\n"
+
+
+class StreamingReadTests(LocalServerTestCase):
+    def routes(self) -> list[web.RouteDef]:
+        return [
+            web.get("/page", self._page),
+            web.get("/image", self._image),
+            web.get("/exact", self._exact),
+        ]
+
+    async def _page(self, request: web.Request) -> web.StreamResponse:
+        self.page_requests += 1
+        resp = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+        await resp.prepare(request)
+        try:
+            for i in range(200):
+                if i == 3:
+                    await resp.write(b'<span class="marker">done</span>')
+                await resp.write(_CHUNK)
+                self.chunks_sent += 1
+                await asyncio.sleep(0.001)
+        except (ConnectionResetError, ConnectionError):
+            pass
+        return resp
+
+    async def _exact(self, request: web.Request) -> web.Response:
+        self.exact_requests += 1
+        return web.Response(text="x" * 20_000)
+
+    async def _image(self, request: web.Request) -> web.Response:
+        return web.Response(body=b"\0" * 50_000, content_type="image/jpeg")
+
+    async def asyncSetUp(self) -> None:
+        self.chunks_sent = 0
+        self.page_requests = 0
+        self.exact_requests = 0
+        await super().asyncSetUp()
+
+    async def test_stops_when_caller_has_enough(self) -> None:
+        text = await self.http.get_text(
+            f"{self.base}/page", until=lambda t: 'class="marker"' in t
+        )
+
+        self.assertIn('class="marker"', text)
+        self.assertLess(len(text), 200 * len(_CHUNK) // 4)
+
+    async def test_text_is_truncated_at_byte_limit(self) -> None:
+        text = await self.http.get_text(f"{self.base}/page", max_bytes=20_000)
+
+        self.assertEqual(len(text.encode("utf-8")), 20_000)
+
+    async def test_body_of_exactly_the_byte_limit_is_complete(self) -> None:
+        url = f"{self.base}/exact"
+        with tempfile.TemporaryDirectory() as tmp:
+            http = HttpService(timeout_sec=10, cache=HttpResponseCache(Path(tmp)))
+            try:
+                text = await http.get_text(url, cache_ttl=60, max_bytes=20_000)
+                cached = await http.get_text(url, cache_ttl=60, max_bytes=20_000)
+            finally:
+                await http.close()
+
+        self.assertEqual(len(text), 20_000)
+        self.assertEqual(cached, text)
+        self.assertEqual(self.exact_requests, 1)
+
+    async def test_until_only_scans_the_newest_text(self) -> None:
+        seen: list[int] = []
+
+        def never(text: str) -> bool:
+            seen.append(len(text))
+            return False
+
+        text = await self.http.get_text(f"{self.base}/page", until=never)
+
+        self.assertEqual(text.count("</div>"), 200)
+        self.assertGreater(len(seen), 1)
+        self.assertLessEqual(max(seen), _CHUNK_SIZE + _UNTIL_OVERLAP)
+
+    async def test_stopped_early_body_is_not_served_as_the_full_page(self) -> None:
+        def marker(text: str) -> bool:
+            return 'class="marker"' in text
+
+        url = f"{self.base}/page"
+        with tempfile.TemporaryDirectory() as tmp:
+            http = HttpService(timeout_sec=10, cache=HttpResponseCache(Path(tmp)))
+            try:
+                partial = await http.get_text(url, cache_ttl=60, until=marker)
+                again = await http.get_text(url, cache_ttl=60, until=marker)
+                self.assertEqual(self.page_requests, 1)
+
+                full = await http.get_text(url, cache_ttl=60)
+                self.assertEqual(self.page_requests, 2)
+                cached = await http.get_text(url, cache_ttl=60)
+            finally:
+                await http.close()
+
+        self.assertEqual(again, partial)
+        self.assertEqual(full.count("</div>"), 200)
+        self.assertEqual(cached, full)
+        self.assertEqual(self.page_requests, 2)
+
+    async def test_oversized_binary_is_rejected(self) -> None:
+        with self.assertRaises(HttpBodyTooLargeError):
+            await self.http.get_bytes(f"{self.base}/image", max_bytes=10_000)
+        data = await self.http.get_bytes(f"{self.base}/image", max_bytes=60_000)
+        self.assertEqual(len(data), 50_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
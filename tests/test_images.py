@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+import unittest
+import unittest.mock
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from dailyporn.config import DailyPornConfig
+from dailyporn.services.images import ImageService, process_cover
+from dailyporn.services.parse_executor import ParseExecutor
+
+
+class _FakeHttp:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def safe_get_bytes(self, url: str, *, proxy: str = "", **kwargs) -> bytes:
+        self.calls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+            return url.encode("utf-8")
+        finally:
+            self.in_flight -= 1
+
+
+def _service(tmp: str, http: _FakeHttp) -> ImageService:
+    cfg = DailyPornConfig.from_mapping(
+        {"mosaic_level": 0, "cover_prefetch_workers": 2}
+    )
+    svc = ImageService(plugin_name="dailyporn_test", cfg=cfg, http=http)
+    svc._cache_dir = Path(tmp)
+    return svc
+
+
+class ImageServicePrefetchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_prefetch_is_bounded_and_shared_with_later_lookups(self) -> None:
+        urls = [f"https://img.example.com/{i}.jpg" for i in range(5)]
+        http = _FakeHttp()
+        with tempfile.TemporaryDirectory() as tmp:
+            svc = _service(tmp, http)
+            svc.prefetch(urls + urls[:2] + [""])
+            for _ in range(100):
+                if http.max_in_flight:
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.01)
+            self.assertEqual(http.max_in_flight, 2)
+
+            # The renderer asks while the prefetch is still running.
+            lookup = asyncio.ensure_future(svc.get_cover_paths(urls))
+            await asyncio.sleep(0.01)
+            http.release.set()
+            paths = await lookup
+
+            self.assertEqual(sorted(http.calls), sorted(urls))
+            self.assertTrue(all(p and Path(p).exists() for p in paths))
+            self.assertEqual(Path(paths[3]).read_bytes(), urls[3].encode("utf-8"))
+
+            # Produced covers are served from disk afterwards.
+            self.assertEqual(await svc.get_cover_paths(urls[:1]), paths[:1])
+            self.assertEqual(len(http.calls), len(urls))
+
+
+def _png(size: tuple[int, int]) -> bytes:
+    img = Image.new("RGB", size)
+    for x in range(size[0]):
+        img.putpixel((x, 0), (x % 256, 0, 0))
+    buf = BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+class ProcessCoverTests(unittest.TestCase):
+    def test_pixelates_into_png(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            raw = Path(tmp) / "raw.png"
+            raw.write_bytes(_png((80, 40)))
+            out = Path(tmp) / "cover.png"
+            process_cover(str(raw), str(out), mosaic_level=50, max_pixels=10_000)
+
+            with Image.open(out) as img:
+                self.assertEqual(img.size, (80, 40))
+                # Neighbouring source pixels collapse into one mosaic block.
+                self.assertEqual(img.getpixel((0, 0)), img.getpixel((1, 0)))
+
+    def test_downscales_to_the_smallest_size_covering_the_target(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for fmt, size, expected in (
+                ("JPEG", (3000, 2000), (932, 622)),
+                ("PNG", (2400, 800), (1572, 524)),
+                ("PNG", (640, 360), None),
+            ):
+                with self.subTest(fmt=fmt, size=size):
+                    raw = Path(tmp) / f"raw.{fmt.lower()}"
+                    out = Path(tmp) / f"cover-{size[0]}.png"
+                    Image.new("RGB", size, (200, 10, 10)).save(raw, fmt)
+                    written = process_cover(
+                        str(raw),
+                        str(out),
+                        mosaic_level=0,
+                        max_pixels=10_000_000,
+                        target_size=(932, 524),
+                    )
+                    # Nothing to do for a small cover without a mosaic.
+                    self.assertEqual(written, expected is not None)
+                    if expected is None:
+                        self.assertFalse(out.exists())
+                        continue
+                    with Image.open(out) as img:
+                        self.assertEqual(img.size, expected)
+            self.assertEqual(list(Path(tmp).glob("*.tmp")), [])
+
+    def test_rejects_oversized_cover_without_touching_pillow_global(self) -> None:
+        before = Image.MAX_IMAGE_PIXELS
+        with tempfile.TemporaryDirectory() as tmp:
+            raw = Path(tmp) / "raw.png"
+            raw.write_bytes(_png((80, 40)))
+            out = Path(tmp) / "cover.png"
+            with self.assertRaises(ValueError):
+                process_cover(str(raw), str(out), mosaic_level=50, max_pixels=100)
+            self.assertFalse(out.exists())
+        self.assertEqual(Image.MAX_IMAGE_PIXELS, before)
+
+
+class ImageServiceExecutorTests(unittest.IsolatedAsyncioTestCase):
+    async def test_cover_is_processed_on_the_image_executor(self) -> None:
+        executor = ParseExecutor(max_workers=1, name="image")
+        seen: list[str] = []
+
+        class _Http:
+            async def safe_get_bytes(self, url: str, **kwargs) -> bytes:
+                return _png((40, 20))
+
+        def _spy(*args, **kwargs):
+            seen.append(threading.current_thread().name)
+            return process_cover(*args, **kwargs)
+
+        cfg = DailyPornConfig.from_mapping({"mosaic_level": 60})
+        svc = ImageService(
+            plugin_name="dailyporn_test", cfg=cfg, http=_Http(), executor=executor
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            svc._cache_dir = Path(tmp)
+            with unittest.mock.patch("dailyporn.services.images.process_cover", _spy):
+                path = await svc.get_cover_path("https://img.example.com/a.jpg")
+            executor.close()
+
+            self.assertTrue(path and Path(path).exists())
+        self.assertTrue(seen[0].startswith("dailyporn-image"))
+        self.assertEqual(executor.stats()["cover"].calls, 1)
+
+
+class CoverStoreTests(unittest.IsolatedAsyncioTestCase):
+    async def test_mosaic_change_reuses_deduplicated_raw_bytes(self) -> None:
+        downloads: list[str] = []
+
+        class _Http:
+            async def safe_get_bytes(self, url: str, **kwargs) -> bytes:
+                downloads.append(url)
+                # Two mirrors serve the identical image.
+                return _png((40, 20))
+
+        def _svc(tmp: str, mosaic_level: int) -> ImageService:
+            cfg = DailyPornConfig.from_mapping({"mosaic_level": mosaic_level})
+            svc = ImageService(plugin_name="dailyporn_test", cfg=cfg, http=_Http())
+            svc._cache_dir = Path(tmp)
+            svc._INDEX_SAVE_DELAY_SEC = 0
+            return svc
+
+        urls = ["https://a.example.com/1.png", "https://b.example.com/1.png"]
+        with tempfile.TemporaryDirectory() as tmp:
+            first = await _svc(tmp, 60).get_cover_paths(urls)
+            await asyncio.sleep(0.05)
+            # A restart with a different mosaic level only redoes the transform.
+            second = await _svc(tmp, 30).get_cover_paths(urls)
+            raw_files = list((Path(tmp) / "raw").iterdir())
+
+            self.assertEqual(first[0], first[1])
+            self.assertNotEqual(first[0], second[0])
+            self.assertTrue(Path(second[0]).exists())
+        self.assertEqual(downloads, urls)
+        self.assertEqual(len(raw_files), 1)
+        self.assertEqual(raw_files[0].suffix, ".png")
+
+    async def test_small_cover_without_mosaic_is_served_from_raw(self) -> None:
+        class _Http:
+            async def safe_get_bytes(self, url: str, **kwargs) -> bytes:
+                return _png((400, 300) if "small" in url else (2000, 1200))
+
+        cfg = DailyPornConfig.from_mapping({"mosaic_level": 0})
+        svc = ImageService(
+            plugin_name="dailyporn_test",
+            cfg=cfg,
+            http=_Http(),
+            cover_size=(932, 524),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            svc._cache_dir = Path(tmp)
+            svc._INDEX_SAVE_DELAY_SEC = 0
+            small, large = await svc.get_cover_paths(
+                [
+                    "https://img.example.com/small.png",
+                    "https://img.example.com/large.png",
+                ]
+            )
+            again = await svc.get_cover_path("https://img.example.com/small.png")
+
+            self.assertEqual(Path(small).parent, Path(tmp) / "raw")
+            self.assertEqual(again, small)
+            with Image.open(large) as img:
+                self.assertEqual(img.size, (932, 560))
+            await asyncio.sleep(0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import pickle
+import threading
+import unittest
+
+from dailyporn.services.parse_executor import ParseExecutor
+from dailyporn.sources.pornhub import PornhubSource
+
+
+def _thread_name(_html: str) -> str:
+    return threading.current_thread().name
+
+
+class ParseExecutorTests(unittest.IsolatedAsyncioTestCase):
+    async def test_bound_source_parses_off_the_event_loop(self) -> None:
+        parser = ParseExecutor(mode="thread", max_workers=1)
+        src = PornhubSource(http=object())
+        try:
+            inline = await src._parse(_thread_name, "<html></html>")
+            src.bind_parser(parser)
+            pooled = await src._parse(_thread_name, "<html></html>")
+        finally:
+            parser.close()
+
+        self.assertEqual(inline, threading.current_thread().name)
+        self.assertTrue(pooled.startswith("dailyporn-parse"))
+        self.assertEqual(parser.stats()["pornhub"].calls, 1)
+
+    async def test_queue_depth_counts_calls_waiting_for_a_worker(self) -> None:
+        gate = threading.Event()
+        parser = ParseExecutor(mode="thread", max_workers=2)
+        try:
+            calls = [
+                asyncio.ensure_future(parser.run(gate.wait, 5, label="x"))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.01)
+            self.assertEqual(parser.queue_depth, 3)
+            gate.set()
+            await asyncio.gather(*calls)
+        finally:
+            parser.close()
+
+        self.assertEqual(parser.queue_depth, 0)
+        self.assertEqual(parser.peak_queue_depth, 3)
+
+    def test_source_pickles_without_http_client(self) -> None:
+        src = PornhubSource(http=threading.Lock())
+        src.bind_parser(ParseExecutor())
+
+        clone = pickle.loads(pickle.dumps(src))
+
+        self.assertFalse(hasattr(clone, "_http"))
+        self.assertIsNone(clone._parser)
+
+
+if __name__ == "__main__":
+    unittest.main()
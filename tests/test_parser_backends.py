@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+import unittest
+from pathlib import Path
+
+from dailyporn.sources.eporner import EPornerSource
+from dailyporn.sources.pornhub import PornhubSource
+from dailyporn.sources.soup import resolve_html_backend
+from dailyporn.sources.tube_common import parse_tube_list
+from dailyporn.sources.xvideos import XVideosSource
+
+_FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def _fixture(name: str) -> str:
+    return (_FIXTURES / name).read_text(encoding="utf-8")
+
+
+@unittest.skipUnless(
+    resolve_html_backend("lxml") == "lxml", "lxml is not installed"
+)
+class ParserBackendParityTests(unittest.TestCase):
+    def test_tube_list_items_match(self) -> None:
+        html = _fixture("tube_list.html")
+
+        def _parse(backend: str):
+            return parse_tube_list(
+                html,
+                base_url="https://www.example.com",
+                source_id="example",
+                section="real",
+                link_patterns=[re.compile(r"^(?:https://www\.example\.com)?/video-")],
+                limit=10,
+                backend=backend,
+            )
+
+        baseline = _parse("html.parser")
+        self.assertEqual(len(baseline), 5)
+        self.assertEqual(_parse("lxml"), baseline)
+
+    def test_detail_stats_match(self) -> None:
+        cases = [
+            (PornhubSource, "pornhub_detail.html"),
+            (XVideosSource, "xvideos_detail.html"),
+            (EPornerSource, "eporner_detail.html"),
+        ]
+        for cls, fixture in cases:
+            with self.subTest(source=cls.source_id):
+                html = _fixture(fixture)
+                src = cls(http=None)
+                baseline = src._parse_detail_stats(html)
+                src.use_html_backend("lxml")
+                self.assertEqual(src._parse_detail_stats(html), baseline)
+                self.assertIsNotNone(baseline[0])
+                self.assertIsNotNone(baseline[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
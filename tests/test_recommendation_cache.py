@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import unittest
 
 from dailyporn.config import DailyPornConfig
 from dailyporn.models import HotItem
 from dailyporn.services.recommendation import RecommendationService
+from dailyporn.services.source_health import SourceHealthTracker
 
 
 class _FakeSource:
-    source_id = "fake3d"
-
-    def __init__(self) -> None:
+    def __init__(self, delay: float = 0.0, source_id: str = "fake3d") -> None:
+        self.source_id = source_id
+        self.may_return_empty = False
         self.calls = 0
+        self.cancelled = False
+        self._delay = delay
 
     async def fetch_hot(self, section: str, *, limit: int, proxy: str) -> list[HotItem]:
         self.calls += 1
+        if self._delay:
+            try:
+                await asyncio.sleep(self._delay)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
         return [
             HotItem(
                 source=self.source_id,
@@ -27,12 +38,20 @@ class _FakeSource:
         ]
 
 
+class _SectionRegistry:
+    def __init__(self, by_section: dict[str, list[_FakeSource]]) -> None:
+        self._by_section = by_section
+
+    def iter_enabled_sources(self, section: str):
+        yield from self._by_section.get(section, [])
+
+
 class _FakeRegistry:
-    def __init__(self, source: _FakeSource) -> None:
-        self._source = source
+    def __init__(self, *sources: _FakeSource) -> None:
+        self._sources = sources
 
     def iter_enabled_sources(self, section: str):
-        yield self._source
+        yield from self._sources
 
 
 class RecommendationCacheTests(unittest.IsolatedAsyncioTestCase):
@@ -62,6 +81,191 @@ class RecommendationCacheTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(first[0].title, "item-1")
         self.assertEqual(second[0].title, "item-2")
 
+    async def test_concurrent_cache_misses_share_one_fetch(self) -> None:
+        source = _FakeSource(delay=0.05)
+        cfg = DailyPornConfig.from_mapping({})
+        svc = RecommendationService(cfg, _FakeRegistry(source))
+
+        results = await asyncio.gather(
+            *(svc.get_section_items("3d", per_source_limit=1) for _ in range(5))
+        )
+
+        self.assertEqual(source.calls, 1)
+        self.assertTrue(all(r[0].title == "item-1" for r in results))
+
+    async def test_stale_entry_is_served_while_refreshing(self) -> None:
+        source = _FakeSource()
+        cfg = DailyPornConfig.from_mapping({"section_cache_soft_ttl_sec": 0})
+        svc = RecommendationService(cfg, _FakeRegistry(source))
+
+        first = await svc.get_section_items("3d", per_source_limit=1)
+        stale = await svc.get_section_items("3d", per_source_limit=1)
+        await asyncio.sleep(0.05)  # let the background refresh finish
+        refreshed = await svc.get_section_items("3d", per_source_limit=1)
+
+        self.assertEqual(first[0].title, "item-1")
+        self.assertEqual(stale[0].title, "item-1")
+        self.assertEqual(refreshed[0].title, "item-2")
+
+    async def test_cache_evicts_least_recently_used_section(self) -> None:
+        source = _FakeSource()
+        cfg = DailyPornConfig.from_mapping({"section_cache_max_entries": 2})
+        svc = RecommendationService(cfg, _FakeRegistry(source))
+
+        await svc.get_section_items("3d")
+        await svc.get_section_items("2.5d")
+        await svc.get_section_items("3d")  # hit, becomes most recent
+        await svc.get_section_items("real")  # evicts 2.5d
+        await svc.get_section_items("3d")
+        self.assertEqual(source.calls, 3)
+
+        await svc.get_section_items("2.5d")
+        self.assertEqual(source.calls, 4)
+
+    async def test_deadline_returns_partial_results_and_refills_cache(self) -> None:
+        fast = _FakeSource(source_id="fast")
+        slow = _FakeSource(delay=0.1, source_id="slow")
+        cfg = dataclasses.replace(
+            DailyPornConfig.from_mapping({}), section_deadline_sec=0.02
+        )
+        svc = RecommendationService(cfg, _FakeRegistry(fast, slow))
+
+        partial = await svc.get_section_items("3d")
+        await asyncio.sleep(0.15)  # let the straggler finish in the background
+        refilled = await svc.get_section_items("3d")
+
+        self.assertEqual([it.source for it in partial], ["fast"])
+        self.assertEqual([it.source for it in refilled], ["fast", "slow"])
+        self.assertEqual(fast.calls, 1)
+
+    async def test_deadline_cancels_stragglers_without_refill(self) -> None:
+        fast = _FakeSource(source_id="fast")
+        slow = _FakeSource(delay=1, source_id="slow")
+        cfg = dataclasses.replace(
+            DailyPornConfig.from_mapping({"section_deadline_refill": False}),
+            section_deadline_sec=0.02,
+        )
+        svc = RecommendationService(cfg, _FakeRegistry(fast, slow))
+
+        items = await svc.get_section_items("3d")
+        await asyncio.sleep(0)
+
+        self.assertEqual([it.source for it in items], ["fast"])
+        self.assertTrue(slow.cancelled)
+
+    async def test_deadline_starts_when_a_source_gets_a_slot(self) -> None:
+        sources = [_FakeSource(delay=0.03, source_id=f"src-{i}") for i in range(4)]
+        cfg = dataclasses.replace(
+            DailyPornConfig.from_mapping(
+                {"source_fetch_concurrency": 1, "section_deadline_refill": False}
+            ),
+            section_deadline_sec=0.05,
+        )
+        health = SourceHealthTracker(failure_threshold=1)
+        svc = RecommendationService(cfg, _FakeRegistry(*sources), health=health)
+
+        # The wave takes longer than the deadline, but each source fits in it.
+        items = await svc.get_section_items("3d")
+
+        self.assertEqual(
+            sorted(it.source for it in items), [s.source_id for s in sources]
+        )
+        self.assertFalse(any(s.cancelled for s in sources))
+        snapshot = health.snapshot()
+        self.assertTrue(all(snapshot[s.source_id].failures == 0 for s in sources))
+
+    async def test_empty_result_counts_as_a_source_failure(self) -> None:
+        ok = _FakeSource(source_id="ok")
+        empty = _FakeSource(source_id="empty")
+        quiet = _FakeSource(source_id="quiet")
+
+        async def nothing(section, *, limit, proxy):
+            return []
+
+        empty.fetch_hot = quiet.fetch_hot = nothing
+        quiet.may_return_empty = True
+        health = SourceHealthTracker(failure_threshold=1)
+        svc = RecommendationService(
+            DailyPornConfig.from_mapping({}),
+            _FakeRegistry(ok, empty, quiet),
+            health=health,
+        )
+
+        await svc.get_section_items("3d")
+
+        snapshot = health.snapshot()
+        self.assertEqual(snapshot["ok"].failures, 0)
+        self.assertEqual(snapshot["empty"].last_error, "returned no items")
+        self.assertEqual(snapshot["quiet"].failures, 0)
+
+    async def test_daily_recommendations_fetch_sections_in_one_wave(self) -> None:
+        by_section = {
+            section: [
+                _FakeSource(delay=0.05, source_id=f"{section}-{i}") for i in range(2)
+            ]
+            for section in ("3d", "2.5d", "real")
+        }
+        cfg = DailyPornConfig.from_mapping({"source_fetch_concurrency": 4})
+        svc = RecommendationService(cfg, _SectionRegistry(by_section))
+        in_flight = 0
+        peak = 0
+        for sources in by_section.values():
+            for src in sources:
+                fetch = src.fetch_hot
+
+                async def tracked(section, *, limit, proxy, _fetch=fetch):
+                    nonlocal in_flight, peak
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                    try:
+                        return await _fetch(section, limit=limit, proxy=proxy)
+                    finally:
+                        in_flight -= 1
+
+                src.fetch_hot = tracked
+
+        recos = await svc.get_daily_recommendations(
+            ["3d", "2.5d", "real"], apply_penalty=False
+        )
+
+        self.assertEqual(set(recos), {"3d", "2.5d", "real"})
+        self.assertEqual(peak, 4)
+        self.assertTrue(all(s.calls == 1 for v in by_section.values() for s in v))
+        # The wave filled the per-section cache.
+        await svc.get_section_items("real")
+        self.assertEqual(by_section["real"][0].calls, 1)
+
+    async def test_daily_recommendations_prefetch_pick_covers(self) -> None:
+        by_section = {
+            section: [_FakeSource(source_id=f"{section}-{i}") for i in range(2)]
+            for section in ("3d", "real")
+        }
+        prefetched: list[str] = []
+        svc = RecommendationService(
+            DailyPornConfig.from_mapping({}),
+            _SectionRegistry(by_section),
+            prefetch_covers=prefetched.extend,
+        )
+        for sources in by_section.values():
+            for src in sources:
+                fetch = src.fetch_hot
+
+                async def with_cover(section, *, limit, proxy, _fetch=fetch):
+                    items = await _fetch(section, limit=limit, proxy=proxy)
+                    return [
+                        dataclasses.replace(it, cover_url=f"{it.url}/{it.source}.jpg")
+                        for it in items
+                    ]
+
+                src.fetch_hot = with_cover
+
+        recos = await svc.get_daily_recommendations(
+            ["3d", "real"], apply_penalty=False
+        )
+
+        # Only the picks are prefetched, not every candidate.
+        self.assertEqual(sorted(prefetched), sorted(r.cover_url for r in recos.values()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from datetime import datetime
+
+from dailyporn.config import DailyPornConfig
+from dailyporn.events import DailyReportPrewarmRequested, DailyReportRequested
+from dailyporn.models import HotItem
+from dailyporn.services.report import ReportService
+
+
+class _FakeContext:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, object]] = []
+
+    async def send_message(self, session: str, chain) -> None:
+        self.sent.append((session, chain))
+
+
+class _FakeSubscriptions:
+    async def list_enabled(self) -> list[str]:
+        return ["group-a", "group-b"]
+
+
+class _FakeRecommendations:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self._fail = fail
+
+    async def get_daily_recommendations(self, sections, **kwargs):
+        self.calls += 1
+        if self._fail:
+            raise RuntimeError("scrape failed")
+        return {
+            "3d": HotItem(
+                source="fake",
+                section="3d",
+                title="pick",
+                url="https://example.com/1",
+                stars=1,
+                views=2,
+            )
+        }
+
+    async def record_daily_recommendations(self, recos, **kwargs) -> None:
+        return None
+
+
+class _FakeRenderer:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def render_daily(self, recos, *, reason: str, now=None) -> str:
+        self.calls += 1
+        return f"https://render.example.com/{self.calls}.png"
+
+
+class _FakeImages:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_cover_path(self, url: str) -> str:
+        self.calls += 1
+        return "/tmp/cover.png"
+
+
+class _FakeBus:
+    def subscribe(self, event_type, handler) -> None:
+        return None
+
+
+def _service(
+    reco: _FakeRecommendations,
+    renderer: _FakeRenderer,
+    *,
+    delivery_mode: str = "html_image",
+    images: _FakeImages | None = None,
+):
+    ctx = _FakeContext()
+    svc = ReportService(
+        context=ctx,
+        cfg=DailyPornConfig.from_mapping({"delivery_mode": delivery_mode}),
+        bus=_FakeBus(),
+        subscriptions=_FakeSubscriptions(),
+        recommendations=reco,
+        images=images,
+        renderer=renderer,
+    )
+    return svc, ctx
+
+
+def _with_cover(reco: _FakeRecommendations) -> _FakeRecommendations:
+    original = reco.get_daily_recommendations
+
+    async def _get(sections, **kwargs):
+        recos = await original(sections, **kwargs)
+        item = recos["3d"]
+        recos["3d"] = HotItem(
+            source=item.source,
+            section=item.section,
+            title=item.title,
+            url=item.url,
+            cover_url="https://example.com/cover.jpg",
+            stars=item.stars,
+            views=item.views,
+        )
+        return recos
+
+    reco.get_daily_recommendations = _get
+    return reco
+
+
+class ReportServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_renders_once_for_all_sessions(self) -> None:
+        renderer = _FakeRenderer()
+        svc, ctx = _service(_FakeRecommendations(), renderer)
+
+        await svc._on_daily_report(DailyReportRequested(reason="manual"))
+
+        self.assertEqual(renderer.calls, 1)
+        self.assertEqual(len(ctx.sent), 2)
+
+    async def test_plain_mode_resolves_covers_once(self) -> None:
+        images = _FakeImages()
+        svc, ctx = _service(
+            _with_cover(_FakeRecommendations()),
+            _FakeRenderer(),
+            delivery_mode="plain",
+            images=images,
+        )
+
+        await svc._on_daily_report(DailyReportRequested(reason="manual"))
+
+        self.assertEqual(images.calls, 1)
+        # header + one item per session
+        self.assertEqual(len(ctx.sent), 4)
+
+    async def test_schedule_sends_prewarmed_artifact(self) -> None:
+        reco = _FakeRecommendations()
+        renderer = _FakeRenderer()
+        svc, ctx = _service(reco, renderer)
+        trigger = datetime.now()
+
+        await svc._on_prewarm(DailyReportPrewarmRequested(scheduled_for=trigger))
+        await svc._on_daily_report(
+            DailyReportRequested(reason="schedule", requested_at=trigger)
+        )
+
+        self.assertEqual(reco.calls, 1)
+        self.assertEqual(renderer.calls, 1)
+        self.assertEqual([s for s, _ in ctx.sent], ["group-a", "group-b"])
+
+    async def test_failed_prewarm_falls_back_to_just_in_time(self) -> None:
+        reco = _FakeRecommendations(fail=True)
+        renderer = _FakeRenderer()
+        svc, ctx = _service(reco, renderer)
+        trigger = datetime.now()
+
+        await svc._on_prewarm(DailyReportPrewarmRequested(scheduled_for=trigger))
+        reco._fail = False
+        await svc._on_daily_report(
+            DailyReportRequested(reason="schedule", requested_at=trigger)
+        )
+
+        self.assertEqual(reco.calls, 2)
+        self.assertEqual(len(ctx.sent), 2)
+
+    async def test_stuck_prewarm_times_out_and_is_cancelled_on_stop(self) -> None:
+        reco = _FakeRecommendations()
+        svc, ctx = _service(reco, _FakeRenderer())
+        svc._PREWARM_WAIT_SEC = 0.05
+        hang = asyncio.Event()
+        original = reco.get_daily_recommendations
+
+        async def _stuck(sections, **kwargs):
+            await hang.wait()
+            return await original(sections, **kwargs)
+
+        reco.get_daily_recommendations = _stuck
+        trigger = datetime.now()
+        prewarm = asyncio.ensure_future(
+            svc._on_prewarm(DailyReportPrewarmRequested(scheduled_for=trigger))
+        )
+        await asyncio.sleep(0)
+        reco.get_daily_recommendations = original
+        await svc._on_daily_report(
+            DailyReportRequested(reason="schedule", requested_at=trigger)
+        )
+        self.assertEqual(len(ctx.sent), 2)
+
+        # A pre-warm for the next trigger is cancelled on shutdown.
+        reco.get_daily_recommendations = _stuck
+        nxt = asyncio.ensure_future(
+            svc._on_prewarm(DailyReportPrewarmRequested(scheduled_for=trigger))
+        )
+        await asyncio.sleep(0)
+        await svc.stop()
+        await asyncio.gather(prewarm, nxt, return_exceptions=True)
+        self.assertTrue(nxt.done())
+        self.assertIsNone(svc._prewarm)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import unittest
+
+from dailyporn.config import DailyPornConfig
+from dailyporn.services.source_health import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    SourceHealthTracker,
+)
+from dailyporn.sources.registry import SourceRegistry
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SourceHealthTrackerTests(unittest.TestCase):
+    def test_opens_after_consecutive_failures_and_probes_once(self) -> None:
+        clock = _Clock()
+        tracker = SourceHealthTracker(failure_threshold=2, cooldown_sec=60, clock=clock)
+
+        tracker.record_failure("a", "timeout", 100)
+        self.assertTrue(tracker.allow("a"))
+        tracker.record_failure("a", "timeout", 300)
+        self.assertEqual(tracker.snapshot()["a"].state, OPEN)
+        self.assertFalse(tracker.allow("a"))
+
+        clock.now += 61
+        self.assertTrue(tracker.allow("a"))  # the half-open probe
+        self.assertEqual(tracker.snapshot()["a"].state, HALF_OPEN)
+        self.assertFalse(tracker.allow("a"))
+
+        tracker.record_success("a", 200)
+        h = tracker.snapshot()["a"]
+        self.assertEqual(h.state, CLOSED)
+        self.assertTrue(tracker.allow("a"))
+        self.assertAlmostEqual(h.success_rate, 1 / 3)
+        self.assertAlmostEqual(h.latency_ewma_ms, 172)  # 100 -> 160 -> 172
+
+    def test_failed_probe_doubles_cooldown(self) -> None:
+        clock = _Clock()
+        tracker = SourceHealthTracker(failure_threshold=3, cooldown_sec=60, clock=clock)
+
+        tracker.record_failure("a", "HTTP 403", blocked=True)
+        clock.now += 61
+        self.assertTrue(tracker.allow("a"))
+        tracker.record_failure("a", "HTTP 403", blocked=True)
+
+        self.assertEqual(tracker.snapshot()["a"].cooldown_sec, 120)
+        clock.now += 61
+        self.assertFalse(tracker.allow("a"))
+
+    def test_registry_skips_open_sources(self) -> None:
+        cfg = DailyPornConfig.from_mapping(
+            {"sources": {"enable_pornhub": True, "enable_xvideos": True}}
+        )
+        tracker = SourceHealthTracker(failure_threshold=1)
+        registry = SourceRegistry(None, cfg, health=tracker)
+
+        tracker.record_failure("pornhub", "boom")
+
+        ids = [s.source_id for s in registry.iter_enabled_sources("real")]
+        self.assertEqual(ids, ["xvideos"])
+
+
+if __name__ == "__main__":
+    unittest.main()
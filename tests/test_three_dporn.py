@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import unittest
 from unittest.mock import patch
 
+from aiohttp import web
+from local_server import LocalServerTestCase
+
 from dailyporn.sources.three_dporn import ThreeDPornSource
 
+_VIDEO_PAGE = '<script type="application/ld+json">{"@type":"VideoObject"}</script>'
+
 
 class _FakeHttp:
     def __init__(self, list_html: str, detail_html_by_url: dict[str, str]) -> None:
         self._list_html = list_html
         self._detail_html_by_url = detail_html_by_url
+        self.calls: list[str] = []
 
-    async def get_text(self, url: str, *, proxy: str = "", headers=None) -> str:
+    async def get_text(
+        self, url: str, *, proxy: str = "", headers=None, cache_ttl: float = 0
+    ) -> str:
+        self.calls.append(url)
         if url in self._detail_html_by_url:
             return self._detail_html_by_url[url]
         return self._list_html
@@ -53,6 +63,80 @@ class ThreeDPornSourceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(items[0].url, "https://3d-porn.co/third/")
         self.assertEqual(items[0].title, "Third")
 
+    async def test_fetch_hot_reuses_validated_detail_page_for_enrichment(self) -> None:
+        list_html = """
+        <html><body>
+          <a class="thumb" href="/game/"><img src="/game.jpg" alt="Game" /></a>
+          <a class="infos">Game</a>
+          <a class="thumb" href="/video/"><img src="/video.jpg" alt="Video" /></a>
+          <a class="infos">Video</a>
+        </body></html>
+        """
+        detail_html = {
+            "https://3d-porn.co/game/": "<html>not a video</html>",
+            "https://3d-porn.co/video/": (
+                '<script type="application/ld+json">{"@type":"VideoObject"}</script>'
+                '<div id="video-views"><span class="views-number">4,321</span></div>'
+                '<span class="likes_count">12</span>'
+            ),
+        }
+        http = _FakeHttp(list_html, detail_html)
+        source = ThreeDPornSource(http)
+
+        with patch("dailyporn.sources.three_dporn.random.shuffle"):
+            items = await source.fetch_hot("3d", limit=1, proxy="")
+
+        self.assertEqual([it.url for it in items], ["https://3d-porn.co/video/"])
+        self.assertEqual(items[0].views, 4321)
+        self.assertEqual(items[0].stars, 12)
+        self.assertEqual(http.calls.count("https://3d-porn.co/video/"), 1)
+
+
+class ValidateCandidatesTests(LocalServerTestCase):
+    def routes(self) -> list[web.RouteDef]:
+        return [web.get("/video/", self._video), web.get("/slow/{n}/", self._slow)]
+
+    async def _video(self, request: web.Request) -> web.Response:
+        # Answer once every slower candidate is being downloaded.
+        while self.slow_started < 3:
+            await asyncio.sleep(0.01)
+        return web.Response(text=_VIDEO_PAGE, content_type="text/html")
+
+    async def _slow(self, request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        self.slow_started += 1
+        try:
+            for _ in range(500):
+                await resp.write(b"<p>")
+                await asyncio.sleep(0.01)
+        except (ConnectionError, asyncio.CancelledError):
+            self.slow_aborted += 1
+            raise
+        return resp
+
+    async def asyncSetUp(self) -> None:
+        self.slow_started = 0
+        self.slow_aborted = 0
+        await super().asyncSetUp()
+
+    async def test_early_exit_aborts_outstanding_detail_requests(self) -> None:
+        source = ThreeDPornSource(self.http)
+        candidates = [{"url": f"{self.base}/video/"}] + [
+            {"url": f"{self.base}/slow/{i}/"} for i in range(3)
+        ]
+
+        picked = await asyncio.wait_for(
+            source._validate_candidates(candidates, limit=1, proxy=""), timeout=2
+        )
+        for _ in range(200):
+            if self.slow_aborted == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual([c["url"] for c, _ in picked], [f"{self.base}/video/"])
+        self.assertEqual(self.slow_aborted, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
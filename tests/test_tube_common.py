@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from dailyporn.sources.soup import HTML_BACKENDS, make_soup, resolve_html_backend
+from dailyporn.sources.tube_common import TextLengthIndex, pick_container
+
+_FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def _naive_container(a):
+    best = None
+    best_len = -1
+    cur = a
+    for _ in range(6):
+        cur = cur.parent
+        if cur is None or cur.name in {"html", "body"}:
+            break
+        if cur.name not in {"article", "div", "li", "section"}:
+            continue
+        n = len(cur.get_text(" ", strip=True))
+        if n > best_len:
+            best, best_len = cur, n
+    return best or a.parent
+
+
+class TextLengthIndexTests(unittest.TestCase):
+    def test_lengths_match_get_text(self) -> None:
+        html = (_FIXTURES / "tube_list.html").read_text(encoding="utf-8")
+        html += "<div> a <!-- hidden --> <script>var x = 1;</script> b </div>"
+        backends = {resolve_html_backend(b) for b in HTML_BACKENDS}
+        for backend in sorted(backends):
+            with self.subTest(backend=backend):
+                soup = make_soup(html, backend)
+                lengths = TextLengthIndex()
+                for tag in soup.find_all(True):
+                    self.assertEqual(
+                        lengths.length(tag),
+                        len(tag.get_text(" ", strip=True)),
+                        tag.name,
+                    )
+
+    def test_pick_container_matches_naive_climb(self) -> None:
+        html = (_FIXTURES / "tube_list.html").read_text(encoding="utf-8")
+        soup = make_soup(html, "html.parser")
+        lengths = TextLengthIndex()
+        for a in soup.find_all("a", href=True):
+            with self.subTest(href=a["href"]):
+                self.assertIs(pick_container(a, lengths), _naive_container(a))
+
+
+if __name__ == "__main__":
+    unittest.main()